@@ -1,20 +1,18 @@
 import argparse
+import contextlib
+import functools
+import hashlib
+import logging
 import os
+import pickle
+import re
 import sys
-import flowkit as fk
+import tempfile
+from typing import NamedTuple
 import pandas as pd
 import numpy as np
-from scipy.stats import gaussian_kde
-from bokeh.plotting import figure, save, output_file
-from bokeh.layouts import column, row, gridplot
-from bokeh.models import ColumnDataSource, HoverTool, Div
-from bokeh.io import curdoc
-try:
-    from matplotlib.path import Path as MPLPath
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MPLPath = None
-    MATPLOTLIB_AVAILABLE = False
+# flowkit, bokeh and matplotlib are imported where they are used, so that
+# `--help`, argument errors and inspect mode do not pay for loading them.
 
 """
 FlowJo Analysis Tool - Interactive Plotting Mode
@@ -109,6 +107,328 @@ Notes:
 - Linear scale histograms use dynamic x-axis based on data with outlier filtering
 """
 
+# Diagnostic output (the "DEBUG:" lines) goes through this logger; enable it with --verbose
+logger = logging.getLogger(__name__)
+
+# Well IDs: letter A-H (case insensitive) followed by optional separator and 1-2 digits.
+# This matches: A1, A01, A-01, A 1, etc. Underscores are not separators (\W excludes them),
+# so 'Plate_001' is not read as well E00.
+_WELL_RE = re.compile(r'([A-H])\W*(\d{1,2})', re.IGNORECASE)
+_NORMALIZE_RE = re.compile(r'[^a-zA-Z0-9]')
+# Quadrant region gates are named "Q1: ...", "Q2: ..." etc.; group 1 is the quadrant number
+_Q_RE = re.compile(r'^Q(\d+):')
+
+# Accepted answers to the interactive yes/no and "which gates" prompts (already lowercased)
+_YES = frozenset({'yes', 'y'})
+_NO = frozenset({'no', 'n'})
+_ALL_GATES = _YES | {'all'}
+_NO_GATES = _NO | {'none', ''}
+
+# Key under which root-level gates (and the "Ungated" option) are grouped
+_ROOT_PATH = ('root',)
+
+# (fill, line) colors for gate overlays, cycled by gate position; the legend uses the same order
+_GATE_COLORS = (
+    ("#6B8E23", "#556B2F"),  # Olive green
+    ("#4682B4", "#36648B"),  # Steel blue
+    ("#CD853F", "#8B5A2B"),  # Peru/tan
+    ("#9370DB", "#7B68EE"),  # Medium purple
+    ("#DC143C", "#B22222"),  # Crimson
+    ("#20B2AA", "#008B8B"),  # Light sea green
+    ("#FF8C00", "#CD6600"),  # Dark orange
+    ("#8B4789", "#68387E"),  # Dark orchid
+)
+
+
+def _format_gate_path(gate_path):
+    """Format a gate path tuple for display, e.g. 'root → Cells → Singlets'."""
+    return " → ".join(gate_path) if gate_path else "root"
+
+
+def _parse_well_string(s):
+    """Extract a well code from a string like 'A01', 'A1', 'A_01', etc.
+    Handles both 'A1' and 'A01' formats - they are treated as the same.
+
+    Returns:
+        int: (row_index << 8) | col, where row_index is 0-7 for A-H, or -1 if
+            no well ID is found. Use _decode_well() to get ('A', 1) back.
+    """
+    # _WELL_RE starts and ends on a letter/digit, so surrounding whitespace never affects the match
+    return _well_code(_WELL_RE.search(str(s)))
+
+
+def _well_code(match):
+    """Encode a _WELL_RE match as (row_index << 8) | col, or -1 for no match / column 0."""
+    if match:
+        col = int(match.group(2))  # Convert to int (A1 and A01 both become 1)
+        if col:
+            return ((ord(match.group(1)) | 0x20) - ord('a')) << 8 | col
+    return -1
+
+
+def _decode_well(code):
+    """Unpack a well code from _parse_well_string() into (row, col), e.g. ('A', 1)."""
+    return chr((code >> 8) + ord('A')), code & 0xFF
+
+
+def _normalize_key(s):
+    """Normalize string for fuzzy matching: remove all non-alphanumeric, lowercase"""
+    return _NORMALIZE_RE.sub('', s).lower()
+
+
+def _matches_wellid(key):
+    """Check if keyword matches 'wellid' with fuzzy matching"""
+    normalized = _normalize_key(key)
+    # Check for exact match or contains "well" and "id"
+    return normalized == "wellid" or (normalized.startswith("well") and "id" in normalized)
+
+
+class Divider(NamedTuple):
+    """A quadrant gate divider line, in raw data space."""
+    dimension: str
+    value: float
+    orientation: str  # 'vertical' (divides the x axis) or 'horizontal' (divides the y axis)
+
+
+# Attribute names FlowKit (and older FlowKit versions) use on quadrant dividers
+_DIM_ATTRS = ('dimension_ref', 'dimension', 'dim_ref', 'dim')
+_VAL_ATTRS = ('value', 'position', 'divider_value', 'threshold')
+_MISSING = object()
+# Divider type -> (dimension attribute, value attribute) resolved on first use
+_DIVIDER_ATTRS_BY_TYPE = {}
+
+
+def _divider_dim_id(attr_value):
+    """Return the channel name for a divider dimension (a string or a Dimension object)."""
+    if isinstance(attr_value, str):
+        return attr_value
+    if hasattr(attr_value, 'id'):
+        return attr_value.id
+    return str(attr_value)
+
+
+def _resolve_divider(divider):
+    """
+    Return (dimension, value) for a quadrant divider.
+
+    The attribute names are probed once per divider type and remembered, so
+    subsequent dividers of the same type cost two getattr calls.
+    """
+    dim_attr, val_attr = _DIVIDER_ATTRS_BY_TYPE.get(type(divider), (None, None))
+    if dim_attr is not None:
+        dim_value = getattr(divider, dim_attr, _MISSING)
+        divider_value = getattr(divider, val_attr, _MISSING) if val_attr else _MISSING
+        if dim_value is not _MISSING and divider_value is not _MISSING and divider_value is not None:
+            divider_dim = _divider_dim_id(dim_value)
+            if divider_dim:
+                return divider_dim, divider_value
+
+    divider_dim = None
+    dim_attr = None
+    for attr_name in _DIM_ATTRS:
+        attr_value = getattr(divider, attr_name, _MISSING)
+        if attr_value is _MISSING:
+            continue
+        divider_dim = _divider_dim_id(attr_value)
+        if divider_dim:
+            dim_attr = attr_name
+            break
+
+    divider_value = None
+    val_attr = None
+    for attr_name in _VAL_ATTRS:
+        attr_value = getattr(divider, attr_name, _MISSING)
+        if attr_value is not _MISSING and attr_value is not None:
+            divider_value = attr_value
+            val_attr = attr_name
+            break
+
+    if dim_attr is not None and val_attr is not None:
+        _DIVIDER_ATTRS_BY_TYPE[type(divider)] = (dim_attr, val_attr)
+    return divider_dim, divider_value
+
+
+# gate type -> 'quadrant', 'polygon', 'rectangle' or None, see _gate_kind
+_GATE_KIND_BY_TYPE = {}
+
+
+def _gate_kind(gate):
+    """
+    Classify a gate as 'quadrant', 'polygon' or 'rectangle' (None for anything else).
+
+    The attribute probes run once per gate class and are then looked up by type,
+    instead of a chain of hasattr calls for every gate.
+    """
+    gate_type = type(gate)
+    kind = _GATE_KIND_BY_TYPE.get(gate_type, _MISSING)
+    if kind is _MISSING:
+        if hasattr(gate, 'dividers'):
+            kind = 'quadrant'
+        elif hasattr(gate, 'vertices'):
+            kind = 'polygon'
+        elif hasattr(gate, 'min') and hasattr(gate, 'max'):
+            kind = 'rectangle'
+        else:
+            kind = None
+        _GATE_KIND_BY_TYPE[gate_type] = kind
+    return kind
+
+
+def _rect_bound_pair(bound, dims):
+    """
+    Read a rectangle gate's min or max as an (x, y) pair for the 2D gate dimensions.
+
+    flowkit gives bounds either as a dict keyed by channel or as a sequence in
+    dimension order (a single value is used for both axes). Returns (None, None)
+    for anything else.
+    """
+    if isinstance(bound, dict):
+        return bound.get(dims[0]), bound.get(dims[1])
+    if isinstance(bound, (list, tuple, np.ndarray)) and len(bound) > 0:
+        return bound[0], (bound[1] if len(bound) > 1 else bound[0])
+    return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def _flowkit_quadrant_types():
+    """flowkit's quadrant gate classes for isinstance checks, or () if they are unavailable."""
+    try:
+        import flowkit.gates as fk_gates
+        return (fk_gates.QuadrantGate, fk_gates.Quadrant)
+    except (ImportError, AttributeError):
+        return ()
+
+
+# FlowJo stores gate coordinates in display space: 0-1 over a log axis spanning 10^0 to
+# 10^5, so a display value v maps to raw 10 ** (0 + v * (5 - 0)) == 1e5 ** v
+_DISPLAY_MIN_LOG = 0  # log10(1)
+_DISPLAY_MAX_LOG = 5  # log10(100000)
+_DISPLAY_TO_RAW_BASE = 10.0 ** (_DISPLAY_MAX_LOG - _DISPLAY_MIN_LOG)
+
+
+def _disp_to_raw(v):
+    """Map display-space (0-1) coordinates to raw values; works on scalars and arrays."""
+    return _DISPLAY_TO_RAW_BASE ** v
+
+
+def _closed_raw_polygons(vertex_arrays):
+    """
+    Map display-space polygons to raw values and close each loop, all in one buffer.
+
+    Every polygon is copied once into a shared (sum(n + 1), 2) array with its first
+    vertex repeated as the closing row, and the whole buffer is exponentiated in
+    place. Returns one (n + 1, 2) view per input polygon, or an empty (0, 2) view
+    for a polygon without vertices (it has no first vertex to close the loop with).
+    """
+    # Closed length of each polygon: its vertices plus the closing row, if it has any
+    sizes = [len(verts) + 1 if len(verts) else 0 for verts in vertex_arrays]
+    starts = np.cumsum([0] + sizes)
+    buf = np.empty((starts[-1], 2))
+    for verts, start, size in zip(vertex_arrays, starts, sizes):
+        if size:
+            buf[start:start + size - 1] = verts
+            buf[start + size - 1] = verts[0]
+    np.power(_DISPLAY_TO_RAW_BASE, buf, out=buf)
+    return [buf[start:start + size] for start, size in zip(starts, sizes)]
+
+
+def _closed_gate_outline(gate):
+    """
+    Return a polygon/rectangle gate's (xs, ys) as float arrays with the loop closed.
+
+    The extractors already store closed arrays; anything else (lists, open loops)
+    is converted once and the result cached on the gate dict under '_closed', so a
+    gate overlaid on many plots is not re-closed each time. Returns None when the
+    gate has fewer than 3 vertices or mismatched coordinates.
+    """
+    closed = gate.get('_closed')
+    if closed is None:
+        xs = gate.get('xs', [])
+        ys = gate.get('ys', [])
+        if len(xs) < 3 or len(xs) != len(ys):
+            return None
+        closed = np.array([xs, ys], dtype=np.float64)
+        if (closed[:, 0] != closed[:, -1]).any():
+            closed = np.hstack([closed, closed[:, :1]])
+        gate['_closed'] = closed
+    return closed[0], closed[1]
+
+
+# Shared KDE bin edges for log-scale histograms (log10 space). The plotted range is fixed
+# (10^-1 to 10^5), so every sample is binned against the same edges; the extra margin
+# keeps the kernel tails of high-end events inside the bins.
+_LOG_KDE_EDGES = np.linspace(-3, 8, 2049)
+
+
+@functools.lru_cache(maxsize=None)
+def _match_channel(columns, keyword):
+    """
+    Return the first of ``columns`` (a tuple of channel names) containing ``keyword``, or None.
+
+    Every sample of a plot shares one channel set, so each keyword is matched against
+    the columns once instead of being rescanned for every plot.
+    """
+    return next((c for c in columns if keyword in c), None)
+
+
+def _quartiles(values):
+    """
+    Return (q1, q3) of a non-empty 1D array, interpolated linearly like Series.quantile.
+
+    Only the order statistics around the two quartiles are needed, so one O(N)
+    np.partition replaces the sort behind each quantile call.
+    """
+    pos = (values.size - 1) * np.array([0.25, 0.75])
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, values.size - 1)
+    part = np.partition(values, np.union1d(lo, hi))
+    q1, q3 = part[lo] + (pos - lo) * (part[hi] - part[lo])
+    return q1, q3
+
+
+def _sample_rows(rows, max_points):
+    """
+    Return at most ``max_points`` of the row indices ``rows``, drawn without replacement.
+
+    The draw is seeded, so a sample is thinned the same way on every run. Generator.choice
+    only tracks the indices it draws when max_points is small next to len(rows), rather
+    than permuting all rows as RandomState-based sampling (DataFrame.sample) does.
+    """
+    if len(rows) <= max_points:
+        return rows
+    return rows[np.random.default_rng(42).choice(len(rows), size=max_points, replace=False)]
+
+
+def _prompt_channel(prompt, available_channels, available_lower):
+    """
+    Ask for a channel by number or by name until one matches.
+
+    Names match case-insensitively when either the typed text or the channel name
+    contains the other; the first such channel wins. ``available_lower`` holds the
+    lowercased channel names in the same order. Returns None on Ctrl-C.
+    """
+    while True:
+        try:
+            choice = input(f"{prompt} (1-{len(available_channels)}) or type name: ").strip()
+        except KeyboardInterrupt:
+            return None
+        if choice.isdecimal():
+            idx = int(choice) - 1
+            if 0 <= idx < len(available_channels):
+                return available_channels[idx]
+            print(f"Please enter a number between 1 and {len(available_channels)}")
+            continue
+        # Try as channel name (case-insensitive partial match)
+        query = choice.lower()
+        selected_channel = next(
+            (channel for channel, channel_lower in zip(available_channels, available_lower)
+             if query in channel_lower or channel_lower in query),
+            None)
+        if selected_channel:
+            return selected_channel
+        print(f"Channel '{choice}' not found. Please try again.")
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Analyze FlowJo Workspace and generate interactive HTML plots or inspect gate hierarchy.")
     parser.add_argument("--wsp", required=True, help="Path to the FlowJo .wsp file")
@@ -117,8 +437,36 @@ def parse_args():
     parser.add_argument("--interactive", action="store_true", help="Run interactive plotting mode")
     parser.add_argument("--inspect", action="store_true", help="Run inspect mode to view gate hierarchy")
     parser.add_argument("--sample", help="Optional sample ID to inspect (inspect mode only)")
+    parser.add_argument("--verbose", action="store_true", help="Print detailed debug output while extracting gates and building plots")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse the workspace instead of using the cached copy")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes used to load sample events (default: 1)")
     return parser.parse_args()
 
+
+# FlowAnalyzer owned by each worker process of FlowAnalyzer._prefetch_plot_events
+_worker_analyzer = None
+_worker_analyzed_samples = set()
+
+
+def _init_event_worker(wsp_path, fcs_dir, use_cache):
+    """Open the workspace once per worker process (quietly; the parent reports progress)."""
+    global _worker_analyzer
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        _worker_analyzer = FlowAnalyzer(wsp_path, fcs_dir, use_cache=use_cache)
+
+
+def _load_events_in_worker(sample_id, gate_name, gate_path, use_gate_directly, channels):
+    """Analyze one sample in a worker process and return its plot events (or the error)."""
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if sample_id not in _worker_analyzed_samples:
+                _worker_analyzer.workspace.analyze_samples(sample_id=sample_id, use_mp=False)
+                _worker_analyzed_samples.add(sample_id)
+            return _worker_analyzer._load_plot_events(sample_id, gate_name, gate_path, use_gate_directly, channels)
+    except Exception as e:
+        return e
+
+
 class FlowAnalyzer:
     """
     Main class for analyzing FlowJo workspaces and generating interactive HTML plots.
@@ -147,29 +495,339 @@ class FlowAnalyzer:
         >>> selections = analyzer.interactive_plot_prompt()
         >>> analyzer.generate_interactive_plots(selections, "plots.html")
     """
-    def __init__(self, wsp_path, fcs_dir=None):
+    __slots__ = (
+        'wsp_path', 'fcs_dir', 'workspace', 'sample_groups', '_group_samples_cache',
+        '_gate_ids_cache', '_gate_cache', '_gates_by_path_cache', '_gates_by_path_index', '_gate_summary_cache',
+        '_gates_by_prefix_index',
+        '_keyword_index', '_keywords_cache', '_filename_well_prefix', '_all_keywords_df', '_event_columns',
+        '_wsp_populations', '_gates_by_axes_index', '_channel_index_cache',
+        '_sample_cache', '_well_id_cache', '_gate_polygons_cache', '_selected_gate_cache',
+        '_histogram_kde_cache', '_cached_sizes', '_use_cache',
+    )
+
+    def __init__(self, wsp_path, fcs_dir=None, use_cache=True):
         """
         Initialize the FlowAnalyzer.
 
         Args:
             wsp_path (str): Path to the FlowJo workspace file.
             fcs_dir (str, optional): Directory containing FCS files. Defaults to the workspace directory.
+            use_cache (bool, optional): Reuse a previously parsed copy of the workspace, with
+                its gate ids and sample keywords, from ~/.cache/flowvizer when the .wsp file
+                has not changed. Defaults to True.
         """
         self.wsp_path = wsp_path
         self.fcs_dir = fcs_dir if fcs_dir else os.path.dirname(wsp_path)
+        # Passed on to the worker processes of _start_event_workers
+        self._use_cache = use_cache
+        
+        import flowkit as fk
         
         print(f"Loading workspace: {self.wsp_path}")
-        try:
-            self.workspace = fk.Workspace(self.wsp_path, fcs_samples=self.fcs_dir)
-        except Exception as e:
-            print(f"Error loading workspace: {e}")
-            # Fallback: try loading without specifying fcs_samples immediately if that fails, 
-            # though usually it's better to provide it.
-            # If fcs_dir is wrong, FlowKit might complain.
-            raise e
+        self.workspace = self._load_cached_workspace() if use_cache else None
+        cached = self.workspace is not None
+        if self.workspace is None:
+            try:
+                self.workspace = fk.Workspace(self.wsp_path, fcs_samples=self.fcs_dir)
+            except Exception as e:
+                print(f"Error loading workspace: {e}")
+                # Fallback: try loading without specifying fcs_samples immediately if that fails, 
+                # though usually it's better to provide it.
+                # If fcs_dir is wrong, FlowKit might complain.
+                raise e
 
         self.sample_groups = self.workspace.get_sample_groups()
         print(f"Found sample groups: {self.sample_groups}")
+        # group name -> loaded sample IDs, see _group_sample_ids
+        self._group_samples_cache = {}
+
+        # Gate hierarchy caches. Samples in a plate almost always share one gating tree,
+        # so gates_by_path is keyed by the tree structure rather than by sample.
+        self._gate_ids_cache = {}
+        # (sample_id, gate_name, gate_path) -> gate object, see _get_gate
+        self._gate_cache = {}
+        self._gates_by_path_cache = {}
+        # sample_id -> {gate_path: [gate names]} and (sample_id, name, path) -> gate summary
+        self._gates_by_path_index = {}
+        self._gate_summary_cache = {}
+        # sample_id -> {path prefix: [(gate name, gate path)] for every gate at or below it}
+        self._gates_by_prefix_index = {}
+        # sample_id -> {frozenset of the two gate channels: [(gate name, gate path)]}
+        self._gates_by_axes_index = {}
+        # sample_id -> {normalized keyword name: (keyword name, value)}
+        self._keyword_index = {}
+        # sample_id -> keyword dict from workspace.get_keywords, see _sample_keywords
+        self._keywords_cache = {}
+        # Filename text preceding the well ID in the last parsed filename (see _parse_filename_well)
+        self._filename_well_prefix = None
+        # Keywords of every sample as one DataFrame (see _keywords_frame), built on first use
+        self._all_keywords_df = None
+        # sample_id -> {channel label: raw events as float32}, see load_events_columnar;
+        # cleared at the end of each generate_interactive_plots call
+        self._event_columns = {}
+        # sample_id -> {channel label: column index}, see _channel_index
+        self._channel_index_cache = {}
+        # sample_id -> flowkit Sample, see _get_sample
+        self._sample_cache = {}
+        # (sample IDs, source, keyword name) -> parse_well_ids_batch result
+        self._well_id_cache = {}
+        # Gate overlays: (sample_id, x, y) -> _extract_gate_polygons result and
+        # (sample_id, gate name, gate path, x, y) -> _extract_selected_gate result
+        self._gate_polygons_cache = {}
+        self._selected_gate_cache = {}
+        # (sample_id, gate name, gate path, use gate directly, channel, scale) -> (x grid, density),
+        # see _plot_histogram
+        self._histogram_kde_cache = {}
+        # Population elements of the .wsp XML by name, see _workspace_populations
+        self._wsp_populations = None
+        # (gate id count, keyword count) last written to the lookup cache, or None when
+        # caching is off; see update_workspace_cache
+        self._cached_sizes = None
+
+        if use_cache:
+            if cached:
+                lookups = self._load_cached_lookups()
+                if lookups:
+                    self._gate_ids_cache.update(lookups.get('gate_ids', {}))
+                    self._keywords_cache.update(lookups.get('keywords', {}))
+            else:
+                self._save_cached_workspace()
+            self._cached_sizes = (len(self._gate_ids_cache), len(self._keywords_cache))
+
+    def _workspace_cache_path(self, suffix=".pkl"):
+        """
+        Return the pickle cache path for this workspace.
+
+        The key covers the workspace path, its modification time and the FCS directory,
+        so editing the .wsp file (or pointing at different FCS files) invalidates the cache.
+        The parsed workspace is stored under ".pkl" and the gate id/keyword lookups in a
+        small ".lookups.pkl" sidecar with the same key.
+        """
+        mtime = os.path.getmtime(self.wsp_path)
+        key = hashlib.sha1(f"{os.path.abspath(self.wsp_path)}:{mtime}:{os.path.abspath(self.fcs_dir)}".encode()).hexdigest()
+        return os.path.join(os.path.expanduser("~"), ".cache", "flowvizer", f"{key}{suffix}")
+
+    def _load_cached_workspace(self):
+        """Return the cached workspace, or None if there is no usable cache entry."""
+        try:
+            cache_path = self._workspace_cache_path()
+            if not os.path.exists(cache_path):
+                return None
+            with open(cache_path, "rb") as f:
+                workspace = pickle.load(f)
+            if isinstance(workspace, dict):
+                # Entry from a version that stored the lookups alongside the workspace
+                workspace = workspace['workspace']
+            print("  ✓ Using cached workspace (pass --no-cache to re-parse)")
+            return workspace
+        except Exception as e:
+            print(f"  ⚠️  Ignoring unreadable workspace cache: {e}")
+            return None
+
+    def _load_cached_lookups(self):
+        """Return the cached {'gate_ids', 'keywords'} sidecar, or None if there is no usable one."""
+        try:
+            cache_path = self._workspace_cache_path(".lookups.pkl")
+            if not os.path.exists(cache_path):
+                return None
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.debug("    DEBUG: Ignoring unreadable lookup cache: %s", e, exc_info=True)
+            return None
+
+    def _write_cache_file(self, suffix, obj):
+        """Pickle ``obj`` to the cache file with ``suffix``, writing atomically via a temp file."""
+        tmp_path = None
+        try:
+            cache_path = self._workspace_cache_path(suffix)
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception as e:
+            print(f"  ⚠️  Could not cache workspace: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def _save_cached_workspace(self):
+        """Pickle the freshly parsed workspace to the cache; it is written once per .wsp version."""
+        self._write_cache_file(".pkl", self.workspace)
+
+    def update_workspace_cache(self):
+        """
+        Save the gate ids and keywords fetched so far to the lookup sidecar, if any are new.
+
+        Call once the prompt has run, so later sessions start with _cached_gate_ids and
+        _sample_keywords already filled in for them. Only the small sidecar is rewritten,
+        never the workspace pickle. Does nothing when caching is off.
+        """
+        if self._cached_sizes is None:
+            return
+        lookups = {'gate_ids': dict(self._gate_ids_cache), 'keywords': dict(self._keywords_cache)}
+        sizes = (len(lookups['gate_ids']), len(lookups['keywords']))
+        if sizes != self._cached_sizes and self._write_cache_file(".lookups.pkl", lookups):
+            self._cached_sizes = sizes
+
+    def _cached_gate_ids(self, sample_id):
+        """Return workspace.get_gate_ids(sample_id), fetching it only once per sample."""
+        gate_ids = self._gate_ids_cache.get(sample_id)
+        if gate_ids is None:
+            gate_ids = tuple(self.workspace.get_gate_ids(sample_id))
+            self._gate_ids_cache[sample_id] = gate_ids
+        return gate_ids
+
+    def _get_gate(self, sample_id, gate_name, gate_path=None):
+        """
+        Return workspace.get_gate(sample_id, gate_name, gate_path=gate_path), fetching it only once.
+
+        Gate extraction looks up the same gates repeatedly (siblings, parents, the Q1-Q4
+        regions) for every plot; the gates of a loaded workspace never change, so the
+        objects are kept for the lifetime of the analyzer.
+        """
+        key = (sample_id, gate_name, gate_path)
+        gate = self._gate_cache.get(key)
+        if gate is None:
+            gate = self.workspace.get_gate(sample_id, gate_name, gate_path=gate_path)
+            self._gate_cache[key] = gate
+        return gate
+
+    def _workspace_populations(self):
+        """Return the .wsp file's Population elements indexed by name, parsing the XML only once."""
+        if self._wsp_populations is None:
+            from quadrant_xml_parser import index_populations
+            self._wsp_populations = index_populations(self.wsp_path)
+        return self._wsp_populations
+
+    def _group_sample_ids(self, group_name):
+        """Return the loaded sample IDs of a sample group, querying the workspace once per group."""
+        sample_ids = self._group_samples_cache.get(group_name)
+        if sample_ids is None:
+            sample_ids = self.workspace.get_sample_ids(group_name, loaded_only=True)
+            self._group_samples_cache[group_name] = sample_ids
+        return sample_ids
+
+    def _sample_keywords(self, sample_id):
+        """Return workspace.get_keywords(sample_id), reading each sample's keywords only once."""
+        keywords = self._keywords_cache.get(sample_id)
+        if keywords is None:
+            keywords = self.workspace.get_keywords(sample_id)
+            self._keywords_cache[sample_id] = keywords
+        return keywords
+
+    def _get_sample(self, sample_id):
+        """Return workspace.get_sample(sample_id), looking each sample up only once."""
+        sample = self._sample_cache.get(sample_id)
+        if sample is None:
+            sample = self.workspace.get_sample(sample_id)
+            self._sample_cache[sample_id] = sample
+        return sample
+
+    def _channel_index(self, sample_id):
+        """Return {channel label: column index} for a sample's pnn_labels, built once per sample."""
+        index = self._channel_index_cache.get(sample_id)
+        if index is None:
+            sample = self._get_sample(sample_id)
+            index = {label: i for i, label in enumerate(sample.pnn_labels)}
+            self._channel_index_cache[sample_id] = index
+        return index
+
+    def _keywords_frame(self):
+        """
+        Return the keywords of all samples as a DataFrame, reading them from the workspace once.
+
+        Rows are sample IDs and columns are keyword names; keywords a sample does
+        not have are NaN. Keyword listings and filters then work on whole columns.
+        """
+        if self._all_keywords_df is None:
+            keywords_by_sample = {}
+            sample_keywords = self._sample_keywords
+            for sid in self.workspace.get_sample_ids():
+                try:
+                    keywords_by_sample[sid] = sample_keywords(sid)
+                except Exception:
+                    keywords_by_sample[sid] = {}
+            self._all_keywords_df = pd.DataFrame.from_dict(keywords_by_sample, orient='index')
+        return self._all_keywords_df
+
+    def _gate_path_index(self, sample_id):
+        """
+        Return {gate_path: [gate_name, ...]} for a sample, built once from its gate ids.
+
+        gate_path is the tuple FlowKit reports for each gate (its ancestors), so the
+        list under a path holds the gates that sit at that level of the hierarchy.
+        """
+        index = self._gates_by_path_index.get(sample_id)
+        if index is None:
+            index = {}
+            for gate_name, gate_path in self._cached_gate_ids(sample_id):
+                index.setdefault(gate_path, []).append(gate_name)
+            self._gates_by_path_index[sample_id] = index
+        return index
+
+    def _gates_under_path(self, sample_id, path_prefix):
+        """
+        Return [(gate_name, gate_path), ...] for the gates whose path starts with path_prefix.
+
+        Every gate is filed under each prefix of its path once per sample, so finding
+        the gates at and below a level of the hierarchy is a single lookup rather than
+        a prefix comparison against every gate id. Gates keep their get_gate_ids() order.
+        """
+        index = self._gates_by_prefix_index.get(sample_id)
+        if index is None:
+            index = {}
+            for gate_name, gate_path in self._cached_gate_ids(sample_id):
+                entry = (gate_name, gate_path)
+                for depth in range(1, len(gate_path) + 1):
+                    index.setdefault(gate_path[:depth], []).append(entry)
+            self._gates_by_prefix_index[sample_id] = index
+        return index.get(tuple(path_prefix), [])
+
+    def _gate_summary(self, sample_id, gate_name, gate_path):
+        """
+        Return (gate, dimension_ids, has_dividers) for a gate, fetching it only once.
+
+        Args:
+            sample_id (str): Sample ID
+            gate_name (str): Gate name
+            gate_path (tuple): Gate path as reported by get_gate_ids()
+        """
+        key = (sample_id, gate_name, gate_path)
+        summary = self._gate_summary_cache.get(key)
+        if summary is None:
+            get_gate_path = gate_path[:-1]  # () for root-level gates
+            gate = self._get_gate(sample_id, gate_name, gate_path=get_gate_path)
+            dims = tuple(d.id for d in gate.dimensions) if hasattr(gate, 'dimensions') else ()
+            has_dividers = _gate_kind(gate) == 'quadrant' and len(gate.dividers) > 0
+            summary = (gate, dims, has_dividers)
+            self._gate_summary_cache[key] = summary
+        return summary
+
+    def _gates_on_axes(self, sample_id, x_channel, y_channel):
+        """
+        Return [(gate_name, gate_path), ...] for the 2D gates on the x/y channel pair (either order).
+
+        The index is built once per sample from _gate_summary, so each gate is fetched
+        and its dimensions read only the first time; later plots of any channel pair
+        just look it up instead of fetching every gate to compare its dimensions.
+        """
+        index = self._gates_by_axes_index.get(sample_id)
+        if index is None:
+            index = {}
+            for gate_name, gate_path in self._cached_gate_ids(sample_id):
+                try:
+                    _, dims, _ = self._gate_summary(sample_id, gate_name, gate_path)
+                except Exception as e:
+                    print(f"    Warning: Could not read gate '{gate_name}': {e}")
+                    continue
+                if len(dims) == 2:
+                    index.setdefault(frozenset(dims), []).append((gate_name, gate_path))
+            self._gates_by_axes_index[sample_id] = index
+        return index.get(frozenset((x_channel, y_channel)), [])
 
     # Standard report functions removed - only interactive mode is supported
 
@@ -236,38 +894,48 @@ class FlowAnalyzer:
               (e.g., "WellID", "Well ID", "well_id" all match)
             - Filename parsing uses regex pattern: letter A-H followed by 1-2 digits
         """
-        import re
-        
-        # Helper function to parse well ID from a string
-        def parse_well_string(s):
-            """Extract (row, col) from a string like 'A01', 'A1', 'A_01', etc.
-            Handles both 'A1' and 'A01' formats - they are treated as the same.
-            """
-            s_str = str(s).strip()
-            # Pattern: letter A-H (case insensitive) followed by optional separator and 1-2 digits
-            # This matches: A1, A01, A_1, A-01, etc.
-            match = re.search(r'([A-H])\W*(\d{1,2})', s_str, re.IGNORECASE)
-            if match:
-                row = match.group(1).upper()
-                col = int(match.group(2))  # Convert to int (A1 and A01 both become 1)
-                return row, col
-            return None, None
-        
-        # Normalize keys: remove symbols, spaces, lowercase - for fuzzy matching
-        def normalize(s):
-            """Normalize string for fuzzy matching: remove all non-alphanumeric, lowercase"""
-            return re.sub(r'[^a-zA-Z0-9]', '', s).lower()
-        
-        # Check if a keyword name matches "wellid" (fuzzy match)
-        def matches_wellid(key):
-            """Check if keyword matches 'wellid' with fuzzy matching"""
-            normalized = normalize(key)
-            # Check for exact match or contains "well" and "id"
-            return normalized == "wellid" or (normalized.startswith("well") and "id" in normalized)
+        for value, method in self._well_id_candidates(sample, source, keyword_name, sample_id):
+            code = self._parse_filename_well(value) if method == "filename" else _parse_well_string(value)
+            if code >= 0:
+                row, col = _decode_well(code)
+                return (row, col, method) if return_method else (row, col)
         
+        return (None, None, None) if return_method else (None, None)
+
+    def _parse_filename_well(self, filename):
+        """
+        Parse a well code from a filename, specialized for plate-export naming.
+
+        FCS files from one plate export share a naming template, so the text before
+        the well ID (e.g. 'Specimen_001_') repeats from file to file. After a
+        successful search the prefix is remembered; later filenames that start
+        with the same prefix are matched at that offset directly. This gives the
+        same result as _parse_well_string(): with an identical prefix, no earlier
+        match is possible. Otherwise it falls back to a full search.
+        """
+        filename = str(filename).strip()
+        prefix = self._filename_well_prefix
+        match = None
+        if prefix is not None and filename.startswith(prefix):
+            match = _WELL_RE.match(filename, len(prefix))
+        if match is None:
+            match = _WELL_RE.search(filename)
+            if match is not None:
+                self._filename_well_prefix = filename[:match.start()]
+        return _well_code(match)
+
+    def _well_id_candidates(self, sample, source='auto', keyword_name=None, sample_id=None):
+        """
+        Yield (value, method) pairs that may contain the well ID, in priority order.
+
+        This holds the keyword/filename lookup rules shared by parse_well_id() and
+        parse_well_ids_batch(); the first candidate that parses as a well ID wins.
+        See parse_well_id() for the meaning of the arguments.
+        """
         # 1. Extract from keyword
         if source in ['auto', 'keyword']:
             # Get keywords - try multiple methods
+            sid = sample_id
             keywords = None
             # First try: sample.keywords attribute
             if hasattr(sample, 'keywords') and sample.keywords:
@@ -276,21 +944,21 @@ class FlowAnalyzer:
             elif hasattr(self, 'workspace'):
                 try:
                     # Use provided sample_id or try to get it from sample
-                    sid = sample_id
                     if not sid:
                         if hasattr(sample, 'id'):
                             sid = sample.id
                         elif hasattr(sample, 'sample_id'):
                             sid = sample.sample_id
                     if sid:
-                        keywords = self.workspace.get_keywords(sid)
+                        # The cached dict the keywords frame rows are built from; no per-sample row copy
+                        keywords = self._sample_keywords(sid)
                 except Exception:
                     pass
             # Third try: sample.get_keywords() method
             if not keywords and hasattr(sample, 'get_keywords'):
                 try:
                     keywords = sample.get_keywords()
-                except:
+                except Exception:
                     pass
             
             if keywords:
@@ -298,51 +966,113 @@ class FlowAnalyzer:
                 if source == 'keyword' and keyword_name:
                     # Try exact match first
                     if keyword_name in keywords:
-                        value = keywords[keyword_name]
-                        row, col = parse_well_string(value)
-                        if row and col:
-                            method = f"keyword '{keyword_name}'"
-                            return (row, col, method) if return_method else (row, col)
+                        yield keywords[keyword_name], f"keyword '{keyword_name}'"
                     else:
                         # Try fuzzy match - find keyword that matches the provided name
-                        # First try normalized exact match
-                        keyword_normalized = normalize(keyword_name)
-                        for key, value in keywords.items():
-                            if normalize(key) == keyword_normalized:
-                                row, col = parse_well_string(value)
-                                if row and col:
-                                    method = f"keyword '{key}' (matched '{keyword_name}')"
-                                    return (row, col, method) if return_method else (row, col)
-                        
-                        # Then try case-insensitive partial match
-                        for key, value in keywords.items():
-                            if (keyword_name.lower() in key.lower() or 
-                                key.lower() in keyword_name.lower() or
-                                normalize(keyword_name) in normalize(key) or
-                                normalize(key) in normalize(keyword_name)):
-                                row, col = parse_well_string(value)
-                                if row and col:
-                                    method = f"keyword '{key}' (matched '{keyword_name}')"
-                                    return (row, col, method) if return_method else (row, col)
+                        # First try normalized exact match (one lookup in the per-sample index)
+                        keyword_normalized = _normalize_key(keyword_name)
+                        key_index = self._normalized_keyword_index(keywords, sid)
+                        match = key_index.get(keyword_normalized)
+                        if match is not None:
+                            key, value = match
+                            yield value, f"keyword '{key}' (matched '{keyword_name}')"
+                        else:
+                            # Then try case-insensitive partial match
+                            keyword_lower = keyword_name.lower()
+                            for key_normalized, (key, value) in key_index.items():
+                                key_lower = key.lower()
+                                if (keyword_lower in key_lower or 
+                                    key_lower in keyword_lower or
+                                    keyword_normalized in key_normalized or
+                                    key_normalized in keyword_normalized):
+                                    yield value, f"keyword '{key}' (matched '{keyword_name}')"
                 else:
                     # Search for 'wellid' (fuzzy match) - original behavior
                     for key, value in keywords.items():
-                        if matches_wellid(key):
-                            row, col = parse_well_string(value)
-                            if row and col:
-                                method = f"keyword '{key}' (auto-detected)"
-                                return (row, col, method) if return_method else (row, col)
+                        if _matches_wellid(key):
+                            yield value, f"keyword '{key}' (auto-detected)"
                             break  # Found the key, even if parsing failed
         
         # 2. Extract from filename (if auto mode or explicitly requested)
         if source in ['auto', 'filename']:
-            filename = sample.original_filename
-            row, col = parse_well_string(filename)
-            if row and col:
-                method = "filename"
-                return (row, col, method) if return_method else (row, col)
+            yield sample.original_filename, "filename"
+
+    def _normalized_keyword_index(self, keywords, sample_id=None):
+        """
+        Return {normalized keyword name: (keyword name, value)} for a sample's keywords.
+
+        Built once per sample ID and reused; when no sample ID is known the index is
+        built without caching. The first keyword wins if several normalize alike.
+        """
+        index = self._keyword_index.get(sample_id) if sample_id else None
+        if index is None:
+            index = {}
+            for key, value in keywords.items():
+                index.setdefault(_normalize_key(key), (key, value))
+            if sample_id:
+                self._keyword_index[sample_id] = index
+        return index
+
+    def parse_well_ids_batch(self, sample_ids, source='auto', keyword_name=None):
+        """
+        Parse well IDs for many samples with a single vectorized regex pass.
+
+        Gathers every candidate keyword value / filename for all samples, runs the
+        well-ID pattern over them at once with pandas' str.extract, and keeps the
+        first candidate that parses for each sample. Matching rules are the same as
+        parse_well_id().
+
+        Args:
+            sample_ids (list): Sample IDs to parse.
+            source (str, optional): 'auto', 'keyword' or 'filename' (see parse_well_id()).
+            keyword_name (str, optional): Keyword to read when source='keyword'.
+
+        Returns:
+            pandas.DataFrame: Indexed by sample ID (in the given order) with columns
+                'row' (str), 'col' (Int8), 'method' (str) and 'code' (int16, the
+                _parse_well_string() encoding). row/col/method are missing and code
+                is -1 for samples whose well ID could not be parsed. Results are
+                cached per arguments (the validation prompt and the plot run usually
+                ask for the same samples), so treat the frame as read-only.
+        """
+        cache_key = (tuple(sample_ids), source, keyword_name)
+        cached = self._well_id_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        values, owners, methods = [], [], []
+        # Bound once; these run for every sample
+        get_sample = self._get_sample
+        well_id_candidates = self._well_id_candidates
+        for sid in sample_ids:
+            try:
+                sample = get_sample(sid)
+                for value, method in well_id_candidates(sample, source, keyword_name, sid):
+                    values.append(str(value))
+                    owners.append(sid)
+                    methods.append(method)
+            except Exception as e:
+                # A sample that cannot be read gets no well ID; the rest of the plate still parses
+                logger.debug("    DEBUG: Could not read well ID candidates for '%s': %s", sid, e, exc_info=True)
+                continue
         
-        return (None, None, None) if return_method else (None, None)
+        wells = pd.Series(values, dtype=object).str.extract(_WELL_RE.pattern, flags=_WELL_RE.flags, expand=True)
+        wells.columns = ['row', 'col']
+        wells['sample_id'] = owners
+        wells['method'] = methods
+        wells = wells.dropna(subset=['row', 'col'])
+        wells['col'] = wells['col'].astype(int)
+        # Column 0 is not a valid well; the first remaining candidate wins for each sample
+        wells = wells[wells['col'] > 0].drop_duplicates('sample_id').set_index('sample_id')
+        wells['row'] = wells['row'].str.upper()
+        wells['code'] = (wells['row'].map(ord) - ord('A')) * 256 + wells['col']
+        
+        wells = wells.reindex(list(sample_ids))
+        wells['col'] = wells['col'].astype('Int8')
+        wells['code'] = wells['code'].fillna(-1).astype(np.int16)
+        wells = wells[['row', 'col', 'method', 'code']]
+        self._well_id_cache[cache_key] = wells
+        return wells
 
     # Standard report function removed: generate_interactive_heatmap
     # Standard report function removed: get_gate_polygons
@@ -360,13 +1090,14 @@ class FlowAnalyzer:
                 ID in the workspace.
         
         Returns:
-            dict: Dictionary mapping gate path strings to lists of (gate_name, gate_path) tuples.
-                - Keys are string representations of gate paths (e.g., "root", "root → Cells")
+            dict: Dictionary mapping gate path tuples to lists of (gate_name, gate_path) tuples,
+                in gating-tree order.
+                - Keys are gate path tuples (e.g., ("root",), ("root", "Cells"))
                 - Values are lists of tuples: (gate_name, gate_path_tuple)
                 - Example: {
-                    "root": [("Ungated", ())],
-                    "root → Cells": [("Cells", ("root", "Cells"))],
-                    "root → Cells → Singlets": [("Singlets", ("root", "Cells", "Singlets"))]
+                    ("root",): [("Ungated", ())],
+                    ("root", "Cells"): [("Cells", ("root", "Cells"))],
+                    ("root", "Cells", "Singlets"): [("Singlets", ("root", "Cells", "Singlets"))]
                   }
         
         Raises:
@@ -375,7 +1106,7 @@ class FlowAnalyzer:
         Example:
             >>> gates_info = analyzer._get_all_gates_info("A1.fcs")
             >>> for path, gates in gates_info.items():
-            ...     print(f"{path}: {[g[0] for g in gates]}")
+            ...     print(f"{_format_gate_path(path)}: {[g[0] for g in gates]}")
             >>> # root: ['Ungated']
             >>> # root → Cells: ['Cells']
             >>> # root → Cells → Singlets: ['Singlets']
@@ -383,20 +1114,23 @@ class FlowAnalyzer:
         Notes:
             - "Ungated" is always included as the root-level option
             - Gate paths are represented as tuples for programmatic use
-            - Path strings use " → " separator for display purposes
+            - Use _format_gate_path() to display a path key (" → " separated)
         """
-        gate_ids = self.workspace.get_gate_ids(sample_id)
+        gate_ids = self._cached_gate_ids(sample_id)
+        # Samples with an identical gate hierarchy share the same result
+        gates_by_path = self._gates_by_path_cache.get(gate_ids)
+        if gates_by_path is not None:
+            return gates_by_path
+        
         gates_by_path = {}
         
         # Add "Ungated" option
-        gates_by_path["root"] = [("Ungated", ())]
+        gates_by_path[_ROOT_PATH] = [("Ungated", ())]
         
         for gate_name, gate_path in gate_ids:
-            path_str = " → ".join(gate_path) if gate_path else "root"
-            if path_str not in gates_by_path:
-                gates_by_path[path_str] = []
-            gates_by_path[path_str].append((gate_name, gate_path))
+            gates_by_path.setdefault(gate_path or _ROOT_PATH, []).append((gate_name, gate_path))
         
+        self._gates_by_path_cache[gate_ids] = gates_by_path
         return gates_by_path
 
     def _extract_quadrant_gate(self, sample_id, gate_name, gate_path, x_channel, y_channel):
@@ -416,19 +1150,21 @@ class FlowAnalyzer:
                 - 'type': 'quadrant'
                 - 'x_dim': X-axis channel name
                 - 'y_dim': Y-axis channel name
-                - 'dividers': List of divider dictionaries with:
-                    - 'dimension': Channel name
-                    - 'value': Divider value (in raw data space)
-                    - 'orientation': 'vertical' or 'horizontal'
+                - 'dividers': List of Divider tuples with:
+                    - dimension: Channel name
+                    - value: Divider value (in raw data space)
+                    - orientation: 'vertical' or 'horizontal'
         """
         try:
             # Handle "Ungated" case
             if gate_name == "Ungated":
                 return None
+            
+            axes = {x_channel, y_channel}
 
             # Get the gate using the parent path
             get_gate_path = gate_path[:-1] if len(gate_path) > 1 else ()
-            gate = self.workspace.get_gate(sample_id, gate_name, gate_path=get_gate_path)
+            gate = self._get_gate(sample_id, gate_name, gate_path=get_gate_path)
             
             # Check if this is a quadrant gate
             # QuadrantGate has 'dividers' and/or 'quadrants' attributes
@@ -439,60 +1175,52 @@ class FlowAnalyzer:
             # try to find a parent QuadrantGate or sibling gate with dividers
             if not (has_dividers or has_quadrants):
                 # Check if this is a quadrant region gate (Q1, Q2, Q3, Q4)
-                is_quadrant_region = False
-                try:
-                    import re
-                    if re.match(r'^Q\d+:', gate_name):
-                        is_quadrant_region = True
-                except:
-                    pass
+                is_quadrant_region = _Q_RE.match(gate_name) is not None
                 
                 if is_quadrant_region:
-                    print(f"    DEBUG: Gate '{gate_name}' is a quadrant region, searching for QuadrantGate with dividers...")
+                    logger.debug("    DEBUG: Gate '%s' is a quadrant region, searching for QuadrantGate with dividers...", gate_name)
                     # Search for gates that might have dividers
                     # Check: 1) Same path level (siblings), 2) Parent path level
-                    all_gate_ids = self.workspace.get_gate_ids(sample_id)
+                    path_index = self._gate_path_index(sample_id)
                     parent_quadrant_gate = None
                     parent_path = gate_path[:-1] if len(gate_path) > 0 else ()
+                    candidates = [(name, gate_path) for name in path_index.get(gate_path, [])]
+                    if parent_path != gate_path:
+                        candidates += [(name, parent_path) for name in path_index.get(parent_path, [])]
                     
                     # First, try to find a gate at the same path level with dividers
-                    for other_gate_name, other_gate_path in all_gate_ids:
+                    for other_gate_name, other_gate_path in candidates:
                         # Skip the current gate
                         if other_gate_name == gate_name and other_gate_path == gate_path:
                             continue
                             
-                        # Check gates at same path level OR parent path level
-                        if other_gate_path == gate_path or other_gate_path == parent_path:
-                            try:
-                                other_get_gate_path = other_gate_path[:-1] if len(other_gate_path) > 1 else ()
-                                other_gate = self.workspace.get_gate(sample_id, other_gate_name, gate_path=other_get_gate_path)
-                                
-                                # Check if this gate has dividers and matches our channels
-                                if hasattr(other_gate, 'dividers') and len(other_gate.dividers) > 0:
-                                    if len(other_gate.dimensions) == 2:
-                                        other_dims = [d.id for d in other_gate.dimensions]
-                                        if ((other_dims[0] == x_channel and other_dims[1] == y_channel) or
-                                            (other_dims[0] == y_channel and other_dims[1] == x_channel)):
-                                            parent_quadrant_gate = other_gate
-                                            print(f"    DEBUG: Found QuadrantGate '{other_gate_name}' at path {other_gate_path} with {len(other_gate.dividers)} divider(s)")
-                                            break
-                            except Exception as e:
-                                print(f"    DEBUG: Error checking gate '{other_gate_name}': {e}")
-                                continue
+                        try:
+                            other_gate, other_dims, other_has_dividers = self._gate_summary(
+                                sample_id, other_gate_name, other_gate_path)
+                            
+                            # Check if this gate has dividers and matches our channels
+                            if other_has_dividers and len(other_dims) == 2:
+                                if set(other_dims) == axes:
+                                    parent_quadrant_gate = other_gate
+                                    logger.debug("    DEBUG: Found QuadrantGate '%s' at path %s with %s divider(s)", other_gate_name, other_gate_path, len(other_gate.dividers))
+                                    break
+                        except Exception as e:
+                            logger.debug("    DEBUG: Error checking gate '%s': %s", other_gate_name, e)
+                            continue
                     
                     if parent_quadrant_gate:
                         gate = parent_quadrant_gate
                         has_dividers = hasattr(gate, 'dividers') and len(gate.dividers) > 0
                         has_quadrants = hasattr(gate, 'quadrants') and len(gate.quadrants) > 0
                     else:
-                        print(f"    DEBUG: Could not find QuadrantGate with dividers for '{gate_name}'")
-                        print(f"           Attempting to infer dividers from Q1-Q4 quadrant regions...")
+                        logger.debug("    DEBUG: Could not find QuadrantGate with dividers for '%s'", gate_name)
+                        logger.debug("           Attempting to infer dividers from Q1-Q4 quadrant regions...")
                         # Fallback: Try to infer dividers from Q1-Q4 gates themselves
                         inferred_dividers = self._infer_quadrant_dividers_from_regions(
                             sample_id, gate_path, x_channel, y_channel
                         )
                         if inferred_dividers:
-                            print(f"    DEBUG: Successfully inferred {len(inferred_dividers)} divider(s) from quadrant regions")
+                            logger.debug("    DEBUG: Successfully inferred %s divider(s) from quadrant regions", len(inferred_dividers))
                             # Get dimensions from the current gate
                             if len(gate.dimensions) == 2:
                                 dims = [d.id for d in gate.dimensions]
@@ -503,15 +1231,15 @@ class FlowAnalyzer:
                                     'y_dim': dims[1],
                                     'dividers': inferred_dividers
                                 }
-                        print(f"    DEBUG: Could not infer dividers from quadrant regions")
+                        logger.debug("    DEBUG: Could not infer dividers from quadrant regions")
                         return None
                 else:
-                    print(f"    DEBUG: Gate '{gate_name}' does not have dividers or quadrants attributes")
+                    logger.debug("    DEBUG: Gate '%s' does not have dividers or quadrants attributes", gate_name)
                     return None
             
             divider_count = len(gate.dividers) if has_dividers else 0
             quadrant_count = len(gate.quadrants) if has_quadrants else 0
-            print(f"    DEBUG: Detected quadrant gate '{gate_name}' with {divider_count} divider(s) and {quadrant_count} quadrant(s)")
+            logger.debug("    DEBUG: Detected quadrant gate '%s' with %s divider(s) and %s quadrant(s)", gate_name, divider_count, quadrant_count)
             
             # Check dimensions
             if len(gate.dimensions) != 2:
@@ -520,75 +1248,40 @@ class FlowAnalyzer:
             dims = [d.id for d in gate.dimensions]  # Channel names
             
             # Check if gate matches our axes (in either order)
-            if not ((dims[0] == x_channel and dims[1] == y_channel) or
-                   (dims[0] == y_channel and dims[1] == x_channel)):
+            if set(dims) != axes:
                 return None
             
             # Extract dividers
+            # Divider dimension -> line orientation (x_channel wins if both axes are the same)
+            dim_to_orient = {y_channel: 'horizontal', x_channel: 'vertical'}
             dividers = []
             divider_list = gate.dividers if hasattr(gate, 'dividers') else []
             for divider in divider_list:
                 try:
                     # Get divider dimension and value
-                    # Try multiple possible attribute names for divider properties
-                    divider_dim = None
-                    divider_value = None
-                    
-                    # Try different possible attribute names for dimension reference
-                    for attr_name in ['dimension_ref', 'dimension', 'dim_ref', 'dim']:
-                        if hasattr(divider, attr_name):
-                            attr_value = getattr(divider, attr_name)
-                            # Could be a string or a Dimension object
-                            if isinstance(attr_value, str):
-                                divider_dim = attr_value
-                            elif hasattr(attr_value, 'id'):
-                                divider_dim = attr_value.id
-                            elif hasattr(attr_value, '__str__'):
-                                divider_dim = str(attr_value)
-                            if divider_dim:
-                                break
-                    
-                    # Try different possible attribute names for divider value
-                    for attr_name in ['value', 'position', 'divider_value', 'threshold']:
-                        if hasattr(divider, attr_name):
-                            divider_value = getattr(divider, attr_name)
-                            if divider_value is not None:
-                                break
+                    divider_dim, divider_value = _resolve_divider(divider)
                     
                     if divider_dim and divider_value is not None:
                         # Determine orientation
-                        if divider_dim == x_channel:
-                            orientation = 'vertical'
-                        elif divider_dim == y_channel:
-                            orientation = 'horizontal'
-                        else:
+                        orientation = dim_to_orient.get(divider_dim)
+                        if orientation is None:
                             # Divider doesn't match our axes
                             continue
                         
-                        # Convert divider value from display space to raw data space if needed
-                        # Similar to polygon gate conversion
-                        try:
-                            # Divider values might be in display space (0-1) or already in raw space
-                            # Try to convert if it's in display space (values between 0 and 1)
-                            if 0 <= divider_value <= 1:
-                                # Convert from display space to raw values
-                                display_min_log = 0  # log10(1)
-                                display_max_log = 5  # log10(100000)
-                                divider_value = 10 ** (display_min_log + divider_value * (display_max_log - display_min_log))
-                        except:
-                            # If conversion fails, use value as-is (might already be in raw space)
-                            pass
-                        
-                        dividers.append({
-                            'dimension': divider_dim,
-                            'value': divider_value,
-                            'orientation': orientation
-                        })
+                        dividers.append(Divider(divider_dim, float(divider_value), orientation))
                 except Exception as e:
-                    print(f"    DEBUG: Could not extract divider: {e}")
+                    logger.debug("    DEBUG: Could not extract divider: %s", e)
                     continue
             
             if dividers:
+                # Convert divider values from display space to raw data space if needed
+                # (similar to polygon gate conversion). Divider values might be in display
+                # space (0-1) or already in raw space; only the 0-1 ones are converted
+                values = np.array([d.value for d in dividers])
+                in_display_space = (values >= 0) & (values <= 1)
+                values = np.where(in_display_space, _disp_to_raw(values), values)
+                dividers = [d._replace(value=value) for d, value in zip(dividers, values.tolist())]
+                
                 return {
                     'name': gate_name,
                     'type': 'quadrant',
@@ -597,7 +1290,7 @@ class FlowAnalyzer:
                     'dividers': dividers
                 }
         except Exception as e:
-            print(f"    DEBUG: Could not extract quadrant gate '{gate_name}': {e}")
+            logger.debug("    DEBUG: Could not extract quadrant gate '%s': %s", gate_name, e)
         
         return None
     
@@ -612,64 +1305,65 @@ class FlowAnalyzer:
             y_channel (str): Y-axis channel name
         
         Returns:
-            list or None: List of divider dictionaries, or None if inference fails
+            list or None: List of Divider tuples, or None if inference fails
         """
         try:
-            import re
             import numpy as np
 
-            print(f"\n    DEBUG _infer_quadrant_dividers_from_regions:")
-            print(f"           sample_id: {sample_id}")
-            print(f"           gate_path: {gate_path}")
-            print(f"           x_channel: {x_channel}")
-            print(f"           y_channel: {y_channel}")
+            logger.debug("\n    DEBUG _infer_quadrant_dividers_from_regions:")
+            logger.debug("           sample_id: %s", sample_id)
+            logger.debug("           gate_path: %s", gate_path)
+            logger.debug("           x_channel: %s", x_channel)
+            logger.debug("           y_channel: %s", y_channel)
 
             # Find all Q1-Q4 gates at this path
-            all_gate_ids = self.workspace.get_gate_ids(sample_id)
             quadrant_gates = {}
-            get_gate_path = gate_path[:-1] if len(gate_path) > 1 else ()
+            # Same for every gate at this path; slicing a 0- or 1-tuple already gives ()
+            get_gate_path = gate_path[:-1]
+
+            gates_at_target_path = 0
+            for gate_name in self._gate_path_index(sample_id).get(gate_path, ()):
+                gates_at_target_path += 1
+                # Check if it's a Q1-Q4 gate (cheap) before fetching the gate (expensive)
+                match = _Q_RE.match(gate_name)
+                if not match:
+                    continue
+                try:
+                    gate = self._get_gate(sample_id, gate_name, gate_path=get_gate_path)
+                    if len(gate.dimensions) == 2:
+                        dims = [d.id for d in gate.dimensions]
+                        # Check if dimensions match
+                        if ((dims[0] == x_channel and dims[1] == y_channel) or
+                            (dims[0] == y_channel and dims[1] == x_channel)):
+                            quadrant_gates[int(match.group(1))] = {
+                                'name': gate_name,
+                                'gate': gate,
+                                'dims': dims
+                            }
+                            if len(quadrant_gates) == 4:
+                                # All of Q1-Q4 found; skip fetching the remaining gates
+                                break
+                except Exception as e:
+                    logger.debug("    DEBUG: Error getting gate '%s': %s", gate_name, e)
+                    continue
 
-            print(f"           Checking {len(all_gate_ids)} total gates...")
-            gates_at_target_path = [(name, path) for name, path in all_gate_ids if path == gate_path]
-            print(f"           Found {len(gates_at_target_path)} gates at target path {gate_path}")
-            
-            for gate_name, other_gate_path in all_gate_ids:
-                if other_gate_path == gate_path:
-                    # Check if it's a Q1-Q4 gate
-                    if re.match(r'^Q\d+:', gate_name):
-                        try:
-                            gate = self.workspace.get_gate(sample_id, gate_name, gate_path=get_gate_path)
-                            if len(gate.dimensions) == 2:
-                                dims = [d.id for d in gate.dimensions]
-                                # Check if dimensions match
-                                if ((dims[0] == x_channel and dims[1] == y_channel) or
-                                    (dims[0] == y_channel and dims[1] == x_channel)):
-                                    # Extract quadrant number
-                                    match = re.match(r'^Q(\d+):', gate_name)
-                                    if match:
-                                        q_num = int(match.group(1))
-                                        quadrant_gates[q_num] = {
-                                            'name': gate_name,
-                                            'gate': gate,
-                                            'dims': dims
-                                        }
-                        except Exception as e:
-                            print(f"    DEBUG: Error getting gate '{gate_name}': {e}")
-                            continue
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("           Scanned %s gates at target path %s (of %s total)",
+                             gates_at_target_path, gate_path, len(self._cached_gate_ids(sample_id)))
             
             if len(quadrant_gates) < 2:
-                print(f"    DEBUG: Found only {len(quadrant_gates)} quadrant gates, need at least 2")
+                logger.debug("    DEBUG: Found only %s quadrant gates, need at least 2", len(quadrant_gates))
                 return None
             
             # Debug: Print what attributes the Q gates have
-            print(f"    DEBUG: Found {len(quadrant_gates)} quadrant gates: {list(quadrant_gates.keys())}")
+            logger.debug("    DEBUG: Found %s quadrant gates: %s", len(quadrant_gates), list(quadrant_gates.keys()))
 
             # NEW APPROACH: Parse XML directly to extract min/max values
             # Import the helper function
             from quadrant_xml_parser import infer_quadrant_dividers_from_xml
 
             result = infer_quadrant_dividers_from_xml(
-                self.wsp_path,
+                self._workspace_populations(),
                 sample_id,
                 gate_path,
                 x_channel,
@@ -677,27 +1371,29 @@ class FlowAnalyzer:
                 quadrant_gates
             )
 
-            return result
+            return [Divider(**d) for d in result] if result else result
 
             # FALLBACK: If XML parsing fails, try other methods
             gate_boundaries = {}
             for q_num, q_info in quadrant_gates.items():
                 gate = q_info['gate']
-                print(f"    DEBUG: Q{q_num} ('{q_info['name']}'):")
+                logger.debug("    DEBUG: Q%s ('%s'):", q_num, q_info['name'])
 
                 # Try to get min/max from the gate
-                if hasattr(gate, 'vertices') and gate.vertices is not None and len(gate.vertices) > 0:
+                kind = _gate_kind(gate)
+                if kind == 'polygon' and gate.vertices is not None and len(gate.vertices) > 0:
                     # Polygon-style gate - extract bounding box
-                    verts = np.array(gate.vertices)
+                    verts = np.asarray(gate.vertices, dtype=np.float64)
+                    lo, hi = verts.min(axis=0), verts.max(axis=0)
                     gate_boundaries[q_num] = {
-                        'x_min': float(verts[:, 0].min()),
-                        'x_max': float(verts[:, 0].max()),
-                        'y_min': float(verts[:, 1].min()),
-                        'y_max': float(verts[:, 1].max()),
+                        'x_min': float(lo[0]),
+                        'x_max': float(hi[0]),
+                        'y_min': float(lo[1]),
+                        'y_max': float(hi[1]),
                         'source': 'vertices'
                     }
-                    print(f"           Got boundaries from vertices: X=[{gate_boundaries[q_num]['x_min']:.4f}, {gate_boundaries[q_num]['x_max']:.4f}], Y=[{gate_boundaries[q_num]['y_min']:.4f}, {gate_boundaries[q_num]['y_max']:.4f}]")
-                elif hasattr(gate, 'min') and hasattr(gate, 'max'):
+                    logger.debug("           Got boundaries from vertices: X=[%.4f, %.4f], Y=[%.4f, %.4f]", gate_boundaries[q_num]['x_min'], gate_boundaries[q_num]['x_max'], gate_boundaries[q_num]['y_min'], gate_boundaries[q_num]['y_max'])
+                elif kind == 'rectangle':
                     # Rectangle gate with min/max attributes
                     dims = q_info['dims']
                     try:
@@ -719,7 +1415,7 @@ class FlowAnalyzer:
                             y_min = min_vals[y_idx] if hasattr(min_vals, '__getitem__') else None
                             y_max = max_vals[y_idx] if hasattr(max_vals, '__getitem__') else None
 
-                        if all(v is not None for v in [x_min, x_max, y_min, y_max]):
+                        if x_min is not None and x_max is not None and y_min is not None and y_max is not None:
                             gate_boundaries[q_num] = {
                                 'x_min': float(x_min),
                                 'x_max': float(x_max),
@@ -727,40 +1423,33 @@ class FlowAnalyzer:
                                 'y_max': float(y_max),
                                 'source': 'min/max'
                             }
-                            print(f"           Got boundaries from min/max: X=[{x_min:.4f}, {x_max:.4f}], Y=[{y_min:.4f}, {y_max:.4f}]")
+                            logger.debug("           Got boundaries from min/max: X=[%.4f, %.4f], Y=[%.4f, %.4f]", x_min, x_max, y_min, y_max)
                     except Exception as e:
-                        print(f"           Failed to extract min/max: {e}")
+                        logger.debug("           Failed to extract min/max: %s", e)
 
             if len(gate_boundaries) >= 2:
-                print(f"    DEBUG: Successfully extracted {len(gate_boundaries)} gate boundaries")
-                print(f"    DEBUG: Converting from display space (0-1) to raw data space...")
+                logger.debug("    DEBUG: Successfully extracted %s gate boundaries", len(gate_boundaries))
+                logger.debug("    DEBUG: Converting from display space (0-1) to raw data space...")
 
                 # Transform from display space to raw values (same as polygon gates)
-                # FlowJo typically displays log scale from 10^0 to 10^5 (1 to 100,000)
-                display_min_log = 0  # log10(1)
-                display_max_log = 5  # log10(100000)
-
                 transformed_boundaries = {}
                 for q_num, bounds in gate_boundaries.items():
                     transformed_boundaries[q_num] = {
-                        'x_min': 10 ** (display_min_log + bounds['x_min'] * (display_max_log - display_min_log)),
-                        'x_max': 10 ** (display_min_log + bounds['x_max'] * (display_max_log - display_min_log)),
-                        'y_min': 10 ** (display_min_log + bounds['y_min'] * (display_max_log - display_min_log)),
-                        'y_max': 10 ** (display_min_log + bounds['y_max'] * (display_max_log - display_min_log)),
+                        key: _disp_to_raw(bounds[key]) for key in ('x_min', 'x_max', 'y_min', 'y_max')
                     }
-                    print(f"    DEBUG: Q{q_num} transformed: X=[{transformed_boundaries[q_num]['x_min']:.2f}, {transformed_boundaries[q_num]['x_max']:.2f}], Y=[{transformed_boundaries[q_num]['y_min']:.2f}, {transformed_boundaries[q_num]['y_max']:.2f}]")
+                    logger.debug("    DEBUG: Q%s transformed: X=[%.2f, %.2f], Y=[%.2f, %.2f]", q_num, transformed_boundaries[q_num]['x_min'], transformed_boundaries[q_num]['x_max'], transformed_boundaries[q_num]['y_min'], transformed_boundaries[q_num]['y_max'])
 
                 # Now infer dividers from the transformed boundaries
                 quadrant_data = transformed_boundaries
             else:
-                print(f"    DEBUG: Could not extract enough gate boundaries ({len(gate_boundaries)})")
-                print(f"    DEBUG: Direct boundary extraction failed - cannot infer quadrant dividers")
+                logger.debug("    DEBUG: Could not extract enough gate boundaries (%s)", len(gate_boundaries))
+                logger.debug("    DEBUG: Direct boundary extraction failed - cannot infer quadrant dividers")
                 return None
 
             # quadrant_data now contains the transformed boundaries
             # Continue with divider inference below
             if len(quadrant_data) < 2:
-                print(f"    DEBUG: Could not get data from enough quadrants ({len(quadrant_data)})")
+                logger.debug("    DEBUG: Could not get data from enough quadrants (%s)", len(quadrant_data))
                 return None
 
             # Infer divider positions from quadrant boundaries
@@ -771,54 +1460,40 @@ class FlowAnalyzer:
             
             dividers = []
             
-            # X divider: boundary between Q1/Q4 (X-) and Q2/Q3 (X+)
-            # Should be between max X of Q1/Q4 and min X of Q2/Q3
-            x_negative_max = []  # Q1, Q4
-            x_positive_min = []  # Q2, Q3
+            # X divider: boundary between Q1/Q4 (X-) and Q2/Q3 (X+),
+            # between max X of Q1/Q4 and min X of Q2/Q3.
+            # Y divider: boundary between Q1/Q2 (Y+) and Q3/Q4 (Y-),
+            # between max Y of Q3/Q4 and min Y of Q1/Q2.
+            # A single pass over the quadrants tracks all four extremes.
+            x_negative_max = y_negative_max = -np.inf  # Q1/Q4, Q3/Q4
+            x_positive_min = y_positive_min = np.inf   # Q2/Q3, Q1/Q2
             
             for q_num, data in quadrant_data.items():
-                if q_num in [1, 4]:  # Negative X
-                    x_negative_max.append(data['x_max'])
-                elif q_num in [2, 3]:  # Positive X
-                    x_positive_min.append(data['x_min'])
-            
-            if x_negative_max and x_positive_min:
-                x_divider = (max(x_negative_max) + min(x_positive_min)) / 2.0
-                dividers.append({
-                    'dimension': x_channel,
-                    'value': float(x_divider),
-                    'orientation': 'vertical'
-                })
-                print(f"    DEBUG: Inferred X divider at {x_divider:.2f} for {x_channel}")
-            
-            # Y divider: boundary between Q1/Q2 (Y+) and Q3/Q4 (Y-)
-            # Should be between max Y of Q3/Q4 and min Y of Q1/Q2
-            y_negative_max = []  # Q3, Q4
-            y_positive_min = []  # Q1, Q2
+                if q_num == 1 or q_num == 4:  # Negative X
+                    x_negative_max = max(x_negative_max, data['x_max'])
+                elif q_num == 2 or q_num == 3:  # Positive X
+                    x_positive_min = min(x_positive_min, data['x_min'])
+                if q_num == 3 or q_num == 4:  # Negative Y
+                    y_negative_max = max(y_negative_max, data['y_max'])
+                elif q_num == 1 or q_num == 2:  # Positive Y
+                    y_positive_min = min(y_positive_min, data['y_min'])
             
-            for q_num, data in quadrant_data.items():
-                if q_num in [3, 4]:  # Negative Y
-                    y_negative_max.append(data['y_max'])
-                elif q_num in [1, 2]:  # Positive Y
-                    y_positive_min.append(data['y_min'])
-            
-            if y_negative_max and y_positive_min:
-                y_divider = (max(y_negative_max) + min(y_positive_min)) / 2.0
-                dividers.append({
-                    'dimension': y_channel,
-                    'value': float(y_divider),
-                    'orientation': 'horizontal'
-                })
-                print(f"    DEBUG: Inferred Y divider at {y_divider:.2f} for {y_channel}")
+            if x_negative_max > -np.inf and x_positive_min < np.inf:
+                x_divider = (x_negative_max + x_positive_min) / 2.0
+                dividers.append(Divider(x_channel, float(x_divider), 'vertical'))
+                logger.debug("    DEBUG: Inferred X divider at %.2f for %s", x_divider, x_channel)
+            
+            if y_negative_max > -np.inf and y_positive_min < np.inf:
+                y_divider = (y_negative_max + y_positive_min) / 2.0
+                dividers.append(Divider(y_channel, float(y_divider), 'horizontal'))
+                logger.debug("    DEBUG: Inferred Y divider at %.2f for %s", y_divider, y_channel)
             
             if len(dividers) > 0:
                 return dividers
             else:
                 return None
-        except Exception as e:
-            print(f"    DEBUG: Error in _infer_quadrant_dividers_from_regions: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.debug("    DEBUG: Quadrant divider inference failed for %s at %s", sample_id, gate_path, exc_info=True)
             return None
                     
     
@@ -844,105 +1519,89 @@ class FlowAnalyzer:
         """
         try:
             # Search for a QuadrantGate with dividers at the same path or parent path
-            all_gate_ids = self.workspace.get_gate_ids(sample_id)
-            parent_path = gate_path[:-1] if len(gate_path) > 0 else ()
+            parent_path = gate_path[:-1]
             
             # Debug: Print what gates we're checking
-            print(f"    DEBUG: Searching for QuadrantGate with dividers...")
-            print(f"           Looking at path: {gate_path}")
-            print(f"           Parent path: {parent_path}")
-            print(f"           Channels: {x_channel} × {y_channel}")
+            logger.debug("    DEBUG: Searching for QuadrantGate with dividers...")
+            logger.debug("           Looking at path: %s", gate_path)
+            logger.debug("           Parent path: %s", parent_path)
+            logger.debug("           Channels: %s × %s", x_channel, y_channel)
             
-            # Search at same path level and parent path level
+            # Search at same path level, then parent path level
+            path_index = self._gate_path_index(sample_id)
+            # (name, path, path passed to get_gate) - the get_gate path is fixed per level
+            candidates = [(name, gate_path, parent_path) for name in path_index.get(gate_path, ())]
+            if parent_path != gate_path:
+                candidates += [(name, parent_path, parent_path[:-1]) for name in path_index.get(parent_path, ())]
             checked_gates = []
-            for other_gate_name, other_gate_path in all_gate_ids:
-                # Check gates at same path level OR parent path level
-                if other_gate_path == gate_path or other_gate_path == parent_path:
-                    try:
-                        other_get_gate_path = other_gate_path[:-1] if len(other_gate_path) > 1 else ()
-                        other_gate = self.workspace.get_gate(sample_id, other_gate_name, gate_path=other_get_gate_path)
-                        checked_gates.append((other_gate_name, other_gate_path, hasattr(other_gate, 'dividers')))
-                        
-                        # Check if this gate has dividers and matches our channels
-                        has_dividers = hasattr(other_gate, 'dividers') and len(other_gate.dividers) > 0
-                        if has_dividers:
-                            print(f"    DEBUG: Found gate '{other_gate_name}' with dividers at path {other_gate_path}")
-                            if len(other_gate.dimensions) == 2:
-                                other_dims = [d.id for d in other_gate.dimensions]
-                                if ((other_dims[0] == x_channel and other_dims[1] == y_channel) or
-                                    (other_dims[0] == y_channel and other_dims[1] == x_channel)):
-                                    
-                                    # Extract dividers
-                                    x_threshold = None
-                                    y_threshold = None
-                                    
-                                    divider_list = other_gate.dividers
-                                    for divider in divider_list:
-                                        try:
-                                            # Get divider dimension and value
-                                            divider_dim = None
-                                            divider_value = None
-                                            
-                                            # Try different possible attribute names for dimension reference
-                                            for attr_name in ['dimension_ref', 'dimension', 'dim_ref', 'dim']:
-                                                if hasattr(divider, attr_name):
-                                                    attr_value = getattr(divider, attr_name)
-                                                    if isinstance(attr_value, str):
-                                                        divider_dim = attr_value
-                                                    elif hasattr(attr_value, 'id'):
-                                                        divider_dim = attr_value.id
-                                                    elif hasattr(attr_value, '__str__'):
-                                                        divider_dim = str(attr_value)
-                                                    if divider_dim:
-                                                        break
-                                            
-                                            # Try different possible attribute names for divider value
-                                            for attr_name in ['value', 'position', 'divider_value', 'threshold']:
-                                                if hasattr(divider, attr_name):
-                                                    divider_value = getattr(divider, attr_name)
-                                                    if divider_value is not None:
-                                                        break
+            for other_gate_name, other_gate_path, other_get_gate_path in candidates:
+                try:
+                    other_gate = self._get_gate(sample_id, other_gate_name, gate_path=other_get_gate_path)
+                    is_quadrant = _gate_kind(other_gate) == 'quadrant'
+                    checked_gates.append((other_gate_name, other_gate_path, is_quadrant))
+                    
+                    # Check if this gate has dividers and matches our channels
+                    has_dividers = is_quadrant and len(other_gate.dividers) > 0
+                    if has_dividers:
+                        logger.debug("    DEBUG: Found gate '%s' with dividers at path %s", other_gate_name, other_gate_path)
+                        if len(other_gate.dimensions) == 2:
+                            other_dims = [d.id for d in other_gate.dimensions]
+                            if ((other_dims[0] == x_channel and other_dims[1] == y_channel) or
+                                (other_dims[0] == y_channel and other_dims[1] == x_channel)):
+                                
+                                # Extract dividers
+                                x_threshold = None
+                                y_threshold = None
+                                
+                                divider_list = other_gate.dividers
+                                for divider in divider_list:
+                                    try:
+                                        # Get divider dimension and value (attribute names cached per type)
+                                        divider_dim, divider_value = _resolve_divider(divider)
+                                        
+                                        if divider_dim and divider_value is not None:
+                                            # Convert divider value from display space to raw data space if needed
+                                            try:
+                                                # Divider values might be in display space (0-1) or already in raw space
+                                                if 0 <= divider_value <= 1:
+                                                    divider_value = _disp_to_raw(divider_value)
+                                            except:
+                                                # If conversion fails, use value as-is (might already be in raw space)
+                                                pass
                                             
-                                            if divider_dim and divider_value is not None:
-                                                # Convert divider value from display space to raw data space if needed
-                                                try:
-                                                    # Divider values might be in display space (0-1) or already in raw space
-                                                    if 0 <= divider_value <= 1:
-                                                        # Convert from display space to raw values
-                                                        display_min_log = 0  # log10(1)
-                                                        display_max_log = 5  # log10(100000)
-                                                        divider_value = 10 ** (display_min_log + divider_value * (display_max_log - display_min_log))
-                                                except:
-                                                    # If conversion fails, use value as-is (might already be in raw space)
-                                                    pass
-                                                
-                                                # Assign to x or y threshold based on dimension
-                                                if divider_dim == x_channel:
-                                                    x_threshold = divider_value
-                                                elif divider_dim == y_channel:
-                                                    y_threshold = divider_value
-                                        except Exception as e:
-                                            continue
-                                    
-                                    # Return thresholds if we found both
-                                    if x_threshold is not None and y_threshold is not None:
-                                        return {
-                                            'x_threshold': float(x_threshold),
-                                            'y_threshold': float(y_threshold)
-                                        }
-                    except Exception as e:
-                        continue
+                                            # Assign to x or y threshold based on dimension
+                                            if divider_dim == x_channel:
+                                                x_threshold = divider_value
+                                            elif divider_dim == y_channel:
+                                                y_threshold = divider_value
+                                            if x_threshold is not None and y_threshold is not None:
+                                                break
+                                    except Exception as e:
+                                        logger.debug("    DEBUG: Could not read divider of '%s': %s", other_gate_name, e)
+                                        continue
+                                
+                                # Return thresholds if we found both
+                                if x_threshold is not None and y_threshold is not None:
+                                    return {
+                                        'x_threshold': float(x_threshold),
+                                        'y_threshold': float(y_threshold)
+                                    }
+                except Exception as e:
+                    logger.debug("    DEBUG: Error checking gate '%s': %s", other_gate_name, e)
+                    continue
             
             # Debug output
-            if checked_gates:
-                print(f"    DEBUG: Checked {len(checked_gates)} gates:")
-                for gate_name, gate_path, has_div in checked_gates[:5]:  # Show first 5
-                    print(f"           - '{gate_name}' at {gate_path}: has_dividers={has_div}")
-            else:
-                print(f"    DEBUG: No gates found at path {gate_path} or parent path {parent_path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                if checked_gates:
+                    logger.debug("    DEBUG: Checked %s gates:", len(checked_gates))
+                    for gate_name, gate_path, has_div in checked_gates[:5]:  # Show first 5
+                        logger.debug("           - '%s' at %s: has_dividers=%s", gate_name, gate_path, has_div)
+                else:
+                    logger.debug("    DEBUG: No gates found at path %s or parent path %s", gate_path, parent_path)
             
             return None
-        except Exception as e:
+        except Exception:
+            logger.debug("    DEBUG: Quadrant threshold lookup failed for %s at %s", sample_id, gate_path, exc_info=True)
             return None
     
     def _extract_gate_polygons(self, sample_id, x_channel, y_channel):
@@ -966,121 +1625,120 @@ class FlowAnalyzer:
                 - 'xs': List of X coordinates (for polygon/rectangle gates)
                 - 'ys': List of Y coordinates (for polygon/rectangle gates)
                 - 'dividers': List of dividers (for quadrant gates)
+            The list is cached per (sample, channels) and shared between callers, so
+            treat it as read-only.
         """
+        key = (sample_id, x_channel, y_channel)
+        gates_data = self._gate_polygons_cache.get(key)
+        if gates_data is None:
+            gates_data = self._compute_gate_polygons(sample_id, x_channel, y_channel)
+            self._gate_polygons_cache[key] = gates_data
+        return gates_data
+
+    def _compute_gate_polygons(self, sample_id, x_channel, y_channel):
+        """Build the _extract_gate_polygons() result for one sample and channel pair, uncached."""
         gates_data = []
-        gate_ids = self.workspace.get_gate_ids(sample_id)
+        # (gates_data entry, vertices, vertices are in display space) for polygon gates,
+        # converted to raw values together after the loop
+        polygons = []
         
-        for gate_name, gate_path in gate_ids:
+        # Only gates drawn on our axes (in either order) are visited
+        for gate_name, gate_path in self._gates_on_axes(sample_id, x_channel, y_channel):
             try:
-                gate = self.workspace.get_gate(sample_id, gate_name, gate_path=gate_path[:-1] if len(gate_path) > 1 else ())
-                # Check dimensions
-                if len(gate.dimensions) == 2:
-                    dims = [d.id for d in gate.dimensions]  # Channel names
-                    
-                    # Only include gates that match our axes (in either order)
-                    if (dims[0] == x_channel and dims[1] == y_channel) or \
-                       (dims[0] == y_channel and dims[1] == x_channel):
-                        
-                        # Check if this is a quadrant gate first
-                        if hasattr(gate, 'dividers') and hasattr(gate, 'quadrants'):
-                            quadrant_gate = self._extract_quadrant_gate(sample_id, gate_name, gate_path, x_channel, y_channel)
-                            if quadrant_gate:
-                                gates_data.append(quadrant_gate)
-                                continue
-                        
-                        # Get vertices for polygon/rectangle gates
-                        xs = []
-                        ys = []
-                        
-                        if hasattr(gate, 'vertices'):
-                            # Polygon gate
-                            verts = np.array(gate.vertices)
+                gate, dims, _ = self._gate_summary(sample_id, gate_name, gate_path)
+                
+                # Check if this is a quadrant gate first
+                kind = _gate_kind(gate)
+                if kind == 'quadrant' and hasattr(gate, 'quadrants'):
+                    quadrant_gate = self._extract_quadrant_gate(sample_id, gate_name, gate_path, x_channel, y_channel)
+                    if quadrant_gate:
+                        gates_data.append(quadrant_gate)
+                        continue
+                
+                # Get vertices for polygon/rectangle gates
+                xs = []
+                ys = []
+                
+                if kind == 'polygon':
+                    # Polygon gate
+                    verts = np.asarray(gate.vertices, dtype=np.float64)
+                    if verts.ndim != 2 or verts.shape[1] != 2:
+                        raise ValueError(f"unexpected vertex array shape {verts.shape}")
+                    if len(verts) == 0:
+                        continue
 
-                            # Gate vertices are in transformed space, convert to raw data coordinates
-                            try:
-                                # Get the transforms from the workspace
-                                x_transform = self.workspace.get_transform(sample_id, dims[0])
-                                y_transform = self.workspace.get_transform(sample_id, dims[1])
-
-                                print(f"    DEBUG (_extract_gate_polygons): Gate '{gate_name}'")
-                                print(f"           Original verts range: X=[{verts[:, 0].min():.4f}, {verts[:, 0].max():.4f}], Y=[{verts[:, 1].min():.4f}, {verts[:, 1].max():.4f}]")
-                                print(f"           X transform: {x_transform}")
-                                print(f"           Y transform: {y_transform}")
-
-                                # Gate vertices are in DISPLAY SPACE (0-1 normalized over visible range)
-                                # NOT in transform space! We need to map to the display range.
-                                # FlowJo typically displays log scale from 10^0 to 10^5 (1 to 100,000)
-
-                                # Map from display space (0-1) to raw values
-                                display_min_log = 0  # log10(1)
-                                display_max_log = 5  # log10(100000)
-
-                                # Convert normalized display coordinates to log space, then to linear
-                                xs = (10 ** (display_min_log + verts[:, 0] * (display_max_log - display_min_log))).tolist()
-                                ys = (10 ** (display_min_log + verts[:, 1] * (display_max_log - display_min_log))).tolist()
-
-                                print(f"           Mapped from display space (0-1) to raw values")
-                                print(f"           X: [{min(xs):.2f}, {max(xs):.2f}]")
-                                print(f"           Y: [{min(ys):.2f}, {max(ys):.2f}]")
-                            except Exception as e:
-                                print(f"    DEBUG: Transform failed: {e}")
-                                import traceback
-                                traceback.print_exc()
-                                # Fall back to original vertices
-                                xs = verts[:, 0].tolist()
-                                ys = verts[:, 1].tolist()
-
-                            # Close the loop
-                            xs.append(xs[0])
-                            ys.append(ys[0])
-                        elif hasattr(gate, 'min') and hasattr(gate, 'max'):
-                            # Rectangle gate - create polygon from min/max
-                            try:
-                                min_x = None
-                                min_y = None
-                                max_x = None
-                                max_y = None
-                                
-                                if isinstance(gate.min, dict):
-                                    min_x = gate.min.get(dims[0], None)
-                                    min_y = gate.min.get(dims[1], None)
-                                elif hasattr(gate.min, '__getitem__'):
-                                    try:
-                                        min_x = gate.min[0]
-                                        min_y = gate.min[1] if len(gate.min) > 1 else gate.min[0]
-                                    except:
-                                        pass
-                                
-                                if isinstance(gate.max, dict):
-                                    max_x = gate.max.get(dims[0], None)
-                                    max_y = gate.max.get(dims[1], None)
-                                elif hasattr(gate.max, '__getitem__'):
-                                    try:
-                                        max_x = gate.max[0]
-                                        max_y = gate.max[1] if len(gate.max) > 1 else gate.max[0]
-                                    except:
-                                        pass
-                                
-                                if min_x is not None and max_x is not None and min_y is not None and max_y is not None:
-                                    # Create rectangle polygon (closed loop)
-                                    xs = [float(min_x), float(max_x), float(max_x), float(min_x), float(min_x)]
-                                    ys = [float(min_y), float(min_y), float(max_y), float(max_y), float(min_y)]
-                            except Exception as e:
-                                # If rectangle extraction fails, skip this gate
-                                pass
+                    # Gate vertices are in transformed space, convert to raw data coordinates
+                    try:
+                        # Get the transforms from the workspace
+                        x_transform = self.workspace.get_transform(sample_id, dims[0])
+                        y_transform = self.workspace.get_transform(sample_id, dims[1])
+
+                        if logger.isEnabledFor(logging.DEBUG):
+                            lo, hi = verts.min(axis=0), verts.max(axis=0)
+                            logger.debug("    DEBUG (_extract_gate_polygons): Gate '%s'", gate_name)
+                            logger.debug("           Original verts range: X=[%.4f, %.4f], Y=[%.4f, %.4f]", lo[0], hi[0], lo[1], hi[1])
+                            logger.debug("           X transform: %s", x_transform)
+                            logger.debug("           Y transform: %s", y_transform)
+                        in_display_space = True
+                    except Exception:
+                        logger.debug("    DEBUG: Transform failed for gate '%s'", gate_name, exc_info=True)
+                        # Fall back to original vertices
+                        in_display_space = False
+
+                    entry = {
+                        'name': gate_name,
+                        'type': kind,
+                        'x_dim': dims[0],
+                        'y_dim': dims[1],
+                    }
+                    gates_data.append(entry)
+                    polygons.append((entry, verts, in_display_space))
+                    continue
+                elif kind == 'rectangle':
+                    # Rectangle gate - create polygon from min/max
+                    try:
+                        min_x, min_y = _rect_bound_pair(gate.min, dims)
+                        max_x, max_y = _rect_bound_pair(gate.max, dims)
                         
-                        if xs and ys:
-                            gates_data.append({
-                                'name': gate_name,
-                                'type': 'polygon' if hasattr(gate, 'vertices') else 'rectangle',
-                                'x_dim': dims[0],
-                                'y_dim': dims[1],
-                                'xs': xs,
-                                'ys': ys
-                            })
+                        if min_x is not None and max_x is not None and min_y is not None and max_y is not None:
+                            # Create rectangle polygon (closed loop)
+                            xs = np.array([min_x, max_x, max_x, min_x, min_x], dtype=np.float64)
+                            ys = np.array([min_y, min_y, max_y, max_y, min_y], dtype=np.float64)
+                    except Exception as e:
+                        # If rectangle extraction fails, skip this gate
+                        pass
+                
+                if len(xs) and len(ys):
+                    gates_data.append({
+                        'name': gate_name,
+                        'type': kind,
+                        'x_dim': dims[0],
+                        'y_dim': dims[1],
+                        'xs': xs,
+                        'ys': ys
+                    })
             except Exception as e:
                 # Log error but continue processing other gates
                 print(f"    Warning: Could not extract gate '{gate_name}' for channels {x_channel}, {y_channel}: {e}")
+
+        # Polygon vertices are in DISPLAY SPACE (0-1 normalized over the visible range),
+        # NOT in transform space! Map and close every polygon of the sample in one buffer.
+        raw_closed = iter(_closed_raw_polygons(
+            [verts for _, verts, in_display_space in polygons if in_display_space]))
+        for entry, verts, in_display_space in polygons:
+            if in_display_space:
+                closed = next(raw_closed)
+                if logger.isEnabledFor(logging.DEBUG):
+                    lo, hi = closed.min(axis=0), closed.max(axis=0)
+                    logger.debug("           '%s' mapped from display space (0-1) to raw values", entry['name'])
+                    logger.debug("           X: [%.2f, %.2f]", lo[0], hi[0])
+                    logger.debug("           Y: [%.2f, %.2f]", lo[1], hi[1])
+            else:
+                # Close the loop on the untransformed vertices
+                closed = np.vstack([verts, verts[:1]])
+            # xs/ys stay arrays (views into the closed polygon)
+            entry['xs'] = closed[:, 0]
+            entry['ys'] = closed[:, 1]
         return gates_data
 
     def _extract_selected_gate(self, sample_id, gate_name, gate_path, x_channel, y_channel):
@@ -1101,15 +1759,23 @@ class FlowAnalyzer:
                 - 'type': 'polygon' or 'rectangle'
                 - 'x_dim': X-axis channel name
                 - 'y_dim': Y-axis channel name
-                - 'xs': List of X coordinates
-                - 'ys': List of Y coordinates
+                - 'xs': X coordinates (array for polygons, list for rectangles)
+                - 'ys': Y coordinates (array for polygons, list for rectangles)
                 For quadrant gates:
                 - 'name': Gate name
                 - 'type': 'quadrant'
                 - 'x_dim': X-axis channel name
                 - 'y_dim': Y-axis channel name
-                - 'dividers': List of divider dictionaries
+                - 'dividers': List of Divider tuples
+            Results (including None) are cached per arguments; treat them as read-only.
         """
+        key = (sample_id, gate_name, gate_path, x_channel, y_channel)
+        if key not in self._selected_gate_cache:
+            self._selected_gate_cache[key] = self._compute_selected_gate(*key)
+        return self._selected_gate_cache[key]
+
+    def _compute_selected_gate(self, sample_id, gate_name, gate_path, x_channel, y_channel):
+        """Build the _extract_selected_gate() result for one gate and channel pair, uncached."""
         try:
             # Handle "Ungated" case
             if gate_name == "Ungated":
@@ -1117,161 +1783,124 @@ class FlowAnalyzer:
 
             # Get the gate using the parent path
             get_gate_path = gate_path[:-1] if len(gate_path) > 1 else ()
-            print(f"    DEBUG: Getting gate '{gate_name}' with gate_path={get_gate_path}")
-            gate = self.workspace.get_gate(sample_id, gate_name, gate_path=get_gate_path)
+            logger.debug("    DEBUG: Getting gate '%s' with gate_path=%s", gate_name, get_gate_path)
+            gate = self._get_gate(sample_id, gate_name, gate_path=get_gate_path)
 
             # Check if gate is 2D and matches our channels
             if len(gate.dimensions) != 2:
-                print(f"    DEBUG: Gate is {len(gate.dimensions)}D, not 2D")
+                logger.debug("    DEBUG: Gate is %sD, not 2D", len(gate.dimensions))
                 return None
 
-            dims = [d.id for d in gate.dimensions]  # Channel names
-            print(f"    DEBUG: Gate dimensions: {dims}")
-            print(f"    DEBUG: Expected channels: [{x_channel}, {y_channel}]")
+            dims = tuple(d.id for d in gate.dimensions)  # Channel names
+            x_dim, y_dim = dims
+            logger.debug("    DEBUG: Gate dimensions: %s", dims)
+            logger.debug("    DEBUG: Expected channels: [%s, %s]", x_channel, y_channel)
 
             # Check if gate matches our axes (in either order)
-            if not ((dims[0] == x_channel and dims[1] == y_channel) or
-                   (dims[0] == y_channel and dims[1] == x_channel)):
-                print(f"    DEBUG: Channel mismatch!")
+            if not ((x_dim == x_channel and y_dim == y_channel) or
+                   (x_dim == y_channel and y_dim == x_channel)):
+                logger.debug("    DEBUG: Channel mismatch!")
                 return None
             
-            # Check if this is a quadrant gate first (comprehensive detection)
-            is_quadrant = False
-            
-            # Method 1: Check for dividers/quadrants attributes
-            if hasattr(gate, 'dividers') and hasattr(gate, 'quadrants'):
-                if len(gate.dividers) > 0 or len(gate.quadrants) > 0:
-                    is_quadrant = True
-            elif hasattr(gate, 'dividers') and len(gate.dividers) > 0:
-                is_quadrant = True
-            elif hasattr(gate, 'quadrants') and len(gate.quadrants) > 0:
-                is_quadrant = True
-            
-            # Method 2: Check gate class name
-            if not is_quadrant:
-                try:
-                    gate_class_name = gate.__class__.__name__
-                    if 'Quadrant' in gate_class_name:
-                        is_quadrant = True
-                except:
-                    pass
-            
-            # Method 2b: Try isinstance check with flowkit gates
-            if not is_quadrant:
-                try:
-                    import flowkit.gates as fk_gates
-                    if isinstance(gate, (fk_gates.QuadrantGate, fk_gates.Quadrant)):
-                        is_quadrant = True
-                except (ImportError, AttributeError):
-                    pass
-            
-            # Method 3: Heuristic based on gate name pattern (Q1:, Q2:, etc.)
-            if not is_quadrant:
-                try:
-                    if gate_name.startswith('Q') and ':' in gate_name:
-                        # Check if it's Q followed by a number
-                        import re
-                        if re.match(r'^Q\d+:', gate_name):
-                            # Also check that it doesn't have vertices (polygon) or min/max (rectangle)
-                            has_vertices = hasattr(gate, 'vertices') and len(gate.vertices) > 0
-                            has_min_max = (hasattr(gate, 'min') and hasattr(gate, 'max'))
-                            if not has_vertices and not has_min_max:
-                                is_quadrant = True
-                except:
-                    pass
+            # Probe each gate attribute once; the results are reused by every branch below
+            dividers = getattr(gate, 'dividers', _MISSING)
+            quadrants = getattr(gate, 'quadrants', _MISSING)
+            vertices = getattr(gate, 'vertices', _MISSING)
+            gate_min = getattr(gate, 'min', _MISSING)
+            gate_max = getattr(gate, 'max', _MISSING)
+            has_vertices = vertices is not _MISSING
+            has_min_max = gate_min is not _MISSING and gate_max is not _MISSING
+            # Shape drawn when this is not a quadrant gate; also the 'type' of the result
+            if has_vertices:
+                gate_type = 'polygon'
+            elif has_min_max:
+                gate_type = 'rectangle'
+            else:
+                gate_type = None
+
+            # Check if this is a quadrant gate first (comprehensive detection). The checks
+            # short-circuit cheapest first: dividers/quadrants attributes (every flowkit
+            # QuadrantGate), the flowkit classes, the class name, and only then the
+            # Q1:/Q2:... name heuristic for region gates without vertices or min/max
+            is_quadrant = (
+                (dividers is not _MISSING and len(dividers) > 0)
+                or (quadrants is not _MISSING and len(quadrants) > 0)
+                or isinstance(gate, _flowkit_quadrant_types())
+                or 'Quadrant' in type(gate).__name__
+                or (_Q_RE.match(gate_name) is not None
+                    and not (has_vertices and len(vertices) > 0) and not has_min_max)
+            )
             
             if is_quadrant:
                 quadrant_gate = self._extract_quadrant_gate(sample_id, gate_name, gate_path, x_channel, y_channel)
                 if quadrant_gate:
-                    print(f"    DEBUG: Extracted quadrant gate '{gate_name}' with {len(quadrant_gate['dividers'])} divider(s)")
+                    logger.debug("    DEBUG: Extracted quadrant gate '%s' with %s divider(s)", gate_name, len(quadrant_gate['dividers']))
                     return quadrant_gate
                 else:
-                    print(f"    DEBUG: Detected as quadrant but extraction failed")
+                    logger.debug("    DEBUG: Detected as quadrant but extraction failed")
             
             # Get vertices for polygon/rectangle gates
             xs = []
             ys = []
             
-            if hasattr(gate, 'vertices'):
-                # Polygon gate
-                verts = np.array(gate.vertices)
+            if gate_type == 'polygon':
+                verts = np.asarray(vertices, dtype=np.float64)
+                n_verts = len(verts)
+                # One buffer for the mapped vertices plus the closing point
+                closed = np.empty((n_verts + 1, 2))
+                raw = closed[:n_verts]
 
                 # Gate vertices are in transformed space, but we need raw data coordinates
-                # Get the sample to access transforms
-                sample = self.workspace.get_sample(sample_id)
-
                 # Get transforms for the channels
                 try:
                     # Apply inverse transform to convert from display coordinates to raw values
                     # The vertices are in transformed/display space (0-1 or similar)
                     # We need to convert them to raw data space
 
-                    # Get channel indices
-                    x_channel_idx = sample.pnn_labels.index(dims[0])
-                    y_channel_idx = sample.pnn_labels.index(dims[1])
+                    # Get channel indices (raises if the sample lacks either channel)
+                    channel_index = self._channel_index(sample_id)
+                    x_channel_idx = channel_index[x_dim]
+                    y_channel_idx = channel_index[y_dim]
 
                     # Gate vertices are in DISPLAY SPACE (0-1 normalized over visible range)
                     # NOT in transform space! We need to map to the display range.
                     # FlowJo typically displays log scale from 10^0 to 10^5 (1 to 100,000)
 
-                    # Map from display space (0-1) to raw values
-                    display_min_log = 0  # log10(1)
-                    display_max_log = 5  # log10(100000)
+                    # Map from display space (0-1) to raw values: both columns in one
+                    # vectorized exponentiation, written straight into the buffer
+                    np.power(_DISPLAY_TO_RAW_BASE, verts, out=raw)
 
-                    # Convert normalized display coordinates to log space, then to linear
-                    xs = (10 ** (display_min_log + verts[:, 0] * (display_max_log - display_min_log))).tolist()
-                    ys = (10 ** (display_min_log + verts[:, 1] * (display_max_log - display_min_log))).tolist()
-
-                    print(f"    DEBUG: Mapped gate from display space to raw values")
-                    print(f"           X: [{min(xs):.2f}, {max(xs):.2f}]")
-                    print(f"           Y: [{min(ys):.2f}, {max(ys):.2f}]")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        raw_min = raw.min(axis=0)
+                        raw_max = raw.max(axis=0)
+                        logger.debug("    DEBUG: Mapped gate from display space to raw values")
+                        logger.debug("           X: [%.2f, %.2f]", raw_min[0], raw_max[0])
+                        logger.debug("           Y: [%.2f, %.2f]", raw_min[1], raw_max[1])
                 except Exception as e:
-                    print(f"    DEBUG: Could not apply inverse transform: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.debug("    DEBUG: Could not apply inverse transform: %s", e, exc_info=True)
                     # Fall back to original vertices
-                    xs = verts[:, 0].tolist()
-                    ys = verts[:, 1].tolist()
-
-                # Close the loop
-                xs.append(xs[0])
-                ys.append(ys[0])
-            elif hasattr(gate, 'min') and hasattr(gate, 'max'):
-                # Rectangle gate - create polygon from min/max
+                    raw[:] = verts
+
+                # Close the loop; without vertices there is nothing to close (and closed[0]
+                # is still uninitialized), so xs/ys stay empty
+                if n_verts:
+                    closed[n_verts] = closed[0]
+                    xs = closed[:, 0]
+                    ys = closed[:, 1]
+            elif gate_type == 'rectangle':
+                # Create polygon from min/max
                 try:
-                    min_x = None
-                    min_y = None
-                    max_x = None
-                    max_y = None
-                    
-                    if isinstance(gate.min, dict):
-                        min_x = gate.min.get(dims[0], None)
-                        min_y = gate.min.get(dims[1], None)
-                    elif hasattr(gate.min, '__getitem__'):
-                        try:
-                            min_x = gate.min[0]
-                            min_y = gate.min[1] if len(gate.min) > 1 else gate.min[0]
-                        except:
-                            pass
-                    
-                    if isinstance(gate.max, dict):
-                        max_x = gate.max.get(dims[0], None)
-                        max_y = gate.max.get(dims[1], None)
-                    elif hasattr(gate.max, '__getitem__'):
-                        try:
-                            max_x = gate.max[0]
-                            max_y = gate.max[1] if len(gate.max) > 1 else gate.max[0]
-                        except:
-                            pass
+                    min_x, min_y = _rect_bound_pair(gate_min, dims)
+                    max_x, max_y = _rect_bound_pair(gate_max, dims)
                     
                     if min_x is not None and max_x is not None and min_y is not None and max_y is not None:
                         # Create rectangle polygon (closed loop)
-                        xs = [float(min_x), float(max_x), float(max_x), float(min_x), float(min_x)]
-                        ys = [float(min_y), float(min_y), float(max_y), float(max_y), float(min_y)]
+                        xs = np.array([min_x, max_x, max_x, min_x, min_x], dtype=np.float64)
+                        ys = np.array([min_y, min_y, max_y, max_y, min_y], dtype=np.float64)
                 except Exception:
                     pass
             
-            if xs and ys:
+            if len(xs) and len(ys):
                 # Validate coordinates before returning
                 if len(xs) != len(ys):
                     print(f"    ⚠️  Warning: Gate '{gate_name}' has mismatched coordinates (xs={len(xs)}, ys={len(ys)})")
@@ -1281,15 +1910,18 @@ class FlowAnalyzer:
                     return None
 
                 # Show coordinate ranges for debugging
-                print(f"    DEBUG: Gate '{gate_name}' coordinates:")
-                print(f"           X range: [{min(xs):.2f}, {max(xs):.2f}]")
-                print(f"           Y range: [{min(ys):.2f}, {max(ys):.2f}]")
+                if logger.isEnabledFor(logging.DEBUG):
+                    bounds = np.array([xs, ys], dtype=np.float64)
+                    lo, hi = bounds.min(axis=1), bounds.max(axis=1)
+                    logger.debug("    DEBUG: Gate '%s' coordinates:", gate_name)
+                    logger.debug("           X range: [%.2f, %.2f]", lo[0], hi[0])
+                    logger.debug("           Y range: [%.2f, %.2f]", lo[1], hi[1])
 
                 return {
                     'name': gate_name,
-                    'type': 'polygon' if hasattr(gate, 'vertices') else 'rectangle',
-                    'x_dim': dims[0],
-                    'y_dim': dims[1],
+                    'type': gate_type,
+                    'x_dim': x_dim,
+                    'y_dim': y_dim,
                     'xs': xs,
                     'ys': ys
                 }
@@ -1344,7 +1976,7 @@ class FlowAnalyzer:
         for i, group_name in enumerate(self.sample_groups, 1):
             # Count samples in this group
             try:
-                group_samples = self.workspace.get_sample_ids(group_name, loaded_only=True)
+                group_samples = self._group_sample_ids(group_name)
                 print(f"  {i}. {group_name} ({len(group_samples)} samples)")
             except:
                 print(f"  {i}. {group_name}")
@@ -1379,14 +2011,13 @@ class FlowAnalyzer:
         all_sample_ids = []
         for group in selected_groups:
             try:
-                group_samples = self.workspace.get_sample_ids(group, loaded_only=True)
+                group_samples = self._group_sample_ids(group)
                 all_sample_ids.extend(group_samples)
             except Exception as e:
                 print(f"Warning: Could not get samples from group '{group}': {e}")
         
         # Remove duplicates while preserving order
-        seen = set()
-        all_sample_ids = [sid for sid in all_sample_ids if not (sid in seen or seen.add(sid))]
+        all_sample_ids = list(dict.fromkeys(all_sample_ids))
         
         if not all_sample_ids:
             print("No samples found in selected groups.")
@@ -1502,7 +2133,7 @@ class FlowAnalyzer:
                 first_sample_id = all_sample_ids[0] if all_sample_ids else None
                 if first_sample_id:
                     try:
-                        sample_keywords = self.workspace.get_keywords(first_sample_id)
+                        sample_keywords = self._sample_keywords(first_sample_id)
                         if sample_keywords:
                             keyword_list = list(sample_keywords.keys())
                             print("\nAvailable keywords:")
@@ -1564,11 +2195,11 @@ class FlowAnalyzer:
         
         while True:
             filter_choice = input("\nFilter by keyword? (yes/no): ").strip().lower()
-            if filter_choice in ['yes', 'y']:
+            if filter_choice in _YES:
                 # Get keywords from first sample (should be universal)
                 first_sample_id = all_sample_ids[0]
                 try:
-                    keywords = self.workspace.get_keywords(first_sample_id)
+                    keywords = self._sample_keywords(first_sample_id)
                     
                     if not keywords:
                         print("No keywords found in samples. Skipping keyword filter.")
@@ -1608,23 +2239,21 @@ class FlowAnalyzer:
                         except KeyboardInterrupt:
                             return None
                     
-                    # Get unique values for this keyword across all samples
-                    # Store both original and normalized (stripped) versions
-                    unique_values_dict = {}  # normalized -> original
-                    for sid in all_sample_ids:
-                        try:
-                            kw = self.workspace.get_keywords(sid)
-                            if selected_key in kw:
-                                orig_value = str(kw[selected_key])
-                                normalized = orig_value.strip()
-                                unique_values_dict[normalized] = orig_value
-                        except:
-                            pass
+                    # Get unique values for this keyword across all samples, compared by
+                    # their normalized (stripped) form
+                    keywords_df = self._keywords_frame().reindex(all_sample_ids)
+                    if selected_key in keywords_df.columns:
+                        sample_values = keywords_df[selected_key].dropna().astype(str)
+                    else:
+                        sample_values = pd.Series(dtype=str)
+                    # One pass builds both the value listing and the reverse index used to filter
+                    value_to_sids = sample_values.index.groupby(sample_values.str.strip())  # normalized -> sample IDs
                     
-                    unique_values_normalized = sorted(list(unique_values_dict.keys()))
+                    unique_values_normalized = sorted(value_to_sids)
                     # Display with quotes around values
-                    values_display = [f"'{v}'" for v in unique_values_normalized]
-                    print(f"\nAvailable values for '{selected_key}': {', '.join(values_display)}")
+                    # Rendered once; the retry message below reuses the same string
+                    values_display = ', '.join(f"'{v}'" for v in unique_values_normalized)
+                    print(f"\nAvailable values for '{selected_key}': {values_display}")
                     
                     # Prompt for value
                     while True:
@@ -1636,21 +2265,12 @@ class FlowAnalyzer:
                         filter_value_normalized = filter_value_input.strip()
                         
                         # Check if normalized value matches any unique value
-                        if filter_value_normalized in unique_values_normalized:
+                        if filter_value_normalized in value_to_sids:
                             # Use the normalized value for filtering
                             keyword_filter = {'key': selected_key, 'value': filter_value_normalized}
                             
                             # Filter sample IDs (compare with normalized values)
-                            filtered_sample_ids = []
-                            for sid in all_sample_ids:
-                                try:
-                                    kw = self.workspace.get_keywords(sid)
-                                    if selected_key in kw:
-                                        sample_value_normalized = str(kw[selected_key]).strip()
-                                        if sample_value_normalized == filter_value_normalized:
-                                            filtered_sample_ids.append(sid)
-                                except:
-                                    pass
+                            filtered_sample_ids = value_to_sids[filter_value_normalized].tolist()
                             
                             if not filtered_sample_ids:
                                 print(f"Warning: No samples found with {selected_key} = '{filter_value_normalized}'")
@@ -1660,7 +2280,7 @@ class FlowAnalyzer:
                             print(f"Filtered to {len(filtered_sample_ids)} samples with {selected_key} = '{filter_value_normalized}'")
                             break
                         else:
-                            print(f"Value '{filter_value_input}' not found. Available: {', '.join(values_display)}")
+                            print(f"Value '{filter_value_input}' not found. Available: {values_display}")
                             print("Or type 'all' to skip filtering.")
                     
                     break
@@ -1668,7 +2288,7 @@ class FlowAnalyzer:
                     print(f"Error getting keywords: {e}")
                     print("Skipping keyword filter.")
                     break
-            elif filter_choice in ['no', 'n']:
+            elif filter_choice in _NO:
                 break
             else:
                 print("Please enter 'yes' or 'no'")
@@ -1705,7 +2325,7 @@ class FlowAnalyzer:
                 # Get keywords from first sample
                 first_sample_id = sample_ids[0]
                 try:
-                    keywords = self.workspace.get_keywords(first_sample_id)
+                    keywords = self._sample_keywords(first_sample_id)
                     
                     if not keywords:
                         print("No keywords found. Falling back to auto mode.")
@@ -1723,60 +2343,45 @@ class FlowAnalyzer:
                         try:
                             key_choice = input(f"\nSelect keyword for well ID (1-{len(keyword_list)}) or type name: ").strip()
                             
-                            # Try as number first
-                            try:
+                            if key_choice.isdecimal():
                                 key_idx = int(key_choice) - 1
                                 if 0 <= key_idx < len(keyword_list):
                                     well_id_keyword = keyword_list[key_idx][0]
                                     break
-                                else:
-                                    print(f"Please enter a number between 1 and {len(keyword_list)}")
-                            except ValueError:
-                                # Try as keyword name (case-insensitive partial match)
-                                selected_key = None
-                                for key, _ in keyword_list:
-                                    if key_choice.lower() in key.lower() or key.lower() in key_choice.lower():
-                                        selected_key = key
-                                        break
-                                
-                                if selected_key:
-                                    well_id_keyword = selected_key
+                                print(f"Please enter a number between 1 and {len(keyword_list)}")
+                                continue
+                            # Try as keyword name (case-insensitive partial match)
+                            query = key_choice.lower()
+                            selected_key = None
+                            for key, _ in keyword_list:
+                                key_lower = key.lower()
+                                if query in key_lower or key_lower in query:
+                                    selected_key = key
                                     break
-                                else:
-                                    print(f"Keyword '{key_choice}' not found. Please try again.")
+                            
+                            if selected_key:
+                                well_id_keyword = selected_key
+                                break
+                            print(f"Keyword '{key_choice}' not found. Please try again.")
                         except KeyboardInterrupt:
                             return None
                     
                     # Validate: Test the selected keyword on all samples and list matched well IDs
-                    print(f"\nValidating well ID extraction using keyword '{well_id_keyword}'...")
-                    matched_well_ids = []
-                    samples_with_well_ids = []
-                    
-                    for sid in sample_ids:
-                        try:
-                            sample = self.workspace.get_sample(sid)
-                            # Pass sample_id to parse_well_id so it can use workspace.get_keywords()
-                            r, c, method = self.parse_well_id(sample, source='keyword', keyword_name=well_id_keyword, return_method=True, sample_id=sid)
-                            if r and c:
-                                well_id = f"{r}{c:02d}"
-                                if well_id not in matched_well_ids:
-                                    matched_well_ids.append(well_id)
-                                samples_with_well_ids.append((sid, well_id))
-                        except Exception as e:
-                            # Debug: print error for first few failures to help diagnose
-                            if len(samples_with_well_ids) < 3:
-                                print(f"    Debug: Failed to parse well ID for {sid}: {e}")
-                            pass
+                    print(f"\nValidating well ID extraction using keyword '{well_id_keyword}' on {len(sample_ids)} samples...", flush=True)
+                    # One batch pass over all samples' keyword values (the same call, and cached
+                    # result, that generate_interactive_plots uses for these samples)
+                    wells = self.parse_well_ids_batch(sample_ids, source='keyword', keyword_name=well_id_keyword)
+                    wells = wells[wells['code'] >= 0]
+                    # Format and deduplicate the well labels column-wise ('A' + '01')
+                    well_labels = wells['row'] + wells['col'].astype(int).astype(str).str.zfill(2)
+                    matched_well_ids = sorted(well_labels.unique())
                     
                     # Display results
                     if matched_well_ids:
-                        matched_well_ids.sort()  # Sort for easier reading
-                        print(f"\n✓ Found {len(matched_well_ids)} unique well IDs from {len(samples_with_well_ids)} samples:")
-                        # Display in rows of 12 (like a 96-well plate)
-                        for i in range(0, len(matched_well_ids), 12):
-                            row = matched_well_ids[i:i+12]
-                            print(f"  {', '.join(row)}")
-                        print()
+                        print(f"\n✓ Found {len(matched_well_ids)} unique well IDs from {len(wells)} samples:")
+                        # Display in rows of 12 (like a 96-well plate), written in one call
+                        print("\n".join(f"  {', '.join(matched_well_ids[i:i+12])}"
+                                        for i in range(0, len(matched_well_ids), 12)) + "\n")
                     else:
                         print(f"\n✗ ERROR: No well IDs could be extracted using keyword '{well_id_keyword}'")
                         print("Please check that:")
@@ -1800,22 +2405,27 @@ class FlowAnalyzer:
         # Collect plot configurations
         plot_configs = []
         
+        # Use first sample to get gate structure; it is the same for every plot configuration
+        first_sample_id = sample_ids[0]
+        gates_by_path = self._get_all_gates_info(first_sample_id)
+        path_list = sorted(gates_by_path)
+        # The gate path menu is the same for every plot configuration; build its text once
+        path_menu = "\n".join(
+            f"{i}. {_format_gate_path(path)} (gates: {', '.join(g[0] for g in gates_by_path[path])})"
+            for i, path in enumerate(path_list, 1)
+        )
+        # (x, y, selected gate name, selected gate path) -> (gate names, gate data) offered for overlay
+        gate_listings = {}
+        
         for plot_num in range(1, num_plots + 1):
             if num_plots > 1:
                 print("\n" + "="*60)
                 print(f"Plot Configuration {plot_num} of {num_plots}")
                 print("="*60)
             
-            # Use first sample to get gate structure
-            first_sample_id = sample_ids[0]
-            gates_by_path = self._get_all_gates_info(first_sample_id)
-            
             # Display available gate paths
             print("\nAvailable Gate Paths:")
-            path_list = sorted(gates_by_path.keys())
-            for i, path in enumerate(path_list, 1):
-                gate_names = [g[0] for g in gates_by_path[path]]
-                print(f"{i}. {path} (gates: {', '.join(gate_names)})")
+            print(path_menu)
             
             # Prompt for gate path selection
             while True:
@@ -1823,7 +2433,7 @@ class FlowAnalyzer:
                     path_choice = input(f"\nSelect gate path (1-{len(path_list)}): ").strip()
                     path_idx = int(path_choice) - 1
                     if 0 <= path_idx < len(path_list):
-                        selected_path_str = path_list[path_idx]
+                        selected_path = path_list[path_idx]
                         break
                     else:
                         print(f"Please enter a number between 1 and {len(path_list)}")
@@ -1831,23 +2441,22 @@ class FlowAnalyzer:
                     print("Please enter a valid number")
             
             # Get gate names for selected path
-            gate_options = gates_by_path[selected_path_str]
-            print(f"\nAvailable gates in path '{selected_path_str}':")
+            gate_options = gates_by_path[selected_path]
+            print(f"\nAvailable gates in path '{_format_gate_path(selected_path)}':")
             
             # Check if this path has a parent (not root)
             use_parent_option = False
             parent_gate_name = None
             parent_gate_path = None
             
-            if selected_path_str != "root":
+            if selected_path != _ROOT_PATH:
                 # Find the parent gate by looking at the path structure
                 # e.g., "root → Cells → Singlets" has parent "Singlets" at "root → Cells"
-                path_parts = selected_path_str.split(" → ")
-                if len(path_parts) > 1:
+                if len(selected_path) > 1:
                     # Parent path is everything except the last part
-                    parent_path_str = " → ".join(path_parts[:-1])
-                    if parent_path_str in gates_by_path:
-                        parent_gates = gates_by_path[parent_path_str]
+                    parent_path = selected_path[:-1]
+                    if parent_path in gates_by_path:
+                        parent_gates = gates_by_path[parent_path]
                         # The parent gate is the last gate in the parent path
                         if parent_gates:
                             parent_gate_name, parent_gate_path = parent_gates[-1]
@@ -1912,8 +2521,10 @@ class FlowAnalyzer:
                         print("Please enter a valid number")
             
             # Get available channels from first sample
-            first_sample = self.workspace.get_sample(first_sample_id)
+            first_sample = self._get_sample(first_sample_id)
             available_channels = first_sample.pnn_labels
+            # Lowercased once for the name matching in the channel prompts below
+            available_lower = [channel.lower() for channel in available_channels]
             
             print(f"\nAvailable channels:")
             for i, channel in enumerate(available_channels, 1):
@@ -1944,35 +2555,13 @@ class FlowAnalyzer:
             statistic_choice = None
             scale_choice = "linear"  # Default scale
             plot_config_show_gates = False  # Initialize, will be set for scatter plots
+            gates_to_visualize = []  # Gates chosen for overlay on scatter plots
+            quadrant_thresholds = None  # Set for scatter/contour plots in quadrant mode
             if plot_type == "histogram":
-                while True:
-                    try:
-                        param_choice = input(f"\nSelect channel for histogram (1-{len(available_channels)}) or type name: ").strip()
-                        
-                        # Try as number first
-                        try:
-                            param_idx = int(param_choice) - 1
-                            if 0 <= param_idx < len(available_channels):
-                                param = available_channels[param_idx]
-                                parameters.append(param)
-                                break
-                            else:
-                                print(f"Please enter a number between 1 and {len(available_channels)}")
-                        except ValueError:
-                            # Try as channel name (case-insensitive partial match)
-                            selected_channel = None
-                            for channel in available_channels:
-                                if param_choice.lower() in channel.lower() or channel.lower() in param_choice.lower():
-                                    selected_channel = channel
-                                    break
-                            
-                            if selected_channel:
-                                parameters.append(selected_channel)
-                                break
-                            else:
-                                print(f"Channel '{param_choice}' not found. Please try again.")
-                    except KeyboardInterrupt:
-                        return None
+                channel = _prompt_channel("\nSelect channel for histogram", available_channels, available_lower)
+                if channel is None:
+                    return None
+                parameters.append(channel)
                 
                 # Prompt for statistic to display
                 print("\nStatistic to display:")
@@ -2006,72 +2595,17 @@ class FlowAnalyzer:
                     else:
                         print("Please enter 1 for Linear or 2 for Log")
             else:  # scatter or contour (both require 2 parameters)
-                while True:
-                    try:
-                        x_choice = input(f"\nSelect channel for X-axis (1-{len(available_channels)}) or type name: ").strip()
-                        
-                        # Try as number first
-                        try:
-                            x_idx = int(x_choice) - 1
-                            if 0 <= x_idx < len(available_channels):
-                                x_param = available_channels[x_idx]
-                                parameters.append(x_param)
-                                break
-                            else:
-                                print(f"Please enter a number between 1 and {len(available_channels)}")
-                        except ValueError:
-                            # Try as channel name (case-insensitive partial match)
-                            selected_channel = None
-                            for channel in available_channels:
-                                if x_choice.lower() in channel.lower() or channel.lower() in x_choice.lower():
-                                    selected_channel = channel
-                                    break
-                            
-                            if selected_channel:
-                                parameters.append(selected_channel)
-                                break
-                            else:
-                                print(f"Channel '{x_choice}' not found. Please try again.")
-                    except KeyboardInterrupt:
-                        return None
-                
-                while True:
-                    try:
-                        y_choice = input(f"Select channel for Y-axis (1-{len(available_channels)}) or type name: ").strip()
-                        
-                        # Try as number first
-                        try:
-                            y_idx = int(y_choice) - 1
-                            if 0 <= y_idx < len(available_channels):
-                                y_param = available_channels[y_idx]
-                                parameters.append(y_param)
-                                break
-                            else:
-                                print(f"Please enter a number between 1 and {len(available_channels)}")
-                        except ValueError:
-                            # Try as channel name (case-insensitive partial match)
-                            selected_channel = None
-                            for channel in available_channels:
-                                if y_choice.lower() in channel.lower() or channel.lower() in y_choice.lower():
-                                    selected_channel = channel
-                                    break
-                            
-                            if selected_channel:
-                                parameters.append(selected_channel)
-                                break
-                            else:
-                                print(f"Channel '{y_choice}' not found. Please try again.")
-                    except KeyboardInterrupt:
+                for prompt in ("\nSelect channel for X-axis", "Select channel for Y-axis"):
+                    channel = _prompt_channel(prompt, available_channels, available_lower)
+                    if channel is None:
                         return None
+                    parameters.append(channel)
                 
                 # For quadrant mode, extract thresholds from parent QuadrantGate or infer from Q1-Q4
-                quadrant_thresholds = None
                 if gate_mode == 'quadrant':
                     x_channel = parameters[0]
                     y_channel = parameters[1]
-                    # Convert selected_path_str to tuple format
-                    path_parts = selected_path_str.split(" → ")
-                    gate_path_tuple = tuple([part.strip() for part in path_parts])
+                    gate_path_tuple = selected_path
                     
                     # First try to extract from parent QuadrantGate
                     quadrant_thresholds = self._extract_quadrant_thresholds_from_parent(
@@ -2089,24 +2623,23 @@ class FlowAnalyzer:
                             x_threshold = None
                             y_threshold = None
                             for divider in inferred_dividers:
-                                if divider.get('orientation') == 'vertical':
-                                    x_threshold = divider.get('value')
-                                elif divider.get('orientation') == 'horizontal':
-                                    y_threshold = divider.get('value')
+                                if divider.orientation == 'vertical':
+                                    x_threshold = divider.value
+                                elif divider.orientation == 'horizontal':
+                                    y_threshold = divider.value
                             
                             if x_threshold is not None and y_threshold is not None:
                                 quadrant_thresholds = {
                                     'x_threshold': float(x_threshold),
                                     'y_threshold': float(y_threshold)
                                 }
-                                print(f"✓ Inferred quadrant thresholds from Q1-Q4 gates:")
-                                print(f"   X threshold: {quadrant_thresholds['x_threshold']:.2f}")
-                                print(f"   Y threshold: {quadrant_thresholds['y_threshold']:.2f}")
+                                # The values are shown once, in the summary below
+                                print("✓ Inferred quadrant thresholds from Q1-Q4 gates")
                     
                     if quadrant_thresholds:
-                        print(f"\n✓ Using quadrant thresholds:")
-                        print(f"   X threshold: {quadrant_thresholds['x_threshold']:.2f}")
-                        print(f"   Y threshold: {quadrant_thresholds['y_threshold']:.2f}")
+                        print(f"\n✓ Using quadrant thresholds:\n"
+                              f"   X threshold: {quadrant_thresholds['x_threshold']:.2f}\n"
+                              f"   Y threshold: {quadrant_thresholds['y_threshold']:.2f}")
                     else:
                         print(f"\n⚠️  Could not extract or infer quadrant thresholds. Switching to polygon mode.")
                         gate_mode = 'polygon'
@@ -2125,60 +2658,62 @@ class FlowAnalyzer:
                     # Check what gates are available for the selected channels
                     x_channel = parameters[0]
                     y_channel = parameters[1]
-                    try:
-                        # Get gates from first sample to see what's available
-                        gates_data = self._extract_gate_polygons(first_sample_id, x_channel, y_channel)
-                        available_gates = [g['name'] for g in gates_data]
-                        available_gates_with_info = gates_data
+                    # Same channels and selected gate as an earlier plot configuration: reuse its listing
+                    listing_key = (x_channel, y_channel, selected_gate_name, selected_gate_path)
+                    cached_listing = gate_listings.get(listing_key)
+                    if cached_listing is not None:
+                        available_gates = list(cached_listing[0])
+                        available_gates_with_info = list(cached_listing[1])
+                    else:
+                        try:
+                            # Get gates from first sample to see what's available
+                            gates_data = self._extract_gate_polygons(first_sample_id, x_channel, y_channel)
+                            available_gates = [g['name'] for g in gates_data]
+                            available_names = set(available_gates)  # for the duplicate check below
+                            available_gates_with_info = list(gates_data)  # extended below; gates_data is cached
                         
-                        # Also check for child gates and sibling gates of the selected gate
-                        if selected_gate_name and selected_gate_name != "Ungated":
-                            # Get all gate IDs to find children and siblings
-                            all_gate_ids = self.workspace.get_gate_ids(first_sample_id)
-                            # The full path to the selected gate (for finding siblings)
-                            selected_gate_full_path = selected_gate_path + (selected_gate_name,)
-                            # The path prefix for finding children
-                            child_gate_path_prefix = selected_gate_full_path
-                            
-                            print(f"    DEBUG: Looking for gates related to '{selected_gate_name}'")
-                            print(f"           Selected gate path: {selected_gate_path}")
-                            print(f"           Selected gate full path: {selected_gate_full_path}")
+                            # Also check for child gates and sibling gates of the selected gate
+                            if selected_gate_name and selected_gate_name != "Ungated":
+                                # The full path to the selected gate (for finding children and siblings)
+                                selected_gate_full_path = selected_gate_path + (selected_gate_name,)
+                                logger.debug("    DEBUG: Looking for gates related to '%s' (path %s, full path %s)",
+                                             selected_gate_name, selected_gate_path, selected_gate_full_path)
                             
-                            for other_gate_name, other_gate_path in all_gate_ids:
-                                # Skip if this is the selected gate itself
-                                if other_gate_name == selected_gate_name and other_gate_path == selected_gate_path:
-                                    continue
+                                # Only gates at or below the selected gate's full path can be children or siblings,
+                                # and only those drawn on these axes can be extracted
+                                related_gate_ids = self._gates_under_path(first_sample_id, selected_gate_full_path)
+                                on_axes = set(self._gates_on_axes(first_sample_id, x_channel, y_channel))
+                                for other_gate_name, other_gate_path in related_gate_ids:
+                                    # Skip if this is the selected gate itself
+                                    if other_gate_name == selected_gate_name and other_gate_path == selected_gate_path:
+                                        continue
+                                    if (other_gate_name, other_gate_path) not in on_axes:
+                                        logger.debug("    DEBUG: Skipping '%s' (not on %s / %s)", other_gate_name, x_channel, y_channel)
+                                        continue
                                 
-                                is_child_or_sibling = False
+                                    # Gates deeper than the selected gate's full path are its children;
+                                    # gates at exactly that path are siblings (e.g., Q1-Q4 of Singlets,
+                                    # all at "root → Cells → Singlets")
+                                    logger.debug("    DEBUG: Found %s gate '%s' at path %s",
+                                                 'child' if len(other_gate_path) > len(selected_gate_full_path) else 'sibling',
+                                                 other_gate_name, other_gate_path)
                                 
-                                # Check if this is a child of the selected gate
-                                # Child path should start with selected gate's full path and be longer
-                                if len(other_gate_path) > len(selected_gate_full_path):
-                                    if other_gate_path[:len(selected_gate_full_path)] == selected_gate_full_path:
-                                        is_child_or_sibling = True
-                                        print(f"    DEBUG: Found child gate '{other_gate_name}' at path {other_gate_path}")
-                                
-                                # Also check if this is a sibling at the same path level as the selected gate
-                                # (e.g., Q1-Q4 are siblings of Singlets, all at "root → Cells → Singlets")
-                                # Siblings have the same path as the selected gate's full path
-                                if other_gate_path == selected_gate_full_path:
-                                    is_child_or_sibling = True
-                                    print(f"    DEBUG: Found sibling gate '{other_gate_name}' at same path {other_gate_path}")
-                                
-                                if is_child_or_sibling:
                                     # Try to extract gate if it matches channels
                                     other_gate_data = self._extract_selected_gate(first_sample_id, other_gate_name, other_gate_path, x_channel, y_channel)
-                                    if other_gate_data and other_gate_data['name'] not in available_gates:
+                                    if other_gate_data and other_gate_data['name'] not in available_names:
                                         available_gates.append(other_gate_data['name'])
+                                        available_names.add(other_gate_data['name'])
                                         available_gates_with_info.append(other_gate_data)
-                                        print(f"    DEBUG: Added '{other_gate_name}' to available gates (type: {other_gate_data.get('type', 'unknown')})")
+                                        logger.debug("    DEBUG: Added '%s' to available gates (type: %s)",
+                                                     other_gate_name, other_gate_data.get('type', 'unknown'))
                                     elif not other_gate_data:
-                                        print(f"    DEBUG: Could not extract '{other_gate_name}' (doesn't match channels or extraction failed)")
-                    except Exception as e:
-                        pass  # Will show empty list
-                
-                # Store which gates to visualize
-                gates_to_visualize = []
+                                        logger.debug("    DEBUG: Could not extract '%s' (doesn't match channels or extraction failed)",
+                                                     other_gate_name)
+                        except Exception as e:
+                            pass  # Will show empty list
+                        else:
+                            # Only a completed scan is reused for later plots on these channels
+                            gate_listings[listing_key] = (tuple(available_gates), tuple(available_gates_with_info))
 
                 if available_gates:
                     print(f"\nAvailable gates for channels {x_channel} / {y_channel}:")
@@ -2199,10 +2734,10 @@ class FlowAnalyzer:
                     while True:
                         gate_viz_choice = input("\nSelect gates to visualize (comma-separated numbers, 'all', or 'none'): ").strip().lower()
 
-                        if gate_viz_choice in ['none', 'no', 'n', '']:
+                        if gate_viz_choice in _NO_GATES:
                             plot_config_show_gates = False
                             break
-                        elif gate_viz_choice in ['all', 'yes', 'y']:
+                        elif gate_viz_choice in _ALL_GATES:
                             plot_config_show_gates = True
                             gates_to_visualize = available_gates
                             print(f"Will visualize: {', '.join(gates_to_visualize)}")
@@ -2255,10 +2790,9 @@ class FlowAnalyzer:
                     plot_config['scale'] = scale_choice
                 plot_config['show_gates'] = False  # Gates not applicable for histograms
             else:  # scatter
-                # Use explicit check for scatter plot type instead of unreliable locals() check
                 plot_config['show_gates'] = plot_config_show_gates
                 # Store which specific gates to visualize
-                if 'gates_to_visualize' in locals() and gates_to_visualize:
+                if gates_to_visualize:
                     plot_config['gates_to_visualize'] = gates_to_visualize
             
             plot_configs.append(plot_config)
@@ -2270,8 +2804,8 @@ class FlowAnalyzer:
             'well_id_source': well_id_source,
             'well_id_keyword': well_id_keyword,
             'show_keywords': show_keywords,
-            'selected_keywords_to_show': selected_keywords_to_show if 'selected_keywords_to_show' in locals() else None,
-            'show_statistics': show_statistics if 'show_statistics' in locals() else False,
+            'selected_keywords_to_show': selected_keywords_to_show,
+            'show_statistics': show_statistics,
             'num_plots': num_plots,
             'plot_configs': plot_configs
         }
@@ -2282,7 +2816,7 @@ class FlowAnalyzer:
         
         return result
 
-    def _plot_histogram(self, df, channel_keyword, sample_id, gate_name, bins=200, statistic='median', scale='linear', keywords=None, show_keywords=False):
+    def _plot_histogram(self, df, channel_keyword, sample_id, gate_name, bins=200, statistic='median', scale='linear', keywords=None, show_keywords=False, kde_key=None):
         """
         Generate a histogram plot for a single channel using raw (untransformed) data.
         
@@ -2307,6 +2841,9 @@ class FlowAnalyzer:
                 - Linear: Dynamic range based on data with outlier filtering
                 - Log: Fixed range from 0.1 to 10^5 (log scale cannot start at 0)
                 Defaults to 'linear'.
+            kde_key (tuple, optional): Hashable identity of the events in ``df``, e.g.
+                (sample ID, gate name, gate path, use gate directly). When given, the density
+                curve is cached under it with the channel and scale. Defaults to None (no caching).
         
         Returns:
             bokeh.plotting.figure: Bokeh figure object with histogram rendered. The figure
@@ -2342,81 +2879,86 @@ class FlowAnalyzer:
             - Log scale has fixed x-axis range (0.1 to 10^5) for consistency across samples
         """
         from bokeh.plotting import figure
+        from kde_utils import fast_kde
         
         # Find matching channel
-        matching_channels = [c for c in df.columns if channel_keyword in c]
-        if not matching_channels:
+        channel = _match_channel(tuple(df.columns), channel_keyword)
+        if channel is None:
             raise ValueError(f"No channel found matching keyword '{channel_keyword}'")
-        channel = matching_channels[0]
         
         # Create histogram
-        # Filter out NaN/inf values
-        valid_data = df[channel].dropna()
-        if len(valid_data) == 0:
-            raise ValueError(f"No valid data for channel '{channel}'")
-        
-        # For log scale, filter out zero and negative values first
-        if scale == 'log':
-            valid_data = valid_data[valid_data > 0]
-            if len(valid_data) == 0:
+        # Filter out small values (<10) to prevent log transform issues and giant bars.
+        # One mask covers every filter: NaN compares False, and values >= 10 are also
+        # positive as log scale requires
+        data = df[channel].to_numpy()
+        keep = data >= 10
+        if not keep.any():
+            # Report the first filter that leaves no events
+            if np.isnan(data).all():
+                raise ValueError(f"No valid data for channel '{channel}'")
+            if scale == 'log' and not (data > 0).any():
                 raise ValueError(f"No positive values for channel '{channel}' (required for log scale)")
-        
-        # Filter out small values (<10) to prevent log transform issues and giant bars
-        # This is especially important for log scale but also helps with linear scale
-        valid_data = valid_data[valid_data >= 10]
-        if len(valid_data) == 0:
             raise ValueError(f"No values >= 10 for channel '{channel}' (filtered out small values)")
+        # The remaining passes (quartiles, masks, KDE) run over float32, as FCS stores events
+        values = data[keep].astype(np.float32, copy=False)
         
-        # Filter outliers using IQR method for better visualization
-        # This helps when data has extreme outliers that compress the main distribution
-        q1 = valid_data.quantile(0.25)
-        q3 = valid_data.quantile(0.75)
-        iqr = q3 - q1
+        # The outlier filter and KDE depend only on the events, channel and scale, so a
+        # histogram plotted again for the same sample and gate (another plot configuration
+        # with a different statistic, say) reuses them
+        cache_key = kde_key + (channel, scale) if kde_key is not None else None
+        cached_kde = self._histogram_kde_cache.get(cache_key) if cache_key is not None else None
+        if cached_kde is not None:
+            x_grid, kde_values = cached_kde
+        else:
+            # Filter outliers using IQR method for better visualization
+            # This helps when data has extreme outliers that compress the main distribution
+            q1, q3 = _quartiles(values)
+            iqr = q3 - q1
         
-        # Use a more conservative approach: filter only extreme outliers (beyond 3*IQR)
-        # This preserves most of the data while removing extreme outliers
-        lower_bound = q1 - 3 * iqr
-        upper_bound = q3 + 3 * iqr
+            # Use a more conservative approach: filter only extreme outliers (beyond 3*IQR)
+            # This preserves most of the data while removing extreme outliers
+            lower_bound = q1 - 3 * iqr
+            upper_bound = q3 + 3 * iqr
         
-        # For log scale, ensure lower bound is positive
-        if scale == 'log' and lower_bound <= 0:
-            lower_bound = valid_data.min()
+            # For log scale, ensure lower bound is positive
+            if scale == 'log' and lower_bound <= 0:
+                lower_bound = values.min()
         
-        # Filter data for plotting (but keep original for statistics)
-        filtered_data = valid_data[(valid_data >= lower_bound) & (valid_data <= upper_bound)]
+            # Filter data for plotting (but keep original for statistics)
+            filtered_data = values[(values >= lower_bound) & (values <= upper_bound)]
         
-        # If filtering removed too much (>50%), use original data
-        # This handles cases where the distribution itself is very wide
-        if len(filtered_data) < len(valid_data) * 0.5:
-            filtered_data = valid_data
+            # If filtering removed too much (>50%), use original data
+            # This handles cases where the distribution itself is very wide
+            if len(filtered_data) < len(values) * 0.5:
+                filtered_data = values
         
-        # Compute KDE (kernel density estimate) on filtered data
-        # For log scale, compute KDE on log-transformed data for better density estimation
-        if scale == "log":
-            # Transform to log space for KDE
-            log_data = np.log10(filtered_data)
-            kde = gaussian_kde(log_data)
-            # Generate x grid in log space (from log10(0.1) = -1 to log10(1e5) = 5)
-            x_min_log = -1
-            x_max_log = 5
-            x_grid_log = np.linspace(x_min_log, x_max_log, 500)
-            # Evaluate KDE on log grid
-            kde_values = kde(x_grid_log)
-            # Transform grid back to linear space for plotting
-            x_grid = 10 ** x_grid_log
-            # Adjust density for log scale: multiply by derivative of log transform
-            # d/dx log10(x) = 1/(x * ln(10)), so we need to multiply by x * ln(10)
-            kde_values = kde_values * (x_grid * np.log(10))
-        else:
-            # For linear scale, compute KDE directly on filtered data
-            kde = gaussian_kde(filtered_data)
-            # Generate x grid over valid range with padding
-            x_min = filtered_data.min()
-            x_max = filtered_data.max()
-            x_padding = (x_max - x_min) * 0.1  # 10% padding
-            x_grid = np.linspace(max(0, x_min - x_padding), x_max + x_padding, 500)
-            # Evaluate KDE on grid
-            kde_values = kde(x_grid)
+            # Compute KDE (kernel density estimate) on filtered data
+            # For log scale, compute KDE on log-transformed data for better density estimation
+            if scale == "log":
+                # Log-transform straight into float32, the precision fast_kde bins in
+                log_data = np.log10(filtered_data, dtype=np.float32)
+                # Generate x grid in log space (from log10(0.1) = -1 to log10(1e5) = 5)
+                x_min_log = -1
+                x_max_log = 5
+                x_grid_log = np.linspace(x_min_log, x_max_log, 500)
+                # Evaluate KDE on log grid
+                kde_values = fast_kde(log_data, x_grid_log, edges=_LOG_KDE_EDGES)
+                # Transform grid back to linear space for plotting
+                x_grid = 10 ** x_grid_log
+                # Adjust density for log scale: multiply by derivative of log transform
+                # d/dx log10(x) = 1/(x * ln(10)), so we need to multiply by x * ln(10)
+                kde_values = kde_values * (x_grid * np.log(10))
+            else:
+                # For linear scale, compute KDE directly on filtered data
+                # Generate x grid over valid range with padding
+                x_min = filtered_data.min()
+                x_max = filtered_data.max()
+                x_padding = (x_max - x_min) * 0.1  # 10% padding
+                x_grid = np.linspace(max(0, x_min - x_padding), x_max + x_padding, 500)
+                # Evaluate KDE on grid
+                kde_values = fast_kde(filtered_data, x_grid)
+            if cache_key is not None:
+                self._histogram_kde_cache[cache_key] = (x_grid, kde_values)
         
         # Set x-axis type based on scale parameter
         x_axis_type = "log" if scale == "log" else "linear"
@@ -2443,8 +2985,13 @@ class FlowAnalyzer:
         # Plot KDE as smooth silhouette with olive green fill
         if len(kde_values) > 0 and len(x_grid) > 0:
             # Create area under curve (filled silhouette)
-            p.patch(np.concatenate([[x_grid[0]], x_grid, [x_grid[-1]]]),
-                   np.concatenate([[0], kde_values, [0]]),
+            # Outline is the curve closed down to zero at both ends, filled in one buffer
+            outline = np.zeros((2, x_grid.size + 2))
+            outline[0, 1:-1] = x_grid
+            outline[0, 0] = x_grid[0]
+            outline[0, -1] = x_grid[-1]
+            outline[1, 1:-1] = kde_values
+            p.patch(outline[0], outline[1],
                    fill_color="#6B8E23", fill_alpha=0.6, line_color="#556B2F", line_width=2)
             
             # Add line on top for clearer silhouette
@@ -2455,10 +3002,10 @@ class FlowAnalyzer:
             
             # Calculate and draw statistic line (median or mean)
             if statistic == 'mean':
-                stat_val = valid_data.mean()
+                stat_val = values.mean(dtype=np.float64)
                 stat_label = 'Mean'
             else:  # default to median
-                stat_val = valid_data.median()
+                stat_val = np.median(values)
                 stat_label = 'Median'
             
             from bokeh.models import Span, Label
@@ -2557,45 +3104,46 @@ class FlowAnalyzer:
         from bokeh.plotting import figure
         
         # Find matching channels
-        x_channels = [c for c in df.columns if x_keyword in c]
-        y_channels = [c for c in df.columns if y_keyword in c]
+        columns = tuple(df.columns)
+        x_channel = _match_channel(columns, x_keyword)
+        y_channel = _match_channel(columns, y_keyword)
         
-        if not x_channels:
+        if x_channel is None:
             raise ValueError(f"No channel found matching keyword '{x_keyword}'")
-        if not y_channels:
+        if y_channel is None:
             raise ValueError(f"No channel found matching keyword '{y_keyword}'")
         
-        x_channel = x_channels[0]
-        y_channel = y_channels[0]
-        
         # Filter out values <= 0 for log scale (log can't handle 0 or negative values)
-        df = df[(df[x_channel] > 0) & (df[y_channel] > 0)]
+        x_values = df[x_channel].to_numpy()
+        y_values = df[y_channel].to_numpy()
+        rows = np.flatnonzero((x_values > 0) & (y_values > 0))
 
         # Downsample if too many points for performance
-        max_points = 10000
-        if len(df) > max_points:
-            df_plot = df.sample(n=max_points, random_state=42)
-        else:
-            df_plot = df
+        rows = _sample_rows(rows, 10000)
+        x_data = x_values[rows].astype(np.float32, copy=False)
+        y_data = y_values[rows].astype(np.float32, copy=False)
 
-        # Convert to ColumnDataSource for Bokeh
+        # Convert to ColumnDataSource for Bokeh; only the plotted channels are sent,
+        # as float32 (the precision FCS events are stored in)
         from bokeh.models import ColumnDataSource
-        source = ColumnDataSource(df_plot)
+        source = ColumnDataSource({x_channel: x_data, y_channel: y_data})
 
         # Use log scale for both axes to match FlowJo display
         # Set fixed ranges: 1 to 10^5 (matching FlowJo's typical range)
+        # The WebGL backend draws the thousands of event markers on the GPU, which keeps
+        # pan/zoom responsive across a plate of plots; overlays render as usual
         p = figure(title=f"{sample_id} - {gate_name}",
                    x_axis_label=x_channel, y_axis_label=y_channel,
                    x_axis_type="log", y_axis_type="log",
                    x_range=(1, 1e5), y_range=(1, 1e5),
                    width=400, height=300, tools="pan,wheel_zoom,box_zoom,reset,save",
-                   sizing_mode="fixed")
+                   sizing_mode="fixed", output_backend="webgl")
 
         p.scatter(x=x_channel, y=y_channel, source=source, size=2, alpha=0.6, color="navy")
 
         # Render quadrant dividers if in quadrant mode
         if gate_mode == 'quadrant' and quadrant_thresholds:
-            print(f"    → Rendering quadrant dividers on log scale (1 to 10^5)")
+            logger.debug("    → Rendering quadrant dividers on log scale (1 to 10^5)")
             from bokeh.models import Span
             
             # Use a distinct color for quadrant dividers
@@ -2608,7 +3156,7 @@ class FlowAnalyzer:
                            line_color=divider_color, line_width=2.5,
                            line_dash='dashed', line_alpha=0.9)
                 p.add_layout(span)
-                print(f"      ✓ Rendered vertical divider at x={x_thresh:.2f}")
+                logger.debug("      ✓ Rendered vertical divider at x=%.2f", x_thresh)
             
             # Render horizontal divider (Y threshold)
             if 'y_threshold' in quadrant_thresholds:
@@ -2617,45 +3165,32 @@ class FlowAnalyzer:
                            line_color=divider_color, line_width=2.5,
                            line_dash='dashed', line_alpha=0.9)
                 p.add_layout(span)
-                print(f"      ✓ Rendered horizontal divider at y={y_thresh:.2f}")
+                logger.debug("      ✓ Rendered horizontal divider at y=%.2f", y_thresh)
 
         # Render gate boundaries if requested (polygon mode)
         elif show_gates and gates:
-            print(f"    → Rendering {len(gates)} gate(s) on log scale (1 to 10^5)")
-
-            # Color palette for gates (distinct colors/shades)
-            gate_colors = [
-                ("#6B8E23", "#556B2F"),  # Olive green
-                ("#4682B4", "#36648B"),  # Steel blue
-                ("#CD853F", "#8B5A2B"),  # Peru/tan
-                ("#9370DB", "#7B68EE"),  # Medium purple
-                ("#DC143C", "#B22222"),  # Crimson
-                ("#20B2AA", "#008B8B"),  # Light sea green
-                ("#FF8C00", "#CD6600"),  # Dark orange
-                ("#8B4789", "#68387E"),  # Dark orchid
-            ]
+            logger.debug("    → Rendering %s gate(s) on log scale (1 to 10^5)", len(gates))
 
             from bokeh.models import Span
 
             # gates should be a list of gate dictionaries with 'name', 'x_dim', 'y_dim', 'xs', 'ys' (or 'dividers' for quadrant gates)
+            # Gates drawn on these axes, in either order
+            plot_axes = {(x_channel, y_channel), (y_channel, x_channel)}
             for gate_idx, gate in enumerate(gates):
                 # Check if gate matches current axes
-                if (gate.get('x_dim') == x_channel and gate.get('y_dim') == y_channel) or \
-                   (gate.get('x_dim') == y_channel and gate.get('y_dim') == x_channel):
-                    
+                if (gate.get('x_dim'), gate.get('y_dim')) in plot_axes:
+                    # Colors follow the gate's position in the list, as in the legend
+                    fill_color, line_color = _GATE_COLORS[gate_idx % len(_GATE_COLORS)]
                     gate_type = gate.get('type', 'polygon')  # Default to polygon for backward compatibility
                     
                     # Handle quadrant gates
                     if gate_type == 'quadrant':
                         dividers = gate.get('dividers', [])
                         if dividers:
-                            # Get color for this gate
-                            fill_color, line_color = gate_colors[gate_idx % len(gate_colors)]
-                            
                             # Render divider lines
                             for divider in dividers:
-                                orientation = divider.get('orientation')
-                                value = divider.get('value')
+                                orientation = divider.orientation
+                                value = divider.value
                                 
                                 if orientation == 'vertical' and value is not None:
                                     # Vertical line (x = value)
@@ -2663,50 +3198,46 @@ class FlowAnalyzer:
                                                line_color=line_color, line_width=2.5,
                                                line_dash='dashed', line_alpha=0.9)
                                     p.add_layout(span)
-                                    print(f"      ✓ Rendered vertical divider at x={value:.2f} for '{gate.get('name')}'")
+                                    logger.debug("      ✓ Rendered vertical divider at x=%.2f for '%s'", value, gate.get('name'))
                                 elif orientation == 'horizontal' and value is not None:
                                     # Horizontal line (y = value)
                                     span = Span(location=value, dimension='width',
                                                line_color=line_color, line_width=2.5,
                                                line_dash='dashed', line_alpha=0.9)
                                     p.add_layout(span)
-                                    print(f"      ✓ Rendered horizontal divider at y={value:.2f} for '{gate.get('name')}'")
+                                    logger.debug("      ✓ Rendered horizontal divider at y=%.2f for '%s'", value, gate.get('name'))
                             
-                            print(f"      ✓ Rendered quadrant gate '{gate.get('name')}' with {len(dividers)} divider(s), color: {line_color}")
+                            logger.debug("      ✓ Rendered quadrant gate '%s' with %s divider(s), color: %s", gate.get('name'), len(dividers), line_color)
                         else:
-                            print(f"      ⚠️  Skipped '{gate.get('name')}': no dividers found")
+                            logger.debug("      ⚠️  Skipped '%s': no dividers found", gate.get('name'))
                     
                     # Handle polygon/rectangle gates
                     else:
-                        xs = gate.get('xs', [])
-                        ys = gate.get('ys', [])
-                        if xs and ys and len(xs) == len(ys) and len(xs) >= 3:
+                        outline = _closed_gate_outline(gate)
+                        if outline is not None:
+                            xs, ys = outline
                             # Swap if dimensions are reversed
                             if gate.get('x_dim') == y_channel:
                                 xs, ys = ys, xs
 
-                            print(f"      DEBUG: Gate '{gate.get('name')}' coordinates:")
-                            print(f"             X: [{min(xs):.2f}, {max(xs):.2f}]")
-                            print(f"             Y: [{min(ys):.2f}, {max(ys):.2f}]")
-
-                            # Ensure polygon is closed
-                            if xs[0] != xs[-1] or ys[0] != ys[-1]:
-                                xs = list(xs) + [xs[0]]
-                                ys = list(ys) + [ys[0]]
-
-                            # Get color for this gate
-                            fill_color, line_color = gate_colors[gate_idx % len(gate_colors)]
+                            if logger.isEnabledFor(logging.DEBUG):
+                                # Both axes reduced together instead of Python min()/max() over the vertices
+                                bounds = np.array([xs, ys], dtype=np.float64)
+                                lo, hi = bounds.min(axis=1), bounds.max(axis=1)
+                                logger.debug("      DEBUG: Gate '%s' coordinates:", gate.get('name'))
+                                logger.debug("             X: [%.2f, %.2f]", lo[0], hi[0])
+                                logger.debug("             Y: [%.2f, %.2f]", lo[1], hi[1])
 
                             # Plot gates with distinct colors (no legend_label - will add global legend)
                             # Gates are already in raw data space from inverse transform
                             # They will be displayed correctly on log-scale axes
                             p.patch(xs, ys, fill_color=fill_color, fill_alpha=0.3, line_color=line_color,
                                    line_width=2.5, line_alpha=0.9)
-                            print(f"      ✓ Rendered '{gate.get('name')}' ({len(xs)} vertices, color: {fill_color})")
+                            logger.debug("      ✓ Rendered '%s' (%s vertices, color: %s)", gate.get('name'), len(xs), fill_color)
                         else:
-                            print(f"      ⚠️  Skipped '{gate.get('name')}': invalid coordinates")
+                            logger.debug("      ⚠️  Skipped '%s': invalid coordinates", gate.get('name'))
                 else:
-                    print(f"      ⚠️  Skipped '{gate.get('name')}': channel mismatch")
+                    logger.debug("      ⚠️  Skipped '%s': channel mismatch", gate.get('name'))
         
         # Add keyword display in bottom right if requested
         if show_keywords and keywords:
@@ -2719,8 +3250,6 @@ class FlowAnalyzer:
             keyword_text = "\n".join(keyword_lines)
             
             # Get plot dimensions for positioning
-            x_data = df_plot[x_channel].dropna()
-            y_data = df_plot[y_channel].dropna()
             if len(x_data) > 0 and len(y_data) > 0:
                 x_min = x_data.min()
                 x_max = x_data.max()
@@ -2743,7 +3272,7 @@ class FlowAnalyzer:
 
         Creates a 2D density plot with iso-density contours similar to traditional
         flow cytometry plots (e.g., FlowJo). Uses 2D Kernel Density Estimation (KDE)
-        to calculate density and matplotlib for contour extraction, then renders
+        to calculate density and contourpy for contour extraction, then renders
         contours in Bokeh for interactive visualization.
 
         The method works in log space to ensure proper density calculation for
@@ -2779,9 +3308,10 @@ class FlowAnalyzer:
             - Filters out values ≤ 0 for log scale compatibility
             - Downsamples to 10,000 points maximum for KDE performance
             - Creates 100×100 evaluation grid in log space
-            - Uses scipy.stats.gaussian_kde for 2D density estimation
-            - Uses matplotlib.pyplot.contour for contour line extraction
-            - Renders contour paths in Bokeh (matplotlib only for calculation)
+            - Uses kde_utils.fast_kde_2d (binned Gaussian KDE) for 2D density estimation
+            - Uses contourpy (matplotlib's contouring library) for contour line extraction,
+              falling back to matplotlib.pyplot.contour where contourpy is unavailable
+            - Renders contour paths in Bokeh (contour libraries only for calculation)
             - Supports gate overlays (quadrant dividers and polygon gates)
             - Annotations positioned in top-left corner for visibility
 
@@ -2801,28 +3331,27 @@ class FlowAnalyzer:
             _plot_histogram: For 1D density visualization
         """
         from bokeh.plotting import figure
-        from scipy.stats import gaussian_kde
-        import matplotlib.pyplot as plt
+        from kde_utils import fast_kde_2d
         import numpy as np
 
         # Find matching channels
-        x_channels = [c for c in df.columns if x_keyword in c]
-        y_channels = [c for c in df.columns if y_keyword in c]
+        columns = tuple(df.columns)
+        x_channel = _match_channel(columns, x_keyword)
+        y_channel = _match_channel(columns, y_keyword)
 
-        if not x_channels:
+        if x_channel is None:
             raise ValueError(f"No channel found matching keyword '{x_keyword}'")
-        if not y_channels:
+        if y_channel is None:
             raise ValueError(f"No channel found matching keyword '{y_keyword}'")
 
-        x_channel = x_channels[0]
-        y_channel = y_channels[0]
+        # Filter out values <= 0 for log scale; only the two plotted channels are read
+        x_values = df[x_channel].to_numpy()
+        y_values = df[y_channel].to_numpy()
+        rows = np.flatnonzero((x_values > 0) & (y_values > 0))
 
-        # Filter out values <= 0 for log scale
-        df_filtered = df[(df[x_channel] > 0) & (df[y_channel] > 0)]
-
-        if len(df_filtered) < 10:
+        if len(rows) < 10:
             # Not enough data points for KDE
-            print(f"    ⚠️  Warning: Only {len(df_filtered)} data points - cannot generate contours")
+            print(f"    ⚠️  Warning: Only {len(rows)} data points - cannot generate contours")
             # Return empty plot with message
             p = figure(title=f"{sample_id} - {gate_name} (Insufficient data)",
                       x_axis_label=x_channel, y_axis_label=y_channel,
@@ -2833,47 +3362,26 @@ class FlowAnalyzer:
             return p
 
         # Downsample if too many points (for KDE performance)
-        max_points = 10000
-        if len(df_filtered) > max_points:
-            df_kde = df_filtered.sample(n=max_points, random_state=42)
-        else:
-            df_kde = df_filtered
+        rows = _sample_rows(rows, 10000)
 
         # Extract data
-        x_data = df_kde[x_channel].values
-        y_data = df_kde[y_channel].values
+        x_data = x_values[rows]
+        y_data = y_values[rows]
 
-        # Work in log space (since axes are log scale)
-        log_x = np.log10(x_data)
-        log_y = np.log10(y_data)
-
-        # Create 2D KDE
-        xy = np.vstack([log_x, log_y])
-        try:
-            kde = gaussian_kde(xy)
-        except Exception as e:
-            print(f"    ⚠️  Warning: KDE calculation failed: {e}")
-            # Return empty plot
-            p = figure(title=f"{sample_id} - {gate_name} (KDE failed)",
-                      x_axis_label=x_channel, y_axis_label=y_channel,
-                      x_axis_type="log", y_axis_type="log",
-                      x_range=(1, 1e5), y_range=(1, 1e5),
-                      width=400, height=300, tools="pan,wheel_zoom,box_zoom,reset,save",
-                      sizing_mode="fixed")
-            return p
+        # Work in log space (since axes are log scale), transforming into one float32 buffer
+        log_xy = np.empty((2, len(rows)), dtype=np.float32)
+        np.log10(x_data, out=log_xy[0])
+        np.log10(y_data, out=log_xy[1])
 
         # Create evaluation grid
         # Use 100x100 grid for smooth contours
         grid_points = 100
         x_grid_log = np.linspace(0, 5, grid_points)  # log10(1) to log10(100000)
         y_grid_log = np.linspace(0, 5, grid_points)
-        X, Y = np.meshgrid(x_grid_log, y_grid_log)
-        positions = np.vstack([X.ravel(), Y.ravel()])
 
-        # Evaluate KDE on grid
-        Z = kde(positions).reshape(X.shape)
+        # Evaluate a binned 2D KDE on the grid
+        Z = fast_kde_2d(log_xy[0], log_xy[1], x_grid_log, y_grid_log)
 
-        # Use matplotlib to calculate contours
         # We'll use percentile-based levels for consistent appearance
         sorted_density = np.sort(Z.ravel())
         sorted_density = sorted_density[sorted_density > 0]  # Remove zeros
@@ -2893,10 +3401,21 @@ class FlowAnalyzer:
         percentiles = [10, 25, 50, 75, 90, 95]
         levels = [np.percentile(sorted_density, p) for p in percentiles]
 
-        # Create matplotlib figure for contour calculation (don't display)
-        fig, ax = plt.subplots()
-        cs = ax.contour(X, Y, Z, levels=levels)
-        plt.close(fig)  # Close immediately - we just need the paths
+        # Trace the contour lines (in log space) without creating a plotting figure
+        try:
+            from contourpy import contour_generator
+        except ImportError:
+            # matplotlib < 3.6 does not ship contourpy: draw into a figure that is never shown
+            import matplotlib.pyplot as plt
+            X, Y = np.meshgrid(x_grid_log, y_grid_log)
+            fig, ax = plt.subplots()
+            cs = ax.contour(X, Y, Z, levels=levels)
+            plt.close(fig)  # Close immediately - we just need the paths
+            contour_lines = [path.vertices for collection in cs.collections
+                             for path in collection.get_paths()]
+        else:
+            generator = contour_generator(x=x_grid_log, y=y_grid_log, z=Z)
+            contour_lines = [line for level in levels for line in generator.lines(level)]
 
         # Create Bokeh figure
         p = figure(title=f"{sample_id} - {gate_name}",
@@ -2908,24 +3427,22 @@ class FlowAnalyzer:
 
         # Extract and render contour paths
         contour_count = 0
-        for collection in cs.collections:
-            for path in collection.get_paths():
-                vertices = path.vertices
-                if len(vertices) > 0:
-                    # Convert from log space to linear space
-                    contour_x = 10 ** vertices[:, 0]
-                    contour_y = 10 ** vertices[:, 1]
+        for vertices in contour_lines:
+            if len(vertices) > 0:
+                # Convert from log space to linear space
+                contour_x = 10 ** vertices[:, 0]
+                contour_y = 10 ** vertices[:, 1]
 
-                    # Render contour line in Bokeh
-                    p.line(contour_x, contour_y, line_width=1.5,
-                          color='navy', alpha=0.7)
-                    contour_count += 1
+                # Render contour line in Bokeh
+                p.line(contour_x, contour_y, line_width=1.5,
+                      color='navy', alpha=0.7)
+                contour_count += 1
 
-        print(f"    ✓ Rendered {contour_count} contour lines")
+        logger.debug("    ✓ Rendered %s contour lines", contour_count)
 
         # Render quadrant dividers if in quadrant mode
         if gate_mode == 'quadrant' and quadrant_thresholds:
-            print(f"    → Rendering quadrant dividers on log scale (1 to 10^5)")
+            logger.debug("    → Rendering quadrant dividers on log scale (1 to 10^5)")
             from bokeh.models import Span
 
             divider_color = "#DC143C"  # Crimson
@@ -2937,7 +3454,7 @@ class FlowAnalyzer:
                            line_color=divider_color, line_width=2.5,
                            line_dash='dashed', line_alpha=0.9)
                 p.add_layout(span)
-                print(f"      ✓ Rendered vertical divider at x={x_thresh:.2f}")
+                logger.debug("      ✓ Rendered vertical divider at x=%.2f", x_thresh)
 
             # Render horizontal divider (Y threshold)
             if 'y_threshold' in quadrant_thresholds:
@@ -2946,86 +3463,70 @@ class FlowAnalyzer:
                            line_color=divider_color, line_width=2.5,
                            line_dash='dashed', line_alpha=0.9)
                 p.add_layout(span)
-                print(f"      ✓ Rendered horizontal divider at y={y_thresh:.2f}")
+                logger.debug("      ✓ Rendered horizontal divider at y=%.2f", y_thresh)
 
         # Render gate boundaries if requested (polygon mode)
         elif show_gates and gates:
-            print(f"    → Rendering {len(gates)} gate(s) on log scale (1 to 10^5)")
-
-            # Color palette for gates
-            gate_colors = [
-                ("#6B8E23", "#556B2F"),  # Olive green
-                ("#4682B4", "#36648B"),  # Steel blue
-                ("#CD853F", "#8B5A2B"),  # Peru/tan
-                ("#9370DB", "#7B68EE"),  # Medium purple
-                ("#DC143C", "#B22222"),  # Crimson
-                ("#20B2AA", "#008B8B"),  # Light sea green
-                ("#FF8C00", "#CD6600"),  # Dark orange
-                ("#8B4789", "#68387E"),  # Dark orchid
-            ]
+            logger.debug("    → Rendering %s gate(s) on log scale (1 to 10^5)", len(gates))
 
             from bokeh.models import Span
 
+            # Gates drawn on these axes, in either order
+            plot_axes = {(x_channel, y_channel), (y_channel, x_channel)}
             for gate_idx, gate in enumerate(gates):
-                if (gate.get('x_dim') == x_channel and gate.get('y_dim') == y_channel) or \
-                   (gate.get('x_dim') == y_channel and gate.get('y_dim') == x_channel):
-
+                if (gate.get('x_dim'), gate.get('y_dim')) in plot_axes:
+                    fill_color, line_color = _GATE_COLORS[gate_idx % len(_GATE_COLORS)]
                     gate_type = gate.get('type', 'polygon')
 
                     # Handle quadrant gates
                     if gate_type == 'quadrant':
                         dividers = gate.get('dividers', [])
                         if dividers:
-                            fill_color, line_color = gate_colors[gate_idx % len(gate_colors)]
-
                             for divider in dividers:
-                                orientation = divider.get('orientation')
-                                value = divider.get('value')
+                                orientation = divider.orientation
+                                value = divider.value
 
                                 if orientation == 'vertical' and value is not None:
                                     span = Span(location=value, dimension='height',
                                                line_color=line_color, line_width=2.5,
                                                line_dash='dashed', line_alpha=0.9)
                                     p.add_layout(span)
-                                    print(f"      ✓ Rendered vertical divider at x={value:.2f} for '{gate.get('name')}'")
+                                    logger.debug("      ✓ Rendered vertical divider at x=%.2f for '%s'", value, gate.get('name'))
                                 elif orientation == 'horizontal' and value is not None:
                                     span = Span(location=value, dimension='width',
                                                line_color=line_color, line_width=2.5,
                                                line_dash='dashed', line_alpha=0.9)
                                     p.add_layout(span)
-                                    print(f"      ✓ Rendered horizontal divider at y={value:.2f} for '{gate.get('name')}'")
+                                    logger.debug("      ✓ Rendered horizontal divider at y=%.2f for '%s'", value, gate.get('name'))
 
-                            print(f"      ✓ Rendered quadrant gate '{gate.get('name')}' with {len(dividers)} divider(s), color: {line_color}")
+                            logger.debug("      ✓ Rendered quadrant gate '%s' with %s divider(s), color: %s", gate.get('name'), len(dividers), line_color)
                         else:
-                            print(f"      ⚠️  Skipped '{gate.get('name')}': no dividers found")
+                            logger.debug("      ⚠️  Skipped '%s': no dividers found", gate.get('name'))
 
                     # Handle polygon/rectangle gates
                     else:
-                        xs = gate.get('xs', [])
-                        ys = gate.get('ys', [])
-                        if xs and ys and len(xs) == len(ys) and len(xs) >= 3:
+                        outline = _closed_gate_outline(gate)
+                        if outline is not None:
+                            xs, ys = outline
                             # Swap if dimensions are reversed
                             if gate.get('x_dim') == y_channel:
                                 xs, ys = ys, xs
 
-                            print(f"      DEBUG: Gate '{gate.get('name')}' coordinates:")
-                            print(f"             X: [{min(xs):.2f}, {max(xs):.2f}]")
-                            print(f"             Y: [{min(ys):.2f}, {max(ys):.2f}]")
-
-                            # Ensure polygon is closed
-                            if xs[0] != xs[-1] or ys[0] != ys[-1]:
-                                xs = list(xs) + [xs[0]]
-                                ys = list(ys) + [ys[0]]
-
-                            fill_color, line_color = gate_colors[gate_idx % len(gate_colors)]
+                            if logger.isEnabledFor(logging.DEBUG):
+                                # Both axes reduced together instead of Python min()/max() over the vertices
+                                bounds = np.array([xs, ys], dtype=np.float64)
+                                lo, hi = bounds.min(axis=1), bounds.max(axis=1)
+                                logger.debug("      DEBUG: Gate '%s' coordinates:", gate.get('name'))
+                                logger.debug("             X: [%.2f, %.2f]", lo[0], hi[0])
+                                logger.debug("             Y: [%.2f, %.2f]", lo[1], hi[1])
 
                             p.patch(xs, ys, fill_color=fill_color, fill_alpha=0.3, line_color=line_color,
                                    line_width=2.5, line_alpha=0.9)
-                            print(f"      ✓ Rendered '{gate.get('name')}' ({len(xs)} vertices, color: {fill_color})")
+                            logger.debug("      ✓ Rendered '%s' (%s vertices, color: %s)", gate.get('name'), len(xs), fill_color)
                         else:
-                            print(f"      ⚠️  Skipped '{gate.get('name')}': invalid coordinates")
+                            logger.debug("      ⚠️  Skipped '%s': invalid coordinates", gate.get('name'))
                 else:
-                    print(f"      ⚠️  Skipped '{gate.get('name')}': channel mismatch")
+                    logger.debug("      ⚠️  Skipped '%s': channel mismatch", gate.get('name'))
 
         # Add keyword display in top left if requested
         if show_keywords and keywords:
@@ -3052,7 +3553,142 @@ class FlowAnalyzer:
 
         return p
 
-    def generate_interactive_plots(self, selections, output_path):
+    def load_events_columnar(self, sample_ids, channels):
+        """
+        Load raw (ungated) events for the given channels into the in-memory column store.
+
+        Each channel is read once per sample with Sample.get_channel_events and kept as a
+        float32 array, so plotting the same sample and channel again (another plot
+        configuration, or a histogram and a scatter plot sharing an axis) reuses it
+        instead of re-reading every channel of the sample.
+
+        Args:
+            sample_ids (list): Sample IDs to load
+            channels (list): Channel labels (PnN names) to load
+
+        Returns:
+            dict: sample_id -> {channel label: np.ndarray of float32 events}
+        """
+        columns = {}
+        for sample_id in sample_ids:
+            store = self._event_columns.setdefault(sample_id, {})
+            missing = [channel for channel in channels if channel not in store]
+            if missing:
+                sample = self._get_sample(sample_id)
+                for channel in missing:
+                    events = sample.get_channel_events(sample.get_channel_index(channel), source='raw')
+                    store[channel] = np.asarray(events, dtype=np.float32)
+            columns[sample_id] = {channel: store[channel] for channel in channels}
+        return columns
+
+    def _load_raw_columns(self, sample, sample_id, parameters):
+        """
+        Return a DataFrame of only the channels matching ``parameters``, from the column store.
+
+        Each parameter is resolved once with _match_channel against the sample's PnN labels,
+        and the store is keyed by the resolved label. The columns keep the FCS parameter
+        order, so the plotting code's own _match_channel lookups on the frame pick the
+        same channels as they would on the full event matrix. Returns None if a parameter
+        matches no channel or the columns cannot be read, so the caller can fall back to
+        loading the full event matrix.
+        """
+        pnn_labels = tuple(sample.pnn_labels)
+        resolved = set()
+        for param in parameters:
+            label = _match_channel(pnn_labels, param)
+            if label is None:
+                return None
+            resolved.add(label)
+        labels = [label for label in pnn_labels if label in resolved]
+        try:
+            return pd.DataFrame(self.load_events_columnar([sample_id], labels)[sample_id])
+        except Exception:
+            return None
+
+    def _load_plot_events(self, sample_id, gate_name, gate_path, use_gate_directly=False, channels=None):
+        """
+        Load the raw events plotted for one sample.
+
+        By default this is the population *before* the selected gate (its parent), so the
+        gate boundary can be drawn over the events it was applied to. With
+        use_gate_directly, the selected gate's own events are returned instead.
+
+        Args:
+            sample_id (str): Sample ID
+            gate_name (str): Selected gate name, or "Ungated"
+            gate_path (tuple): Path of the selected gate
+            use_gate_directly (bool): Return the selected gate's events instead of its parent's
+            channels (list, optional): Plot parameters. When given, ungated events are read
+                from the column store for just these channels (see load_events_columnar).
+
+        Returns:
+            pd.DataFrame or None: Raw event data, or None if the sample has no events.
+
+        Raises:
+            Exception: If flowkit cannot provide the gate events.
+        """
+        if gate_name != "Ungated" and gate_path:
+            if use_gate_directly:
+                return self.workspace.get_gate_events(sample_id, gate_name, gate_path=gate_path, source="raw")
+            # First-level gates are drawn over the raw, ungated data. Gates whose parent
+            # sits at the root level also fall back to raw events for now.
+            parent_gate_path = gate_path[:-1]
+            if gate_path != ('root',) and parent_gate_path != ('root',):
+                parent_gate_name = parent_gate_path[-1]
+                return self.workspace.get_gate_events(sample_id, parent_gate_name, gate_path=parent_gate_path, source="raw")
+
+        sample = self._get_sample(sample_id)
+        if channels:
+            df = self._load_raw_columns(sample, sample_id, channels)
+            if df is not None:
+                return df
+        events = sample.get_events(source='raw')
+        if events is None or isinstance(events, pd.DataFrame):
+            return events
+        return pd.DataFrame(events, columns=sample.pnn_labels)
+
+    def _prefetch_plot_events(self, pool, sample_ids, gate_name, gate_path, use_gate_directly, channels, workers):
+        """
+        Load plot events for many samples in parallel worker processes.
+
+        Each worker opens its own copy of the workspace (from the workspace cache when
+        available), analyzes the samples it is given and sends back their events, so the
+        FCS data is read and gated on several cores at once. Bokeh figures are not built
+        here: they reference shared document state and are assembled in the main process.
+
+        Args:
+            pool (ProcessPoolExecutor): Worker pool from _start_event_workers
+            sample_ids (list): Sample IDs to load
+            gate_name (str): Selected gate name, or "Ungated"
+            gate_path (tuple): Path of the selected gate
+            use_gate_directly (bool): See _load_plot_events
+            channels (list): Plot parameters, see _load_plot_events
+            workers (int): Number of worker processes
+
+        Returns:
+            dict: sample_id -> DataFrame, None, or the Exception raised while loading it
+        """
+        from itertools import repeat
+
+        print(f"Loading events for {len(sample_ids)} samples with {workers} worker processes...")
+        results = pool.map(_load_events_in_worker, sample_ids, repeat(gate_name),
+                           repeat(gate_path), repeat(use_gate_directly), repeat(channels),
+                           chunksize=max(1, len(sample_ids) // (workers * 4)))
+        return dict(zip(sample_ids, results))
+
+    def _start_event_workers(self, workers):
+        """
+        Start the worker pool used by _prefetch_plot_events.
+
+        Each worker opens the workspace once (honouring use_cache), so one pool is shared
+        by every plot configuration of a generate_interactive_plots call.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_event_worker,
+                                   initargs=(self.wsp_path, self.fcs_dir, self._use_cache))
+
+    def generate_interactive_plots(self, selections, output_path, workers=1):
         """
         Generate plots for all samples based on user selections and save to HTML.
         
@@ -3070,6 +3706,8 @@ class FlowAnalyzer:
                 - 'plot_type': "histogram" or "scatter"
                 - 'parameters': list of channel keywords
             output_path (str): Path where HTML file will be saved (e.g., "plots.html")
+            workers (int, optional): Number of processes used to load and gate sample
+                events. Defaults to 1 (everything runs in this process).
             
         Output:
             Creates an HTML file with:
@@ -3114,26 +3752,36 @@ class FlowAnalyzer:
         all_sample_ids = []
         for group in selected_groups:
             try:
-                group_samples = self.workspace.get_sample_ids(group, loaded_only=True)
+                group_samples = self._group_sample_ids(group)
                 all_sample_ids.extend(group_samples)
             except Exception as e:
                 print(f"Warning: Could not get samples from group '{group}': {e}")
         
         # Remove duplicates while preserving order
-        seen = set()
-        sample_ids = [sid for sid in all_sample_ids if not (sid in seen or seen.add(sid))]
+        sample_ids = list(dict.fromkeys(all_sample_ids))
         
         if not sample_ids:
             print("No samples found in selected groups.")
             return
         
-        # Analyze samples if not already done
-        print("Analyzing samples...")
-        for group in selected_groups:
-            try:
-                self.workspace.analyze_samples(group_name=group)
-            except Exception as e:
-                print(f"Warning: Could not analyze group '{group}': {e}")
+        # Analyze samples if not already done (worker processes analyze their own samples)
+        if workers <= 1:
+            print("Analyzing samples...")
+            for group in selected_groups:
+                try:
+                    self.workspace.analyze_samples(group_name=group)
+                except Exception as e:
+                    print(f"Warning: Could not analyze group '{group}': {e}")
+        
+        # Parse well IDs for all samples in one pass, using the user-selected source
+        well_ids = self.parse_well_ids_batch(
+            sample_ids,
+            source=selections.get('well_id_source', 'auto'),
+            keyword_name=selections.get('well_id_keyword')
+        )
+        
+        # Worker pool for loading events, started on first use and shared by all plot configs
+        event_pool = None
         
         # Generate plots for each configuration
         tabs = []
@@ -3157,21 +3805,33 @@ class FlowAnalyzer:
                 print(f"Using keyword: '{selections.get('well_id_keyword')}'")
             print()
             
-            # Organize plots by well position (Row, Col)
-            plots_by_well = {}  # (row, col) -> plot
+            # Organize plots by well position: plate[row_index, col - 1] -> plot
+            plate = np.full((8, 12), None, dtype=object)
             successful_samples = []
             failed_samples = []
-            sample_info = {}  # (row, col) -> (sample_id, filename)
+            
+            # With several workers, load every sample's events up front in worker processes;
+            # the figures themselves are still built here, in order
+            prefetched = None
+            if workers > 1:
+                if event_pool is None:
+                    event_pool = self._start_event_workers(workers)
+                prefetched = self._prefetch_plot_events(
+                    event_pool, sample_ids, gate_name, gate_path,
+                    plot_config.get('use_gate_data_directly', False), parameters, workers)
             
             for i, sample_id in enumerate(sample_ids, 1):
                 try:
-                    sample = self.workspace.get_sample(sample_id)
                     print(f"  [{i}/{len(sample_ids)}] Processing {sample_id}...")
                     
-                    # Parse well ID using user-selected source
-                    well_id_source = selections.get('well_id_source', 'auto')
-                    well_id_keyword = selections.get('well_id_keyword')
-                    r, c, method_used = self.parse_well_id(sample, source=well_id_source, keyword_name=well_id_keyword, return_method=True, sample_id=sample_id)
+                    # Look up the well ID parsed up front for all samples
+                    well = well_ids.loc[sample_id]
+                    well_code = int(well['code'])
+                    if well_code < 0:
+                        r, c, method_used = None, None, None
+                    else:
+                        r, c = _decode_well(well_code)
+                        method_used = well['method']
                     
                     if not r or not c:
                         # If no well ID, use sample index as fallback
@@ -3187,74 +3847,23 @@ class FlowAnalyzer:
                     use_gate_directly = plot_config.get('use_gate_data_directly', False)
                     
                     if use_gate_directly:
-                        # Use the selected gate's data directly (for visualizing child gates on top)
                         print(f"    → Loading data from gate '{gate_name}'...", end=" ")
-                        if gate_name == "Ungated" or (not gate_path or gate_path == ()):
-                            # Ungated case - use raw events
-                            events = sample.get_events(source='raw')
-                            if events is not None:
-                                if not isinstance(events, pd.DataFrame):
-                                    df = pd.DataFrame(events, columns=sample.pnn_labels)
-                                else:
-                                    df = events
-                            else:
-                                df = None
-                        else:
-                            # Get the selected gate's events directly
-                            try:
-                                df = self.workspace.get_gate_events(sample_id, gate_name, gate_path=gate_path, source="raw")
-                            except Exception as e:
-                                print(f"\n    ⚠️  Could not load gate data: {e}")
-                                df = None
                     else:
                         # IMPORTANT: Load PRE-FILTERED data (parent gate), not the selected gate's data
                         # This allows us to visualize the gate boundary overlaid on ungated/parent populations
                         print(f"    → Loading PRE-FILTERED data (before '{gate_name}' gate)...", end=" ")
-                        if gate_name == "Ungated" or (not gate_path or gate_path == ()):
-                            # Ungated case - use raw events
-                            events = sample.get_events(source='raw')
-                            if events is not None:
-                                # Convert to DataFrame if needed
-                                if not isinstance(events, pd.DataFrame):
-                                    df = pd.DataFrame(events, columns=sample.pnn_labels)
-                                else:
-                                    df = events
-                            else:
-                                df = None
-                        elif gate_path == ('root',):
-                            # First-level gate (like Cells_withDebris) - parent is raw ungated data
-                            events = sample.get_events(source='raw')
-                            if events is not None:
-                                if not isinstance(events, pd.DataFrame):
-                                    df = pd.DataFrame(events, columns=sample.pnn_labels)
-                                else:
-                                    df = events
-                            else:
-                                df = None
+                    try:
+                        if prefetched is not None:
+                            df = prefetched.pop(sample_id)
+                            if isinstance(df, Exception):
+                                raise df
                         else:
-                            # Multi-level gate - get parent gate's data
-                            parent_gate_path = gate_path[:-1]
-                            # Get the parent gate name from the workspace
-                            try:
-                                # Navigate to parent gate
-                                if parent_gate_path == ('root',):
-                                    # Parent is a root-level gate, need to find it by name
-                                    # For now, use raw events as fallback
-                                    events = sample.get_events(source='raw')
-                                    if events is not None:
-                                        if not isinstance(events, pd.DataFrame):
-                                            df = pd.DataFrame(events, columns=sample.pnn_labels)
-                                        else:
-                                            df = events
-                                    else:
-                                        df = None
-                                else:
-                                    # Use the parent path to get parent gate events
-                                    parent_gate_name = parent_gate_path[-1]
-                                    df = self.workspace.get_gate_events(sample_id, parent_gate_name, gate_path=parent_gate_path, source="raw")
-                            except Exception as e:
-                                print(f"\n    ⚠️  Could not load parent gate data: {e}")
-                                df = None
+                            df = self._load_plot_events(sample_id, gate_name, gate_path, use_gate_directly,
+                                                        channels=parameters)
+                    except Exception as e:
+                        which = "gate" if use_gate_directly else "parent gate"
+                        print(f"\n    ⚠️  Could not load {which} data: {e}")
+                        df = None
                     
                     if df is None or df.empty:
                         print("SKIPPED")
@@ -3276,22 +3885,23 @@ class FlowAnalyzer:
                             event_count = len(df)  # Total number of events/cells
                             
                             if plot_type == "histogram":
-                                channel = [c for c in df.columns if parameters[0] in c][0]
-                                valid_data = df[channel].dropna()
-                                valid_data = valid_data[valid_data >= 10]  # Apply same filter as histogram
+                                channel = _match_channel(tuple(df.columns), parameters[0])
+                                data = df[channel].to_numpy()
+                                valid_data = data[data >= 10]  # Apply same filter as histogram (drops NaN too)
                                 if len(valid_data) > 0:
                                     stats_dict = {}
                                     if 'count' in selected_keywords_to_show:
                                         stats_dict['Events'] = f"{event_count:,}"
                                     if 'median' in selected_keywords_to_show:
-                                        stats_dict['Median'] = f"{valid_data.median():.1f}"
+                                        stats_dict['Median'] = f"{np.median(valid_data):.1f}"
                                     if 'mean' in selected_keywords_to_show:
-                                        stats_dict['Mean'] = f"{valid_data.mean():.1f}"
+                                        stats_dict['Mean'] = f"{valid_data.mean(dtype=np.float64):.1f}"
                                     keywords = stats_dict
                             else:  # scatter
                                 # For scatter, calculate statistics for both channels
-                                x_channel = [c for c in df.columns if parameters[0] in c][0]
-                                y_channel = [c for c in df.columns if parameters[1] in c][0]
+                                columns = tuple(df.columns)
+                                x_channel = _match_channel(columns, parameters[0])
+                                y_channel = _match_channel(columns, parameters[1])
                                 x_data = df[x_channel].dropna()
                                 y_data = df[y_channel].dropna()
                                 stats_dict = {}
@@ -3311,7 +3921,7 @@ class FlowAnalyzer:
                         else:
                             # Display keywords
                             try:
-                                all_keywords = self.workspace.get_keywords(sample_id)
+                                all_keywords = self._sample_keywords(sample_id)
                                 # Filter to only selected keywords if specified
                                 if selected_keywords_to_show:
                                     keywords = {k: v for k, v in all_keywords.items() if k in selected_keywords_to_show}
@@ -3323,42 +3933,44 @@ class FlowAnalyzer:
                     # Extract gates for visualization (for scatter plots)
                     # This can be different from the gate used for filtering
                     gates_for_viz = []
+                    viz_names = set()  # names in gates_for_viz, for the duplicate checks
                     if plot_type == "scatter":
                         try:
                             # Find matching channels for gate extraction
-                            x_channels = [c for c in df.columns if parameters[0] in c]
-                            y_channels = [c for c in df.columns if parameters[1] in c]
-                            if x_channels and y_channels:
-                                x_channel = x_channels[0]
-                                y_channel = y_channels[0]
+                            columns = tuple(df.columns)
+                            x_channel = _match_channel(columns, parameters[0])
+                            y_channel = _match_channel(columns, parameters[1])
+                            if x_channel is not None and y_channel is not None:
 
                                 # Get list of gates to visualize from plot config
                                 gates_to_viz_list = plot_config.get('gates_to_visualize', [])
+                                gates_to_viz_set = set(gates_to_viz_list)
                                 show_gates = plot_config.get('show_gates', False)
 
-                                print(f"    DEBUG: show_gates={show_gates}, gates_to_visualize={gates_to_viz_list}")
+                                logger.debug("    DEBUG: show_gates=%s, gates_to_visualize=%s", show_gates, gates_to_viz_list)
 
                                 if gates_to_viz_list:
                                     # Extract specific gates by name
-                                    print(f"    → Extracting gates for visualization: {', '.join(gates_to_viz_list)}")
+                                    logger.debug("    → Extracting gates for visualization: %s", ', '.join(gates_to_viz_list))
 
                                     # Check if the currently selected gate is in the visualization list
-                                    if gate_name in gates_to_viz_list and gate_name != "Ungated":
+                                    if gate_name in gates_to_viz_set and gate_name != "Ungated":
                                         # Extract the selected gate itself
-                                        print(f"      → Attempting to extract selected gate '{gate_name}'...")
-                                        print(f"         Gate path: {gate_path}")
-                                        print(f"         X channel: '{x_channel}' (type: {type(x_channel).__name__})")
-                                        print(f"         Y channel: '{y_channel}' (type: {type(y_channel).__name__})")
+                                        logger.debug("      → Attempting to extract selected gate '%s'...", gate_name)
+                                        logger.debug("         Gate path: %s", gate_path)
+                                        logger.debug("         X channel: '%s' (type: %s)", x_channel, type(x_channel).__name__)
+                                        logger.debug("         Y channel: '%s' (type: %s)", y_channel, type(y_channel).__name__)
                                         selected_gate_data = self._extract_selected_gate(sample_id, gate_name, gate_path, x_channel, y_channel)
                                         if selected_gate_data:
                                             gates_for_viz.append(selected_gate_data)
+                                            viz_names.add(selected_gate_data['name'])
                                             # Handle different gate types in logging
                                             if selected_gate_data.get('type') == 'quadrant':
                                                 num_dividers = len(selected_gate_data.get('dividers', []))
-                                                print(f"      ✓ Extracted '{gate_name}' (selected gate, quadrant with {num_dividers} divider(s))")
+                                                logger.debug("      ✓ Extracted '%s' (selected gate, quadrant with %s divider(s))", gate_name, num_dividers)
                                             else:
                                                 num_vertices = len(selected_gate_data.get('xs', []))
-                                                print(f"      ✓ Extracted '{gate_name}' (selected gate, {num_vertices} vertices)")
+                                                logger.debug("      ✓ Extracted '%s' (selected gate, %s vertices)", gate_name, num_vertices)
                                         else:
                                             print(f"      ⚠️  Failed to extract selected gate '{gate_name}' (returned None)")
                                             print(f"         Check warnings above for details")
@@ -3367,41 +3979,43 @@ class FlowAnalyzer:
                                     # Child gates have a path that starts with the selected gate's path + gate name
                                     if gate_path:
                                         child_gate_path_prefix = gate_path + (gate_name,)
-                                        print(f"      → Looking for child gates under '{gate_name}' (path prefix: {' → '.join(child_gate_path_prefix)})")
-                                        all_gate_ids = self.workspace.get_gate_ids(sample_id)
-                                        for child_gate_name, child_gate_path in all_gate_ids:
-                                            # Check if this is a child of the selected gate
-                                            # Child path should be longer and start with parent path + parent name
-                                            if (len(child_gate_path) > len(child_gate_path_prefix) and 
-                                                child_gate_path[:len(child_gate_path_prefix)] == child_gate_path_prefix):
+                                        logger.debug("      → Looking for child gates under '%s' (path prefix: %s)", gate_name, _format_gate_path(child_gate_path_prefix))
+                                        prefix_len = len(child_gate_path_prefix)
+                                        # Gates on other channel pairs cannot be extracted for this plot
+                                        on_axes = set(self._gates_on_axes(sample_id, x_channel, y_channel))
+                                        for child_gate_name, child_gate_path in self._gates_under_path(sample_id, child_gate_path_prefix):
+                                            # Child path should be longer than parent path + parent name
+                                            if len(child_gate_path) > prefix_len and (child_gate_name, child_gate_path) in on_axes:
                                                 # This is a child gate - try to extract it if it matches channels
-                                                if child_gate_name in gates_to_viz_list or 'all' in gates_to_viz_list:
+                                                if child_gate_name in gates_to_viz_set or 'all' in gates_to_viz_set:
                                                     child_gate_data = self._extract_selected_gate(sample_id, child_gate_name, child_gate_path, x_channel, y_channel)
                                                     if child_gate_data:
                                                         # Avoid duplicates
-                                                        if not any(g['name'] == child_gate_data['name'] for g in gates_for_viz):
+                                                        if child_gate_data['name'] not in viz_names:
                                                             gates_for_viz.append(child_gate_data)
+                                                            viz_names.add(child_gate_data['name'])
                                                             if child_gate_data.get('type') == 'quadrant':
                                                                 num_dividers = len(child_gate_data.get('dividers', []))
-                                                                print(f"      ✓ Extracted child gate '{child_gate_name}' (quadrant with {num_dividers} divider(s))")
+                                                                logger.debug("      ✓ Extracted child gate '%s' (quadrant with %s divider(s))", child_gate_name, num_dividers)
                                                             else:
                                                                 num_vertices = len(child_gate_data.get('xs', []))
-                                                                print(f"      ✓ Extracted child gate '{child_gate_name}' ({num_vertices} vertices)")
+                                                                logger.debug("      ✓ Extracted child gate '%s' (%s vertices)", child_gate_name, num_vertices)
 
                                     # Also extract any other gates from the workspace
                                     all_gates = self._extract_gate_polygons(sample_id, x_channel, y_channel)
                                     for gate_data in all_gates:
-                                        if gate_data['name'] in gates_to_viz_list:
+                                        if gate_data['name'] in gates_to_viz_set:
                                             # Avoid duplicates
-                                            if not any(g['name'] == gate_data['name'] for g in gates_for_viz):
+                                            if gate_data['name'] not in viz_names:
                                                 gates_for_viz.append(gate_data)
+                                                viz_names.add(gate_data['name'])
                                                 # Handle different gate types in logging
                                                 if gate_data.get('type') == 'quadrant':
                                                     num_dividers = len(gate_data.get('dividers', []))
-                                                    print(f"      ✓ Extracted '{gate_data['name']}' (quadrant with {num_dividers} divider(s))")
+                                                    logger.debug("      ✓ Extracted '%s' (quadrant with %s divider(s))", gate_data['name'], num_dividers)
                                                 else:
                                                     num_vertices = len(gate_data.get('xs', []))
-                                                    print(f"      ✓ Extracted '{gate_data['name']}' ({num_vertices} vertices)")
+                                                    logger.debug("      ✓ Extracted '%s' (%s vertices)", gate_data['name'], num_vertices)
 
                                     if not gates_for_viz:
                                         print(f"      ⚠️  Could not extract any of the requested gates")
@@ -3417,7 +4031,8 @@ class FlowAnalyzer:
                         scale = plot_config.get('scale', 'linear')
                         p = self._plot_histogram(df, parameters[0], well_id, gate_name,
                                                statistic=statistic, scale=scale,
-                                               show_keywords=show_keywords, keywords=keywords)
+                                               show_keywords=show_keywords, keywords=keywords,
+                                               kde_key=(sample_id, gate_name, gate_path, use_gate_directly))
                         # Shortened title - just well ID and gate name
                         p.title.text = f"{well_id} - {gate_name}"
                     elif plot_type == "scatter":
@@ -3451,9 +4066,9 @@ class FlowAnalyzer:
                         # Shortened title - just well ID and gate name
                         p.title.text = f"{well_id} - {gate_name}"
                     
-                    # Store plot by well position
-                    plots_by_well[(r, c)] = p
-                    sample_info[(r, c)] = (sample_id, sample.original_filename, well_id)
+                    # Store plot by well position (fallback positions have no plate well)
+                    if well_code >= 0 and c <= 12:
+                        plate[well_code >> 8, c - 1] = p
                     successful_samples.append(sample_id)
                     print("OK")
                     print(f"    ✓ Plot saved for well {well_id}")
@@ -3474,7 +4089,7 @@ class FlowAnalyzer:
             print(f"Successful plots: {len(successful_samples)}")
             print(f"Failed/Skipped: {len(failed_samples)}")
             
-            if not plots_by_well:
+            if not successful_samples:
                 print("\nERROR: No plots were generated successfully for this configuration.")
                 if failed_samples:
                     print("\nFailed samples:")
@@ -3499,14 +4114,13 @@ class FlowAnalyzer:
             
             # Create grid of plots organized by well
             plot_grid = []
-            for row in rows:
+            for row_idx, row in enumerate(rows):
                 row_plots = []
                 for col in cols:
-                    well_key = (row, col)
                     well_id = f"{row}{col:02d}"
-                    if well_key in plots_by_well:
-                        # Get plot (title already includes well ID and filename from generation step)
-                        p = plots_by_well[well_key]
+                    # Get plot (title already includes well ID and filename from generation step)
+                    p = plate[row_idx, col - 1]
+                    if p is not None:
                         
                         # Ensure title is clear and visible
                         p.title.text_font_size = "11pt"
@@ -3549,6 +4163,11 @@ class FlowAnalyzer:
             tabs.append(TabPanel(child=plot_layout, title=tab_title))
             tab_titles.append(tab_title)
         
+        # The figures hold their own copies of the plotted columns; release the event store
+        self._event_columns.clear()
+        if event_pool is not None:
+            event_pool.shutdown()
+        
         # Create tabs layout if multiple plots, otherwise just use single layout
         if len(tabs) > 1:
             layout = Tabs(tabs=tabs)
@@ -3628,7 +4247,7 @@ class FlowAnalyzer:
                 <h2 class="text-2xl font-bold text-gray-900 mb-4">Plot Configuration</h2>
                 <div class="space-y-3 mb-6">
                     {keyword_info}
-                    <p class="text-sm"><span class="font-semibold text-gray-700">Gate Path:</span> <span class="text-gray-900">{' → '.join(gate_path) if gate_path else 'root'}</span></p>
+                    <p class="text-sm"><span class="font-semibold text-gray-700">Gate Path:</span> <span class="text-gray-900">{_format_gate_path(gate_path)}</span></p>
                     <p class="text-sm"><span class="font-semibold text-gray-700">Gate Name:</span> <span class="text-gray-900">{gate_name}</span></p>
                     <p class="text-sm"><span class="font-semibold text-gray-700">Plot Type:</span> <span class="capitalize text-gray-900">{plot_type}</span></p>
                     <p class="text-sm"><span class="font-semibold text-gray-700">Parameters:</span> <span class="text-gray-900">{', '.join(parameters)}</span></p>
@@ -3639,7 +4258,7 @@ class FlowAnalyzer:
                     <p class="text-sm"><span class="font-semibold text-gray-700">Total Samples:</span> <span class="text-gray-900">{len(sample_ids)}</span></p>
                     <p class="text-sm"><span class="font-semibold text-gray-700">Successful:</span> <span class="text-green-600 font-semibold">{len(successful_samples)}</span> <span class="text-gray-500">samples</span></p>
                     <p class="text-sm"><span class="font-semibold text-gray-700">Failed:</span> <span class="text-red-600 font-semibold">{len(failed_samples)}</span> <span class="text-gray-500">samples</span></p>
-                    <p class="text-sm"><span class="font-semibold text-gray-700">Wells with Data:</span> <span class="text-blue-600 font-semibold">{len(plots_by_well)}</span> <span class="text-gray-500">wells</span></p>
+                    <p class="text-sm"><span class="font-semibold text-gray-700">Wells with Data:</span> <span class="text-blue-600 font-semibold">{np.count_nonzero(np.not_equal(plate, None))}</span> <span class="text-gray-500">wells</span></p>
                 </div>
             </div>
         </div>
@@ -3706,23 +4325,11 @@ class FlowAnalyzer:
                     if gate not in all_gates_to_viz:
                         all_gates_to_viz.append(gate)
 
-        # Define the same color palette used in scatter plot rendering
-        gate_colors = [
-            ("#6B8E23", "#556B2F"),  # Olive green
-            ("#4682B4", "#36648B"),  # Steel blue
-            ("#CD853F", "#8B5A2B"),  # Peru/tan
-            ("#9370DB", "#7B68EE"),  # Medium purple
-            ("#DC143C", "#B22222"),  # Crimson
-            ("#20B2AA", "#008B8B"),  # Light sea green
-            ("#FF8C00", "#CD6600"),  # Dark orange
-            ("#8B4789", "#68387E"),  # Dark orchid
-        ]
-
         # Build legend HTML
         legend_items_html = ""
         if all_gates_to_viz:
             for idx, gate_name in enumerate(all_gates_to_viz):
-                fill_color, line_color = gate_colors[idx % len(gate_colors)]
+                fill_color, line_color = _GATE_COLORS[idx % len(_GATE_COLORS)]
                 legend_items_html += f"""
                 <div class="flex items-center mr-6">
                     <div style="width: 20px; height: 20px; background-color: {fill_color}; border: 2px solid {line_color}; border-radius: 3px; margin-right: 8px;"></div>
@@ -3789,6 +4396,7 @@ def main():
         python analyze_flow.py --wsp workspace.wsp --fcs_dir ./fcs --inspect --sample sample1.fcs
     """
     args = parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
     
     if not os.path.exists(args.wsp):
         print(f"Error: Workspace file not found at {args.wsp}")
@@ -3813,11 +4421,13 @@ def main():
         inspect_gates(args.wsp, args.fcs_dir, args.sample)
     else:
         # Interactive plotting mode
-        analyzer = FlowAnalyzer(args.wsp, args.fcs_dir)
+        analyzer = FlowAnalyzer(args.wsp, args.fcs_dir, use_cache=not args.no_cache)
         
         # Prompts user for gate selection, plot type, and parameters
         # Then generates plots for all samples and saves to HTML
         selections = analyzer.interactive_plot_prompt()
+        # Keep the gate ids and keywords the prompt read for the next session
+        analyzer.update_workspace_cache()
         if selections:
             # Generate output filename based on input name + type + parameters + keyword filter
             base_name = os.path.splitext(os.path.basename(args.wsp))[0]
@@ -3856,7 +4466,7 @@ def main():
             else:
                 output_path = f"{base_name}_{plot_type}_{gate_name}_{params_str}{filter_str}.html"
             
-            analyzer.generate_interactive_plots(selections, output_path)
+            analyzer.generate_interactive_plots(selections, output_path, workers=args.workers)
         else:
             print("No selections made. Exiting.")
 
@@ -15,16 +15,52 @@ Author: flowViz Contributors
 License: MIT
 """
 
-import xml.etree.ElementTree as ET
+import logging
 import re
 
+try:
+    # lxml's C parser is considerably faster on large workspaces
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+
+def index_populations(workspace_file):
+    """
+    Parse a .wsp XML file once and index its Population elements by name.
+
+    Args:
+        workspace_file (str): Path to the .wsp workspace file
+
+    Returns:
+        dict: Population name -> list of Population elements, in document order
+    """
+    root = ET.parse(workspace_file).getroot()
+    populations = {}
+    for population in root.iter('Population'):
+        name = population.get('name')
+        if name is not None:
+            populations.setdefault(name, []).append(population)
+    return populations
+
+
+def _divider_between(negative_max, positive_min):
+    """Divider position from the negative side's max and positive side's min (either may be None)."""
+    if negative_max is not None and positive_min is not None:
+        # They should be equal or very close - take the average
+        return (negative_max + positive_min) / 2.0
+    return negative_max if negative_max is not None else positive_min
+
 
 def infer_quadrant_dividers_from_xml(workspace_file, sample_id, gate_path, x_channel, y_channel, quadrant_gates):
     """
     Parse the .wsp XML file to extract quadrant gate boundaries.
 
     Args:
-        workspace_file (str): Path to the .wsp workspace file
+        workspace_file (str or dict): Path to the .wsp workspace file, or the result of
+            index_populations() for it (avoids re-parsing the file on every call)
         sample_id (str): Sample ID
         gate_path (tuple): Path tuple for the quadrant gates
         x_channel (str): X-axis channel name
@@ -35,12 +71,14 @@ def infer_quadrant_dividers_from_xml(workspace_file, sample_id, gate_path, x_cha
         list: List of divider dicts with 'dimension', 'value', 'orientation' keys
         None: If extraction fails
     """
-    print(f"    DEBUG: Parsing .wsp XML file to extract quadrant gate boundaries...")
-    print(f"    DEBUG: Workspace file: {workspace_file}")
+    logger.debug("    DEBUG: Parsing .wsp XML file to extract quadrant gate boundaries...")
 
-    # Parse the XML
-    tree = ET.parse(workspace_file)
-    root = tree.getroot()
+    # Parse the XML (unless the caller passes an already parsed index)
+    if isinstance(workspace_file, dict):
+        populations = workspace_file
+    else:
+        logger.debug("    DEBUG: Workspace file: %s", workspace_file)
+        populations = index_populations(workspace_file)
 
     # Define XML namespaces
     ns = {
@@ -54,57 +92,53 @@ def infer_quadrant_dividers_from_xml(workspace_file, sample_id, gate_path, x_cha
 
     for q_num, q_info in quadrant_gates.items():
         gate_name = q_info['name']
-        print(f"    DEBUG: Looking for Q{q_num} ('{gate_name}') in XML...")
-
-        # Search for Population elements with matching names
-        for population in root.findall('.//Population[@name]'):
-            pop_name = population.get('name')
-
-            # Check if this population matches our gate name
-            if pop_name == gate_name:
-                print(f"    DEBUG: Found Population: {pop_name}")
-
-                # Find the RectangleGate within this Population
-                rect_gate = population.find('.//gating:RectangleGate', ns)
-                if rect_gate is not None:
-                    gate_id = rect_gate.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}id')
-                    print(f"    DEBUG: Found RectangleGate with id: {gate_id}")
-
-                    # Extract dimensions
-                    dimensions = rect_gate.findall('gating:dimension', ns)
-
-                    bounds = {}
-                    for dim in dimensions:
-                        dim_min = dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}min')
-                        dim_max = dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}max')
-
-                        # Get the dimension name
-                        fcs_dim = dim.find('data-type:fcs-dimension', ns)
-                        if fcs_dim is not None:
-                            dim_name = fcs_dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/datatypes}name')
-
-                            if dim_name:
-                                print(f"           Dimension: {dim_name}, min={dim_min}, max={dim_max}")
-
-                                if dim_name == x_channel:
-                                    bounds['x_min'] = float(dim_min) if dim_min else None
-                                    bounds['x_max'] = float(dim_max) if dim_max else None
-                                elif dim_name == y_channel:
-                                    bounds['y_min'] = float(dim_min) if dim_min else None
-                                    bounds['y_max'] = float(dim_max) if dim_max else None
-
-                    # Check if we got all boundaries (some might be None if unbounded)
-                    if any(v is not None for v in bounds.values()):
-                        gate_boundaries[q_num] = bounds
-                        print(f"           Got boundaries: {bounds}")
-                    break
+        logger.debug("    DEBUG: Looking for Q%s ('%s') in XML...", q_num, gate_name)
+
+        # Look up Population elements with matching names
+        for population in populations.get(gate_name, ()):
+            logger.debug("    DEBUG: Found Population: %s", population.get('name'))
+
+            # Find the RectangleGate within this Population
+            rect_gate = population.find('.//gating:RectangleGate', ns)
+            if rect_gate is not None:
+                gate_id = rect_gate.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}id')
+                logger.debug("    DEBUG: Found RectangleGate with id: %s", gate_id)
+
+                # Extract dimensions
+                dimensions = rect_gate.findall('gating:dimension', ns)
+
+                bounds = {}
+                for dim in dimensions:
+                    dim_min = dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}min')
+                    dim_max = dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/gating}max')
+
+                    # Get the dimension name
+                    fcs_dim = dim.find('data-type:fcs-dimension', ns)
+                    if fcs_dim is not None:
+                        dim_name = fcs_dim.get('{http://www.isac-net.org/std/Gating-ML/v2.0/datatypes}name')
+
+                        if dim_name:
+                            logger.debug("           Dimension: %s, min=%s, max=%s", dim_name, dim_min, dim_max)
+
+                            if dim_name == x_channel:
+                                bounds['x_min'] = float(dim_min) if dim_min else None
+                                bounds['x_max'] = float(dim_max) if dim_max else None
+                            elif dim_name == y_channel:
+                                bounds['y_min'] = float(dim_min) if dim_min else None
+                                bounds['y_max'] = float(dim_max) if dim_max else None
+
+                # Check if we got all boundaries (some might be None if unbounded)
+                if any(v is not None for v in bounds.values()):
+                    gate_boundaries[q_num] = bounds
+                    logger.debug("           Got boundaries: %s", bounds)
+                break
 
     if len(gate_boundaries) < 2:
-        print(f"    DEBUG: Could not extract enough gate boundaries from XML ({len(gate_boundaries)})")
+        logger.debug("    DEBUG: Could not extract enough gate boundaries from XML (%s)", len(gate_boundaries))
         return None
 
-    print(f"    DEBUG: Successfully extracted {len(gate_boundaries)} gate boundaries from XML")
-    print(f"    DEBUG: Raw boundaries (from XML): {gate_boundaries}")
+    logger.debug("    DEBUG: Successfully extracted %s gate boundaries from XML", len(gate_boundaries))
+    logger.debug("    DEBUG: Raw boundaries (from XML): %s", gate_boundaries)
 
     # These values are in RAW data space, not display space
     # We can use them directly for plotting on raw-scale axes
@@ -118,68 +152,54 @@ def infer_quadrant_dividers_from_xml(workspace_file, sample_id, gate_path, x_cha
 
     dividers = []
 
-    # X divider: boundary between Q1/Q4 (X-) and Q2/Q3 (X+)
-    # Should be at the max X of Q1/Q4 or min X of Q2/Q3
-    x_negative_max = []  # Q1, Q4
-    x_positive_min = []  # Q2, Q3
+    # X divider: boundary between Q1/Q4 (X-) and Q2/Q3 (X+),
+    # at the max X of Q1/Q4 or min X of Q2/Q3.
+    # Y divider: boundary between Q1/Q2 (Y+) and Q3/Q4 (Y-),
+    # at the max Y of Q3/Q4 or min Y of Q1/Q2.
+    # A single pass over the quadrants tracks all four extremes (None = no bound seen).
+    x_negative_max = y_negative_max = None  # Q1/Q4, Q3/Q4
+    x_positive_min = y_positive_min = None  # Q2/Q3, Q1/Q2
 
     for q_num, data in quadrant_data.items():
-        if q_num in [1, 4]:  # Negative X
-            if data.get('x_max') is not None:
-                x_negative_max.append(data['x_max'])
-        elif q_num in [2, 3]:  # Positive X
-            if data.get('x_min') is not None:
-                x_positive_min.append(data['x_min'])
+        if q_num == 1 or q_num == 4:  # Negative X
+            v = data.get('x_max')
+            if v is not None and (x_negative_max is None or v > x_negative_max):
+                x_negative_max = v
+        elif q_num == 2 or q_num == 3:  # Positive X
+            v = data.get('x_min')
+            if v is not None and (x_positive_min is None or v < x_positive_min):
+                x_positive_min = v
+        if q_num == 3 or q_num == 4:  # Negative Y
+            v = data.get('y_max')
+            if v is not None and (y_negative_max is None or v > y_negative_max):
+                y_negative_max = v
+        elif q_num == 1 or q_num == 2:  # Positive Y
+            v = data.get('y_min')
+            if v is not None and (y_positive_min is None or v < y_positive_min):
+                y_positive_min = v
 
     # For quadrant gates, the divider should be exactly at the boundary
     # Use the max of Q1/Q4 or min of Q2/Q3 (they should be the same)
-    if x_negative_max or x_positive_min:
-        if x_negative_max and x_positive_min:
-            # They should be equal or very close - take the average
-            x_divider = (max(x_negative_max) + min(x_positive_min)) / 2.0
-        elif x_negative_max:
-            x_divider = max(x_negative_max)
-        else:
-            x_divider = min(x_positive_min)
-
+    x_divider = _divider_between(x_negative_max, x_positive_min)
+    if x_divider is not None:
         dividers.append({
             'dimension': x_channel,
             'value': float(x_divider),
             'orientation': 'vertical'
         })
-        print(f"    DEBUG: Inferred X divider at {x_divider:.2f} for {x_channel}")
-
-    # Y divider: boundary between Q1/Q2 (Y+) and Q3/Q4 (Y-)
-    # Should be at the max Y of Q3/Q4 or min Y of Q1/Q2
-    y_negative_max = []  # Q3, Q4
-    y_positive_min = []  # Q1, Q2
-
-    for q_num, data in quadrant_data.items():
-        if q_num in [3, 4]:  # Negative Y
-            if data.get('y_max') is not None:
-                y_negative_max.append(data['y_max'])
-        elif q_num in [1, 2]:  # Positive Y
-            if data.get('y_min') is not None:
-                y_positive_min.append(data['y_min'])
-
-    if y_negative_max or y_positive_min:
-        if y_negative_max and y_positive_min:
-            # They should be equal or very close - take the average
-            y_divider = (max(y_negative_max) + min(y_positive_min)) / 2.0
-        elif y_negative_max:
-            y_divider = max(y_negative_max)
-        else:
-            y_divider = min(y_positive_min)
+        logger.debug("    DEBUG: Inferred X divider at %.2f for %s", x_divider, x_channel)
 
+    y_divider = _divider_between(y_negative_max, y_positive_min)
+    if y_divider is not None:
         dividers.append({
             'dimension': y_channel,
             'value': float(y_divider),
             'orientation': 'horizontal'
         })
-        print(f"    DEBUG: Inferred Y divider at {y_divider:.2f} for {y_channel}")
+        logger.debug("    DEBUG: Inferred Y divider at %.2f for %s", y_divider, y_channel)
 
     if len(dividers) > 0:
-        print(f"    DEBUG: Final dividers (raw space): {dividers}")
+        logger.debug("    DEBUG: Final dividers (raw space): %s", dividers)
         return dividers
     else:
         return None